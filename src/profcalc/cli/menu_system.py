@@ -69,7 +69,8 @@ def shoreline_analysis_menu() -> None:
     - Summarize & Review Results
     - Export Results
 
-    Note: All analysis steps are currently stub implementations.
+    Steps 1-4 run together: positions and the H-1/H-2/H-3 tables of a
+    project are extracted, calculated and exported in one run.
     """
     while True:
         print("\n--- Shoreline Analysis (Annual Monitoring) ---")
@@ -79,16 +80,12 @@ def shoreline_analysis_menu() -> None:
         print("4. Export Results")
         print("5. Back to Annual Monitoring Menu")
         choice = input("Select an option: ").strip()
-        if choice == "1":
-            print(
-                "[STUB] Extract & Prepare Shoreline Data - Not yet implemented."
+        if choice in ("1", "2", "3", "4"):
+            from profcalc.tools.monitoring.shoreline_analysis import (
+                execute_from_menu,
             )
-        elif choice == "2":
-            print("[STUB] Calculate Shoreline Metrics - Not yet implemented.")
-        elif choice == "3":
-            print("[STUB] Summarize & Review Results - Not yet implemented.")
-        elif choice == "4":
-            print("[STUB] Export Results - Not yet implemented.")
+
+            execute_from_menu()
         elif choice == "5":
             break
         else:
@@ -400,7 +397,9 @@ def survey_vs_survey_menu() -> None:
     - Review & Export Results
     - Run Full Workflow
 
-    Note: All options are currently stub implementations.
+    Note: Computing volumes and the full workflow run the survey change
+    matrix (consecutive and baseline comparisons for every line); the
+    other options are currently stub implementations.
     """
     while True:
         print("\n--- Survey vs. Survey (Multi-Year) Analysis ---")
@@ -412,7 +411,13 @@ def survey_vs_survey_menu() -> None:
         print("6. Run Full Workflow")
         print("7. Back to Profile Analysis Menu")
         choice = input("Select an option: ").strip()
-        if choice == "7":
+        if choice in ("4", "6"):
+            from profcalc.tools.monitoring.survey_change import (
+                execute_from_menu,
+            )
+
+            execute_from_menu()
+        elif choice == "7":
             break
         else:
             print(f"[STUB] Option {choice} not yet implemented.")
@@ -22,6 +22,10 @@ except ImportError:
     SKLEARN_AVAILABLE = False
 
 from profcalc.common.bmap_io import Profile
+from profcalc.common.coordinate_transforms import (
+    batch_estimate_profile_baselines,
+)
+from profcalc.common.grid_clustering import grid_cluster_labels
 
 
 def execute_from_cli(args: list[str]) -> None:
@@ -43,21 +47,21 @@ def execute_from_cli(args: list[str]) -> None:
     )
     parser.add_argument(
         "--method",
-        choices=["spatial", "distance"],
+        choices=["spatial", "grid", "distance"],
         default="spatial",
-        help="Clustering method: spatial (DBSCAN) or distance-based (default: spatial)",
+        help="Clustering method: spatial (DBSCAN), grid (built-in grid hash) or distance-based (default: spatial)",
     )
     parser.add_argument(
         "--eps",
         type=float,
         default=50.0,
-        help="DBSCAN epsilon parameter for spatial clustering (feet, default: 50.0)",
+        help="Linking distance: DBSCAN epsilon or grid cell size (feet, default: 50.0)",
     )
     parser.add_argument(
         "--min-samples",
         type=int,
         default=5,
-        help="DBSCAN minimum samples parameter (default: 5)",
+        help="Minimum points per cluster: DBSCAN minimum samples or smallest grid cluster (default: 5)",
     )
     parser.add_argument(
         "--prefix",
@@ -78,6 +82,9 @@ def execute_from_cli(args: list[str]) -> None:
     if parsed_args.method == "spatial":
         print(f"   DBSCAN eps: {parsed_args.eps} ft")
         print(f"   DBSCAN min_samples: {parsed_args.min_samples}")
+    elif parsed_args.method == "grid":
+        print(f"   Grid cell size: {parsed_args.eps} ft")
+        print(f"   Minimum cluster size: {parsed_args.min_samples}")
 
     # Read input file
     points_df = read_points_file(parsed_args.input_file)
@@ -117,13 +124,21 @@ def execute_from_menu() -> None:
     output_file = input("Enter output file path: ").strip()
 
     method_choice = (
-        input("\nClustering method (spatial/distance) [spatial]: ")
+        input("\nClustering method (spatial/grid/distance) [spatial]: ")
         .strip()
         .lower()
     )
-    method = "spatial" if method_choice != "distance" else "distance"
+    method = (
+        method_choice if method_choice in ("grid", "distance") else "spatial"
+    )
 
-    if method == "spatial":
+    if method == "grid":
+        eps_input = input("Grid cell size (feet) [50.0]: ").strip()
+        eps = float(eps_input) if eps_input else 50.0
+
+        min_samples_input = input("Minimum points per cluster [5]: ").strip()
+        min_samples = int(min_samples_input) if min_samples_input else 5
+    elif method == "spatial":
         eps_input = input(
             "DBSCAN epsilon (spatial distance in feet) [50.0]: "
         ).strip()
@@ -253,13 +268,16 @@ def assign_profiles_by_clustering(
     Returns:
         List of Profile objects with assigned names
     """
-    if method == "spatial":
-        if not SKLEARN_AVAILABLE:
-            print(
-                "❌ Error: sklearn required for spatial clustering. Install with: pip install scikit-learn"
-            )
-            raise ImportError("sklearn not available")
+    if method == "spatial" and not SKLEARN_AVAILABLE:
+        print(
+            "⚠️  sklearn not installed; using built-in grid clustering instead"
+        )
+        method = "grid"
 
+    x_coords = points_df["x"].to_numpy()
+    y_coords = points_df["y"].to_numpy()
+
+    if method == "spatial":
         # Use DBSCAN for spatial clustering
         coords = points_df[["x", "y"]].values
         scaler = StandardScaler()
@@ -275,46 +293,62 @@ def assign_profiles_by_clustering(
                 f"   DBSCAN found {n_clusters} clusters, {n_noise} noise points"
             )
 
+    elif method == "grid":
+        # Merge touching cells of a uniform grid (no sklearn needed)
+        clusters = grid_cluster_labels(
+            x_coords, y_coords, eps, min_samples=min_samples
+        )
+
+        if verbose:
+            n_clusters = int(clusters.max()) + 1
+            n_noise = int(np.count_nonzero(clusters == -1))
+            print(
+                f"   Grid clustering found {n_clusters} clusters, {n_noise} noise points"
+            )
+
     else:
         # Simple distance-based clustering (group by Y coordinate ranges)
-        y_coords = points_df["y"].values
         y_sorted = np.sort(np.array(y_coords))  # Convert to numpy array first
         y_diffs = np.diff(y_sorted)
 
-        # Find gaps larger than eps
+        # Find gaps larger than eps; each point's cluster is the number of
+        # gaps below it
         gap_indices = np.where(y_diffs > eps)[0] + 1
-        cluster_bounds = np.concatenate([[0], gap_indices, [len(y_sorted)]])
-
-        clusters = np.zeros(len(points_df), dtype=int)
-        for i, (start, end) in enumerate(
-            zip(cluster_bounds[:-1], cluster_bounds[1:])
-        ):
-            # Use end-1 to avoid index out of bounds, since end can equal len(y_sorted)
-            upper_bound = (
-                y_sorted[end - 1]
-                if end < len(y_sorted)
-                else y_sorted[-1] + eps
-            )
-            mask = (y_coords >= y_sorted[start]) & (y_coords <= upper_bound)
-            clusters[mask] = i
+        clusters = np.searchsorted(
+            y_sorted[gap_indices], y_coords, side="right"
+        )
 
         if verbose:
-            n_clusters = len(set(clusters))
+            n_clusters = len(gap_indices) + 1 if len(y_sorted) else 0
             print(f"   Distance-based clustering found {n_clusters} profiles")
 
+    # Group point indices by cluster (original order within each cluster)
+    clusters = np.asarray(clusters)
+    order = np.argsort(clusters, kind="stable")
+    unique_clusters, starts = np.unique(clusters[order], return_index=True)
+    groups = np.split(order, starts[1:])
+    if len(unique_clusters) and unique_clusters[0] == -1:  # Noise points
+        unique_clusters, groups = unique_clusters[1:], groups[1:]
+
+    # Estimate every cluster's transect direction in one batch
+    if len(unique_clusters):
+        member = np.concatenate(groups)
+        origin_x, origin_y, azimuth = batch_estimate_profile_baselines(
+            x_coords[member],
+            y_coords[member],
+            np.repeat(np.arange(len(groups)), [len(g) for g in groups]),
+            len(groups),
+        )
+
     # Create profiles from clusters
     profiles = []
-    unique_clusters = sorted(set(clusters))
-
-    for cluster_id in unique_clusters:
-        if cluster_id == -1:  # Noise points
-            continue
-
-        mask = clusters == cluster_id
-        cluster_points = points_df[mask]
+    x_values = points_df["x"].values
+    y_values = points_df["y"].values
+    z_values = points_df["z"].values
 
+    for i, (cluster_id, group) in enumerate(zip(unique_clusters, groups)):
         # Sort by x coordinate
-        cluster_points = cluster_points.sort_values("x")
+        group = group[np.argsort(x_values[group], kind="quicksort")]
 
         profile_name = f"{prefix}_{cluster_id + 1:03d}"
 
@@ -323,15 +357,19 @@ def assign_profiles_by_clustering(
             name=profile_name,
             date=None,
             description=f"Auto-assigned profile {cluster_id + 1}",
-            x=cluster_points["x"].values,
-            z=cluster_points["z"].values,
-            metadata={"y": cluster_points["y"].values},
+            x=x_values[group],
+            z=z_values[group],
+            metadata={
+                "y": y_values[group],
+                "profile_origin": {"x": origin_x[i], "y": origin_y[i]},
+                "profile_azimuth": azimuth[i],
+            },
         )
 
         profiles.append(profile)
 
         if verbose:
-            print(f"   {profile_name}: {len(cluster_points)} points")
+            print(f"   {profile_name}: {len(group)} points")
 
     return profiles
 
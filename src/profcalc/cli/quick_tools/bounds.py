@@ -7,11 +7,11 @@ Quick command-line tool to extract common X bounds from BMAP free format files.
 import argparse
 import glob
 import sys
-from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
-from profcalc.common.bmap_io import read_bmap_freeformat
+from profcalc.common.bmap_io import iter_bmap_profiles
+from profcalc.common.profile_collection import ProfileCollection
 from profcalc.core.profile_stats import calculate_common_ranges
 
 
@@ -22,20 +22,15 @@ def _profiles_to_dict(
     `calculate_common_ranges`.
 
     Args:
-        profiles: An iterable of profile objects returned by
-            ``read_bmap_freeformat``. Each object must expose ``x`` and
+        profiles: An iterable of profile objects, e.g. the generator from
+            ``iter_bmap_profiles``. Each object must expose ``x`` and
             ``z`` sequence attributes (coordinates) and a string ``name``.
 
     Returns:
         Mapping from profile name to list of surveys. Each survey is a list
         of ``(x, z)`` tuples (floats).
     """
-    result = defaultdict(list)
-    for profile in profiles:
-        # Convert numpy arrays to list of tuples
-        points = [(float(x), float(z)) for x, z in zip(profile.x, profile.z)]
-        result[profile.name].append(points)
-    return dict(result)
+    return ProfileCollection.from_profiles(profiles).to_points_dict()
 
 
 def execute_from_cli(args: List[str]) -> None:
@@ -98,8 +93,7 @@ def execute_from_cli(args: List[str]) -> None:
 
     for file_path in all_files:
         try:
-            profiles = read_bmap_freeformat(file_path)
-            profile_dict = _profiles_to_dict(profiles)
+            profile_dict = _profiles_to_dict(iter_bmap_profiles(file_path))
             # Merge profiles (combine surveys from different files)
             for profile_name, surveys in profile_dict.items():
                 if profile_name not in all_profiles:
@@ -1,4 +1,7 @@
 import argparse
+import csv
+import io
+import itertools
 import math
 from pathlib import Path
 
@@ -11,6 +14,7 @@ from profcalc.common.bmap_io import (
     write_bmap_profiles,
 )
 from profcalc.common.csv_io import (
+    XYZ_CHUNK_SIZE,
     read_csv_profiles,
     read_xyz_profiles,
     write_csv_profiles,
@@ -652,7 +656,9 @@ def _calculate_real_world_coordinates(
 
 
 def _read_xyz_format(
-    file_path: str, column_order: dict[str, int] | None = None
+    file_path: str,
+    column_order: dict[str, int] | None = None,
+    chunk_lines: int = XYZ_CHUNK_SIZE,
 ) -> list:
     """
     Read XYZ format (X, Y, Z coordinates with optional extra columns).
@@ -666,10 +672,15 @@ def _read_xyz_format(
 
     Extra columns beyond X, Y, Z are preserved in metadata['extra_columns'].
 
+    The file is streamed in blocks of ``chunk_lines`` lines. Runs of data
+    lines are parsed in bulk and kept as arrays per profile, so memory is
+    bounded by one block plus the output profiles.
+
     Args:
         file_path: Path to XYZ file
         column_order: Optional column order mapping (default: {'x': 0, 'y': 1, 'z': 2})
                      Example: {'x': 1, 'y': 0, 'z': 2} for Y X Z order
+        chunk_lines: Number of lines read per block
 
     Returns:
         List of Profile objects
@@ -687,127 +698,266 @@ def _read_xyz_format(
 
     profiles = []
     current_name = "Unknown"
-    current_points: list[tuple] = []
+    current_blocks: list[tuple] = []
     extra_column_names: list[str] = []
     line_number = 0
     column_count_validated = False
 
-    with open(file_path, "r") as f:
-        for line in f:
-            line_number += 1
-            line = line.strip()
-            if not line:
-                continue
+    def flush(pending: list[tuple[int, str]]) -> None:
+        """Parse a run of data lines and add them to the current profile."""
+        nonlocal column_count_validated
+        if not pending:
+            return
+        block = _parse_xyz_block(
+            [line for _, line in pending], column_order, min_required_cols
+        )
+        if block is not None:
+            column_count_validated = True
+        else:
+            block, column_count_validated = _parse_xyz_lines(
+                pending,
+                file_path,
+                column_order,
+                min_required_cols,
+                column_count_validated,
+            )
+        if len(block[0]):
+            current_blocks.append(block)
+
+    def finish_profile() -> None:
+        if current_blocks:
+            profiles.append(
+                _create_profile_from_xyz_points(
+                    current_name, current_blocks, extra_column_names
+                )
+            )
+            current_blocks.clear()
 
-            # Check for profile name header
-            if line.startswith(">") or line.startswith("#"):
-                # Save previous profile if exists
-                if current_points:
-                    profile = _create_profile_from_xyz_points(
-                        current_name, current_points, extra_column_names
-                    )
-                    profiles.append(profile)
-                    current_points = []
-
-                # Extract profile name
-                name_text = line[1:].strip() or "Unknown"
-                # Strip common prefixes like "Profile:" or "Profile "
-                if name_text.lower().startswith("profile:"):
-                    name_text = name_text[8:].strip()
-                elif name_text.lower().startswith("profile "):
-                    name_text = name_text[8:].strip()
-                current_name = name_text or "Unknown"
-                continue
+    with open(file_path, "r") as f:
+        for lines in iter(lambda: list(itertools.islice(f, chunk_lines)), []):
+            pending: list[tuple[int, str]] = []
+            for line in lines:
+                line_number += 1
+                line = line.strip()
+                if not line:
+                    continue
 
-            # Parse coordinate line
-            try:
-                parts = line.replace(",", " ").split()
-
-                # Validate column count on first data line
-                if not column_count_validated:
-                    if len(parts) < min_required_cols:
-                        raise ValueError(
-                            f"❌ Column count validation failed\n"
-                            f"   File: {file_path}\n"
-                            f"   Line {line_number}: Only {len(parts)} column(s) found, "
-                            f"but column order requires {min_required_cols}\n"
-                            f"   Column order: X=column {column_order['x']}, "
-                            f"Y=column {column_order['y']}, Z=column {column_order['z']}\n"
-                            f"   Line content: {line}\n\n"
-                            f"   Suggestions:\n"
-                            f"   • If file has standard X Y Z order, don't use --columns flag\n"
-                            f"   • If file has only 2 columns (X Z), ensure column order doesn't exceed index 1\n"
-                            f"   • Check that column indices in --columns match your file structure"
-                        )
-                    column_count_validated = True
-
-                # Check column count for this specific line (in case it varies)
-                if len(parts) < min_required_cols:
-                    print(
-                        f"⚠️  Warning: Line {line_number} has only {len(parts)} column(s), "
-                        f"skipping (need {min_required_cols})"
-                    )
+                # Check for profile name header
+                if line.startswith(">") or line.startswith("#"):
+                    # Save previous profile if exists
+                    flush(pending)
+                    pending = []
+                    finish_profile()
+
+                    # Extract profile name
+                    name_text = line[1:].strip() or "Unknown"
+                    # Strip common prefixes like "Profile:" or "Profile "
+                    if name_text.lower().startswith("profile:"):
+                        name_text = name_text[8:].strip()
+                    elif name_text.lower().startswith("profile "):
+                        name_text = name_text[8:].strip()
+                    current_name = name_text or "Unknown"
                     continue
 
-                # Use column order to extract X, Y, Z from correct positions
-                x = float(parts[column_order["x"]])
-                y = float(parts[column_order["y"]])
-                z = float(parts[column_order["z"]])
-
-                # Remaining columns are extra fields (after the 3 coordinate columns)
-                extra_values: list[float | str] = []
-                if len(parts) > 3:
-                    for val in parts[3:]:
-                        try:
-                            extra_values.append(float(val))
-                        except ValueError:
-                            # Non-numeric extra field (e.g., sediment_type)
-                            extra_values.append(val)
-
-                current_points.append((x, y, z, extra_values))
-
-            except (ValueError, IndexError) as e:
-                # Skip invalid lines but don't re-raise ValueError from column validation
-                if "Column count validation failed" in str(e):
-                    raise
-                continue
+                pending.append((line_number, line))
+            flush(pending)
 
     # Save last profile
-    if current_points:
-        profile = _create_profile_from_xyz_points(
-            current_name, current_points, extra_column_names
-        )
-        profiles.append(profile)
+    finish_profile()
 
     return profiles
 
 
+def _parse_xyz_block(
+    lines: list[str], column_order: dict[str, int], min_required_cols: int
+) -> tuple | None:
+    """
+    Parse a run of XYZ data lines in bulk.
+
+    Returns:
+        (x, y, z, extras) where extras is a list of per-point extra values
+        or None when there are no extra columns; None if the run is not a
+        uniform numeric table (the caller then parses line by line)
+    """
+    text = "\n".join(lines).replace(",", " ")
+    if not text.isascii() or any(
+        c in text for c in "\x0b\x0c\x1c\x1d\x1e\x1f"
+    ):
+        # str.split() separators that the C tokenizer does not split on
+        return None
+    # Count whitespace-separated tokens without materializing them
+    chars = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    is_space = np.isin(chars, np.frombuffer(b" \t\n\r", dtype=np.uint8))
+    n_tokens = int(np.count_nonzero(~is_space[1:] & is_space[:-1]))
+    n_tokens += int(len(chars) > 0 and not is_space[0])
+    if n_tokens % len(lines):
+        return None
+    n_cols = n_tokens // len(lines)
+    if n_cols < min_required_cols:
+        return None
+
+    coord_cols = sorted(set(column_order.values()))
+
+    def read(dtype: dict) -> pd.DataFrame:
+        return pd.read_csv(
+            io.StringIO(text),
+            sep=r"\s+",
+            header=None,
+            dtype=dtype,
+            engine="c",
+            float_precision="round_trip",
+            quoting=csv.QUOTE_NONE,
+            na_filter=False,
+        )
+
+    try:
+        try:
+            df = read({i: np.float64 for i in range(n_cols)})
+        except ValueError:
+            # Non-numeric extra fields (e.g., sediment_type)
+            dtype: dict = {i: str for i in range(n_cols)}
+            dtype.update({i: np.float64 for i in coord_cols})
+            df = read(dtype)
+    except (ValueError, pd.errors.ParserError):
+        return None
+    if df.shape != (len(lines), n_cols):
+        return None
+
+    x = df[column_order["x"]].to_numpy()
+    y = df[column_order["y"]].to_numpy()
+    z = df[column_order["z"]].to_numpy()
+
+    # Remaining columns are extra fields (after the 3 coordinate columns)
+    extras = None
+    if n_cols > 3:
+        extra_columns = []
+        for i in range(3, n_cols):
+            if df[i].dtype == np.float64:
+                extra_columns.append(df[i].tolist())
+            else:
+                extra_columns.append(
+                    [_xyz_extra_value(val) for val in df[i].tolist()]
+                )
+        extras = [list(values) for values in zip(*extra_columns)]
+    return x, y, z, extras
+
+
+def _parse_xyz_lines(
+    pending: list[tuple[int, str]],
+    file_path: str,
+    column_order: dict[str, int],
+    min_required_cols: int,
+    column_count_validated: bool,
+) -> tuple[tuple, bool]:
+    """
+    Parse XYZ data lines one at a time, skipping invalid lines.
+
+    Returns:
+        ((x, y, z, extras), column_count_validated)
+
+    Raises:
+        ValueError: If the first data line of the file has too few columns
+    """
+    xs: list[float] = []
+    ys: list[float] = []
+    zs: list[float] = []
+    extras: list[list[float | str]] = []
+
+    for line_number, line in pending:
+        parts = line.replace(",", " ").split()
+
+        # Validate column count on first data line
+        if not column_count_validated:
+            if len(parts) < min_required_cols:
+                raise ValueError(
+                    f"❌ Column count validation failed\n"
+                    f"   File: {file_path}\n"
+                    f"   Line {line_number}: Only {len(parts)} column(s) found, "
+                    f"but column order requires {min_required_cols}\n"
+                    f"   Column order: X=column {column_order['x']}, "
+                    f"Y=column {column_order['y']}, Z=column {column_order['z']}\n"
+                    f"   Line content: {line}\n\n"
+                    f"   Suggestions:\n"
+                    f"   • If file has standard X Y Z order, don't use --columns flag\n"
+                    f"   • If file has only 2 columns (X Z), ensure column order doesn't exceed index 1\n"
+                    f"   • Check that column indices in --columns match your file structure"
+                )
+            column_count_validated = True
+
+        # Check column count for this specific line (in case it varies)
+        if len(parts) < min_required_cols:
+            print(
+                f"⚠️  Warning: Line {line_number} has only {len(parts)} column(s), "
+                f"skipping (need {min_required_cols})"
+            )
+            continue
+
+        # Use column order to extract X, Y, Z from correct positions
+        try:
+            x = float(parts[column_order["x"]])
+            y = float(parts[column_order["y"]])
+            z = float(parts[column_order["z"]])
+        except (ValueError, IndexError):
+            # Skip invalid lines
+            continue
+
+        xs.append(x)
+        ys.append(y)
+        zs.append(z)
+        # Remaining columns are extra fields (after the 3 coordinate columns)
+        extras.append([_xyz_extra_value(val) for val in parts[3:]])
+
+    block = (
+        np.array(xs, dtype=float),
+        np.array(ys, dtype=float),
+        np.array(zs, dtype=float),
+        extras if any(extras) else None,
+    )
+    return block, column_count_validated
+
+
+def _xyz_extra_value(val: str) -> float | str:
+    """Convert an extra XYZ field to float, keeping non-numeric text."""
+    try:
+        return float(val)
+    except ValueError:
+        # Non-numeric extra field (e.g., sediment_type)
+        return val
+
+
 def _create_profile_from_xyz_points(
     name: str,
-    points: list[tuple],
+    blocks: list[tuple],
     column_names: list[str] | None = None,
 ) -> object:
     """
-    Create a Profile object from XYZ point data.
+    Create a Profile object from blocks of XYZ point data.
 
     Args:
         name: Profile name
-        points: List of (x, y, z, extra_values) tuples
+        blocks: List of (x, y, z, extras) blocks in file order; extras is a
+            list of per-point extra values or None if the block has none
         column_names: Names of extra columns (if known)
 
     Returns:
         Profile object with metadata containing Y coordinates and extra columns
     """
 
-    x_coords = np.array([p[0] for p in points])
-    y_coords = np.array([p[1] for p in points])
-    z_coords = np.array([p[2] for p in points])
+    x_coords = np.concatenate([block[0] for block in blocks])
+    y_coords = np.concatenate([block[1] for block in blocks])
+    z_coords = np.concatenate([block[2] for block in blocks])
 
     metadata: dict = {"y": y_coords}
 
-    # Extract extra columns if present
-    if points and len(points[0]) > 3 and points[0][3]:
-        extra_data = [p[3] for p in points]
+    # Extract extra columns if the first point has any
+    first_extras = blocks[0][3]
+    if first_extras and first_extras[0]:
+        extra_data: list[list[float | str]] = []
+        for block in blocks:
+            if block[3] is None:
+                extra_data.extend([] for _ in range(len(block[0])))
+            else:
+                extra_data.extend(block[3])
         num_extra_cols = len(extra_data[0])
 
         # Generate column names if not provided
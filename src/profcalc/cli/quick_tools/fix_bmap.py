@@ -13,9 +13,15 @@ Supports multiple input formats:
 import argparse
 import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, Iterable, Tuple
 
-from profcalc.common.file_parser import ParsedFile, parse_file
+from profcalc.common.bmap_io import BMAP_WRITE_BUFFER_SIZE, write_bmap_block
+from profcalc.common.file_parser import (
+    BMAPColumns,
+    CSVColumns,
+    ParsedFile,
+    parse_file,
+)
 
 
 def fix_bmap_point_counts(
@@ -40,7 +46,9 @@ def fix_bmap_point_counts(
 
     # Parse file using centralized parser with format detection
     try:
-        parsed = parse_file(input_path, skip_confirmation=skip_confirmation)
+        parsed = parse_file(
+            input_path, skip_confirmation=skip_confirmation, columnar=True
+        )
     except Exception as e:
         if verbose:
             print(f"\n❌ Error parsing file: {e}")
@@ -90,33 +98,41 @@ def _write_corrected_file(parsed: ParsedFile, output_path: Path) -> None:
 
 def _write_bmap_format(parsed: ParsedFile, output_path: Path) -> None:
     """Write corrected BMAP free format file."""
-    lines = []
-
-    for profile in parsed.profiles:
-        # Write profile header
-        header = profile.get("raw_header", "")
-        if not header:
-            # Reconstruct header from components
-            parts = [profile["profile_id"]]
-            if profile.get("date"):
-                parts.append(profile["date"])
-            if profile.get("purpose"):
-                parts.append(profile["purpose"])
-            header = " ".join(parts)
-
-        lines.append(header + "\n")
-
-        # Write corrected point count
-        actual_count = profile["actual_point_count"]
-        lines.append(f"{actual_count}\n")
-
-        # Write coordinates
-        for coord in profile["coordinates"]:
-            x = coord["x"]
-            y = coord["y"]
-            lines.append(f"{x} {y}\n")
-
-    output_path.write_text("".join(lines), encoding="utf-8")
+    columns = parsed.columns
+
+    with open(
+        output_path, "w", encoding="utf-8", buffering=BMAP_WRITE_BUFFER_SIZE
+    ) as f:
+        for index, profile in enumerate(parsed.profiles):
+            # Write profile header
+            header = profile.get("raw_header", "")
+            if not header:
+                # Reconstruct header from components
+                parts = [profile["profile_id"]]
+                if profile.get("date"):
+                    parts.append(profile["date"])
+                if profile.get("purpose"):
+                    parts.append(profile["purpose"])
+                header = " ".join(parts)
+
+            # Coordinates are written exactly as parsed
+            xs: Iterable[Any]
+            ys: Iterable[Any]
+            if isinstance(columns, BMAPColumns):
+                xs, ys = columns.profile_arrays(index)
+            else:
+                xs = [coord["x"] for coord in profile["coordinates"]]
+                ys = [coord["y"] for coord in profile["coordinates"]]
+
+            # Write corrected point count
+            write_bmap_block(
+                f,
+                header,
+                xs,
+                ys,
+                point_count=profile["actual_point_count"],
+                pair_format="%s %s\n",
+            )
 
 
 def _write_csv_format(parsed: ParsedFile, output_path: Path) -> None:
@@ -153,11 +169,23 @@ def _write_csv_format(parsed: ParsedFile, output_path: Path) -> None:
         lines.append(delimiter.join(headers) + "\n")
 
     # Write data rows preserving all columns
-    for profile in parsed.profiles:
+    columns = parsed.columns
+    for index, profile in enumerate(parsed.profiles):
         if "all_columns" in profile:
             # Use preserved columns
             for row in profile["all_columns"]:
                 lines.append(delimiter.join(row) + "\n")
+        elif isinstance(columns, CSVColumns):
+            # Reconstruct from columnar coordinates. Not reached from
+            # fix_bmap_point_counts: delimited files have no declared point
+            # counts, so they never need corrections. Columnar data holds
+            # only x/y/z, so any extra columns would not be written here.
+            xs, ys, zs = columns.profile_arrays(index)
+            lines.extend(
+                delimiter.join([profile["profile_id"], str(x), str(y), str(z)])
+                + "\n"
+                for x, y, z in zip(xs.tolist(), ys.tolist(), zs.tolist())
+            )
         else:
             # Reconstruct from coordinates
             for coord in profile["coordinates"]:
@@ -11,9 +11,11 @@ Analyzes BMAP free format files and generates detailed reports showing:
 
 import argparse
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
-from profcalc.common.bmap_io import read_bmap_freeformat
+import numpy as np
+
+from profcalc.common.bmap_io import iter_bmap_profiles
 
 
 def execute_from_cli(args: list[str]) -> None:
@@ -67,91 +69,104 @@ def generate_inventory_report(file_path: str, verbose: bool = False) -> str:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    # Read profiles
-    profiles = read_bmap_freeformat(file_path)
-
-    # Calculate statistics
-    stats = _calculate_file_statistics(profiles)
+    # Stream profiles and accumulate statistics in a single pass
+    stats = _calculate_file_statistics(iter_bmap_profiles(file_path))
 
     # Generate report
-    return _format_inventory_report(path, profiles, stats, verbose)
+    return _format_inventory_report(path, stats, verbose)
 
 
 def _calculate_file_statistics(
-    profiles: list,
+    profiles: Iterable[Any],
 ) -> Dict[str, Any]:
     """
     Calculate comprehensive statistics from profiles.
 
+    Statistics are accumulated in one pass, so ``profiles`` may be a
+    generator; only a small per-survey summary is retained.
+
     Args:
-        profiles: List of Profile objects
+        profiles: Iterable of Profile objects
 
     Returns:
         Dictionary of statistics
     """
-    total_profiles = len(profiles)
-    total_points = sum(len(p.x) for p in profiles)
-
-    # Collect dates
-    dates = [p.date for p in profiles if p.date]
-    unique_dates = sorted(set(dates)) if dates else []
-
-    # Collect profile names and count duplicates
+    total_profiles = 0
+    total_points = 0
+    dates: set = set()
     profile_names: Dict[str, int] = {}
-    for p in profiles:
-        profile_names[p.name] = profile_names.get(p.name, 0) + 1
-
-    unique_profile_names = len(profile_names)
+    surveys: list[Dict[str, Any]] = []
+    points_per_profile: list[int] = []
 
-    # Calculate elevation statistics
-    all_elevations = []
-    for p in profiles:
-        all_elevations.extend(p.z.tolist())
-
-    min_elev = min(all_elevations) if all_elevations else 0.0
-    max_elev = max(all_elevations) if all_elevations else 0.0
-    avg_elev = (
-        sum(all_elevations) / len(all_elevations) if all_elevations else 0.0
-    )
+    min_elev = max_elev = min_x = max_x = None
+    elev_sum = 0.0
 
-    # Calculate X coordinate statistics
-    all_x = []
     for p in profiles:
-        all_x.extend(p.x.tolist())
+        n = len(p.x)
+        total_profiles += 1
+        total_points += n
+        points_per_profile.append(n)
+
+        # Collect dates and count duplicate profile names
+        if p.date:
+            dates.add(p.date)
+        profile_names[p.name] = profile_names.get(p.name, 0) + 1
 
-    min_x = min(all_x) if all_x else 0.0
-    max_x = max(all_x) if all_x else 0.0
+        if n == 0:
+            continue
+
+        z = np.asarray(p.z, dtype=float)
+        x = np.asarray(p.x, dtype=float)
+        p_zmin, p_zmax = float(z.min()), float(z.max())
+        p_xmin, p_xmax = float(x.min()), float(x.max())
+        p_zsum = float(z.sum())
+
+        # Running coordinate and elevation statistics
+        min_elev = p_zmin if min_elev is None else min(min_elev, p_zmin)
+        max_elev = p_zmax if max_elev is None else max(max_elev, p_zmax)
+        min_x = p_xmin if min_x is None else min(min_x, p_xmin)
+        max_x = p_xmax if max_x is None else max(max_x, p_xmax)
+        elev_sum += p_zsum
+
+        surveys.append(
+            {
+                "name": p.name,
+                "date": p.date,
+                "description": p.description,
+                "points": n,
+                "min_x": p_xmin,
+                "max_x": p_xmax,
+                "min_z": p_zmin,
+                "max_z": p_zmax,
+                "avg_z": p_zsum / n,
+            }
+        )
 
     # Profile point statistics
-    points_per_profile = [len(p.x) for p in profiles]
     min_points = min(points_per_profile) if points_per_profile else 0
     max_points = max(points_per_profile) if points_per_profile else 0
-    avg_points = (
-        sum(points_per_profile) / len(points_per_profile)
-        if points_per_profile
-        else 0
-    )
+    avg_points = total_points / total_profiles if total_profiles else 0
 
     return {
         "total_profiles": total_profiles,
-        "unique_profile_names": unique_profile_names,
+        "unique_profile_names": len(profile_names),
         "profile_names": profile_names,
         "total_points": total_points,
-        "dates": unique_dates,
-        "min_elev": min_elev,
-        "max_elev": max_elev,
-        "avg_elev": avg_elev,
-        "min_x": min_x,
-        "max_x": max_x,
+        "dates": sorted(dates),
+        "min_elev": min_elev if min_elev is not None else 0.0,
+        "max_elev": max_elev if max_elev is not None else 0.0,
+        "avg_elev": elev_sum / total_points if total_points else 0.0,
+        "min_x": min_x if min_x is not None else 0.0,
+        "max_x": max_x if max_x is not None else 0.0,
         "min_points": min_points,
         "max_points": max_points,
         "avg_points": avg_points,
+        "surveys": surveys,
     }
 
 
 def _format_inventory_report(
     path: Path,
-    profiles: list,
     stats: Dict[str, Any],
     verbose: bool,
 ) -> str:
@@ -160,8 +175,7 @@ def _format_inventory_report(
 
     Args:
         path: Path to BMAP file
-        profiles: List of Profile objects
-        stats: Statistics dictionary
+        stats: Statistics dictionary (including per-survey summaries)
         verbose: Whether to include detailed per-profile info
 
     Returns:
@@ -245,24 +259,22 @@ def _format_inventory_report(
             ]
         )
 
-        for i, profile in enumerate(profiles, 1):
-            lines.append(f"\nSurvey #{i}: {profile.name}")
-            lines.append(
-                f"  Date: {profile.date if profile.date else 'Not specified'}"
-            )
+        for i, survey in enumerate(stats["surveys"], 1):
+            lines.append(f"\nSurvey #{i}: {survey['name']}")
             lines.append(
-                f"  Description: {profile.description if profile.description else 'None'}"
+                f"  Date: {survey['date'] if survey['date'] else 'Not specified'}"
             )
-            lines.append(f"  Points: {len(profile.x)}")
             lines.append(
-                f"  X Range: {min(profile.x):.2f} to {max(profile.x):.2f} ft"
+                f"  Description: {survey['description'] if survey['description'] else 'None'}"
             )
+            lines.append(f"  Points: {survey['points']}")
             lines.append(
-                f"  Z Range: {min(profile.z):.2f} to {max(profile.z):.2f} ft NAVD88"
+                f"  X Range: {survey['min_x']:.2f} to {survey['max_x']:.2f} ft"
             )
             lines.append(
-                f"  Avg Elevation: {sum(profile.z) / len(profile.z):.2f} ft NAVD88"
+                f"  Z Range: {survey['min_z']:.2f} to {survey['max_z']:.2f} ft NAVD88"
             )
+            lines.append(f"  Avg Elevation: {survey['avg_z']:.2f} ft NAVD88")
 
         lines.append("")
 
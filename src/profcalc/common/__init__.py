@@ -5,6 +5,7 @@ Includes:
 - config_utils: handles global and tool-specific settings
 - io_freeformat: legacy BMAP file I/O (deprecated, use bmap_io instead)
 - bmap_io: BMAP free format file I/O with Profile dataclass
+- profile_collection: columnar container for many profiles
 - csv_io: CSV file I/O for reading and writing beach profile data
 - ninecol_io: 9-column ASCII file I/O
 - coordinate_transforms: 2D ↔ 3D coordinate transformations and baseline management
@@ -16,12 +17,16 @@ Includes:
 """
 
 from .bmap_io import (
+    iter_bmap_profiles,
     read_bmap_freeformat,
     read_bmap_profiles,
     write_bmap_profiles,
 )
 from .config_utils import get_dx
 from .coordinate_transforms import (
+    batch_convert_2d_to_3d,
+    batch_convert_3d_to_2d,
+    batch_estimate_profile_baselines,
     batch_transform_profiles_to_2d,
     batch_transform_profiles_to_3d,
     convert_2d_to_3d_profile,
@@ -32,7 +37,13 @@ from .coordinate_transforms import (
     transform_profile_to_3d,
     transform_profiles_with_baselines,
 )
-from .csv_io import read_csv_profiles, read_xyz_profiles, write_csv_profiles
+from .csv_io import (
+    load_network_columns,
+    load_profile_origin_azimuths,
+    read_csv_profiles,
+    read_xyz_profiles,
+    write_csv_profiles,
+)
 from .data_validation import (
     validate_and_raise,
     validate_array_properties,
@@ -54,17 +65,22 @@ from .io_reports import (
 )
 from .logging_utils import setup_module_logger
 from .ninecol_io import read_9col_profiles, write_9col_profiles
+from .profile_collection import ProfileCollection
 from .resampling_core import interpolate_to_common_grid
 
 __all__ = [
     "get_dx",
     "read_bmap_freeformat",
+    "iter_bmap_profiles",
+    "ProfileCollection",
     "write_volume_report",
     "write_cutfill_detailed_report",
     "write_bar_properties_report",
     "interpolate_to_common_grid",
     "read_csv_profiles",
     "read_xyz_profiles",
+    "load_profile_origin_azimuths",
+    "load_network_columns",
     "read_bmap_profiles",
     "read_9col_profiles",
     "write_csv_profiles",
@@ -74,7 +90,10 @@ __all__ = [
     "transform_profile_to_3d",
     "batch_transform_profiles_to_2d",
     "batch_transform_profiles_to_3d",
+    "batch_convert_3d_to_2d",
+    "batch_convert_2d_to_3d",
     "estimate_profile_baseline",
+    "batch_estimate_profile_baselines",
     "load_profile_baselines",
     "transform_profiles_with_baselines",
     "write_bmap_profiles",
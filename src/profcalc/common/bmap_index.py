@@ -0,0 +1,291 @@
+"""
+BMAP Profile Index Module
+
+This module builds a byte-offset index of the profile headers in a BMAP free
+format file so that single profiles can be loaded without parsing the whole
+file. Interactive tools that select one or two profiles by header (cut/fill,
+bar properties) use it to respond quickly on large multi-survey files.
+
+Index features:
+- One entry per profile: byte offsets of the block, name, date, purpose code
+- Small JSON sidecar file stored next to the survey file (``<file>.pidx``)
+- Sidecar invalidated automatically when the file size or mtime changes
+- Single-profile loads seek into a memory-mapped file and parse one block
+
+The index assumes an ASCII-compatible encoding (ASCII, UTF-8, Latin-1), which
+covers BMAP free format files written by ProfCalc and the legacy BMAP software.
+"""
+
+import json
+import mmap
+import os
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from .bmap_io import (
+    Profile,
+    _iter_bmap_blocks,
+    _iter_bmap_lines,
+)
+from .error_handler import (
+    BeachProfileError,
+    ErrorCategory,
+    LogComponent,
+    get_logger,
+)
+from .file_parser import _parse_bmap_profile_header
+
+INDEX_SUFFIX = ".pidx"
+INDEX_VERSION = 1
+
+
+@dataclass
+class ProfileIndexEntry:
+    """Location and header fields of one profile block in a BMAP file.
+
+    The ``name``, ``date`` and ``description`` properties mirror the Profile
+    built by ``read_bmap_freeformat``, so the tools' profile selectors work
+    on index entries unchanged.
+    """
+
+    start: int
+    stop: int
+    profile_id: str
+    date_str: Optional[str]
+    purpose: Optional[str]
+    raw_header: str
+
+    @property
+    def name(self) -> str:
+        return self.profile_id
+
+    @property
+    def date(self) -> Optional[str]:
+        return self.date_str
+
+    @property
+    def description(self) -> Optional[str]:
+        parts = [p for p in (self.purpose, self.raw_header) if p]
+        return " ".join(parts) if parts else None
+
+
+class BMAPProfileIndex:
+    """Byte-offset index of the profiles in one BMAP free format file.
+
+    Attributes:
+        file_path: Path of the indexed BMAP file
+        size: File size in bytes when the index was built
+        mtime_ns: File modification time (ns) when the index was built
+        entries: Index entries in file order
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        size: int,
+        mtime_ns: int,
+        entries: List[ProfileIndexEntry],
+    ):
+        self.file_path = Path(file_path)
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.entries = entries
+        self.logger = get_logger(LogComponent.FILE_IO)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[ProfileIndexEntry]:
+        return iter(self.entries)
+
+    @property
+    def sidecar_path(self) -> Path:
+        return sidecar_path_for(self.file_path)
+
+    @classmethod
+    def build(cls, file_path: str | Path) -> "BMAPProfileIndex":
+        """Scan a BMAP file once and record the byte range of every profile.
+
+        Only profiles that ``read_bmap_freeformat`` would return (those with
+        at least one valid coordinate pair) are indexed.
+
+        Args:
+            file_path: Path to the BMAP file
+
+        Returns:
+            Freshly built index
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        path = Path(file_path)
+        stat = path.stat()
+        entries: List[ProfileIndexEntry] = []
+
+        # (start, end) byte offsets of each line still inside the current block
+        line_spans: deque[tuple[int, int]] = deque()
+        base_line = 0
+
+        with open(path, "rb") as fh:
+
+            def decoded_lines() -> Iterator[str]:
+                pos = 0
+                for raw in fh:
+                    line_spans.append((pos, pos + len(raw)))
+                    pos += len(raw)
+                    yield raw.decode("utf-8", errors="ignore")
+
+            for first, stop, header, xs, _ in _iter_bmap_blocks(
+                decoded_lines()
+            ):
+                start = line_spans[first - base_line][0]
+                end = line_spans[stop - 1 - base_line][1]
+                # Drop spans of lines that precede the next block
+                while base_line < stop:
+                    line_spans.popleft()
+                    base_line += 1
+
+                if not xs:
+                    continue
+                fields = _parse_bmap_profile_header(header)
+                entries.append(
+                    ProfileIndexEntry(
+                        start=start,
+                        stop=end,
+                        profile_id=fields["profile_id"],
+                        date_str=fields["date"],
+                        purpose=fields["purpose"],
+                        raw_header=fields["raw_header"],
+                    )
+                )
+
+        return cls(path, stat.st_size, stat.st_mtime_ns, entries)
+
+    def is_current(self) -> bool:
+        """Return True if the indexed file is unchanged (size and mtime)."""
+        try:
+            stat = self.file_path.stat()
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def save(self) -> Optional[Path]:
+        """Write the index to its sidecar file.
+
+        Failures (e.g. read-only directories) are logged and ignored since
+        the index can always be rebuilt.
+
+        Returns:
+            Sidecar path, or None if it could not be written
+        """
+        payload = {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "entries": [asdict(e) for e in self.entries],
+        }
+        try:
+            self.sidecar_path.write_text(json.dumps(payload), encoding="utf-8")
+        except OSError as e:
+            self.logger.warning(
+                f"Could not write profile index {self.sidecar_path}: {e}"
+            )
+            return None
+        return self.sidecar_path
+
+    @classmethod
+    def from_sidecar(
+        cls, file_path: str | Path
+    ) -> Optional["BMAPProfileIndex"]:
+        """Load a sidecar index if it exists and still matches the file.
+
+        Args:
+            file_path: Path to the BMAP file (not the sidecar)
+
+        Returns:
+            The stored index, or None if missing, unreadable or stale
+        """
+        path = Path(file_path)
+        sidecar = sidecar_path_for(path)
+        try:
+            payload = json.loads(sidecar.read_text(encoding="utf-8"))
+            if payload.get("version") != INDEX_VERSION:
+                return None
+            index = cls(
+                path,
+                int(payload["size"]),
+                int(payload["mtime_ns"]),
+                [ProfileIndexEntry(**e) for e in payload["entries"]],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return index if index.is_current() else None
+
+    def read_profile(self, entry: ProfileIndexEntry) -> Profile:
+        """Load one profile by seeking into the memory-mapped file.
+
+        Args:
+            entry: Index entry of the profile to load
+
+        Returns:
+            Profile identical to the one ``read_bmap_freeformat`` returns
+
+        Raises:
+            BeachProfileError: If the file changed since indexing or the
+                block no longer parses
+        """
+        if not self.is_current():
+            raise BeachProfileError(
+                f"Profile index is stale for {self.file_path}; rebuild it",
+                category=ErrorCategory.FILE_IO,
+            )
+        with open(self.file_path, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                block = mm[entry.start : entry.stop]
+
+        text = block.decode("utf-8", errors="ignore")
+        for profile in _iter_bmap_lines(text.splitlines()):
+            return profile
+        raise BeachProfileError(
+            f"No profile found at byte {entry.start} of {self.file_path}",
+            category=ErrorCategory.FILE_IO,
+        )
+
+
+def sidecar_path_for(file_path: str | Path) -> Path:
+    """Return the sidecar index path for a BMAP file."""
+    path = Path(file_path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def load_bmap_index(
+    file_path: str | Path, use_sidecar: bool = True
+) -> BMAPProfileIndex:
+    """Return a current index for a BMAP file, building it if needed.
+
+    Args:
+        file_path: Path to the BMAP file
+        use_sidecar: If True, reuse a valid sidecar and write a new one
+            after rebuilding
+
+    Returns:
+        BMAPProfileIndex matching the file's current size and mtime
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(file_path)
+
+    if use_sidecar:
+        index = BMAPProfileIndex.from_sidecar(file_path)
+        if index is not None:
+            return index
+
+    index = BMAPProfileIndex.build(file_path)
+    if use_sidecar:
+        index.save()
+    return index
+
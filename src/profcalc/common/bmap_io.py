@@ -15,10 +15,11 @@ Supported BMAP features:
 import os
 import re
 import uuid
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
 
 import numpy as np
 
@@ -29,8 +30,21 @@ from .error_handler import (
     LogComponent,
     get_logger,
 )
-from .file_parser import ParsedFile
+from .file_parser import (
+    BMAPColumns,
+    CSVColumns,
+    ParsedFile,
+    _parse_bmap_profile_header,
+    iter_column_profiles,
+)
 from .file_parser import parse_file as parse_file_centralized
+from .parse_cache import read_through_cache
+
+# Output buffer size for BMAP writers (bytes)
+BMAP_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Coordinate pairs formatted per string operation when writing
+_WRITE_BLOCK_POINTS = 65536
 
 
 def extract_date_from_filename(filename: str) -> Optional[str]:
@@ -646,18 +660,180 @@ def _convert_parsed_file_to_profiles(parsed_file: ParsedFile) -> List[Profile]:
     return profiles
 
 
+def _profile_from_header(
+    header: Dict[str, Any], x: np.ndarray, z: np.ndarray
+) -> Profile:
+    """Build a legacy Profile from a parsed BMAP header and its coordinates."""
+    desc_parts = []
+    if header.get("purpose"):
+        desc_parts.append(header["purpose"])
+    if header.get("raw_header"):
+        desc_parts.append(header["raw_header"])
+    desc = " ".join(desc_parts) if desc_parts else None
+
+    return Profile(
+        name=header.get("profile_id", "UNKNOWN"),
+        date=header.get("date"),
+        description=desc,
+        x=x,
+        z=z,
+        metadata=header.get("metadata"),
+    )
+
+
+def _convert_columns_to_profiles(
+    columns: BMAPColumns | CSVColumns,
+) -> List[Profile]:
+    """
+    Build legacy Profile objects from columnar parse output.
+
+    Each profile's ``x``/``z`` arrays are views into the shared column
+    arrays, so no per-point objects are created.
+
+    Args:
+        columns: Columnar coordinates from the centralized parser
+
+    Returns:
+        List of Profile objects (profiles without coordinates are dropped)
+    """
+    return [
+        _profile_from_header(header, x, z)
+        for header, x, z in iter_column_profiles(columns)
+    ]
+
+
+def _iter_bmap_blocks(
+    lines: Iterable[str],
+) -> Iterator[tuple[int, int, str, List[float], List[float]]]:
+    """
+    Yield every profile block recognised in BMAP free format lines.
+
+    Only the current block and a three-line lookahead are held in memory.
+    Header detection and point-count handling match ``parse_bmap_columns``.
+
+    Yields:
+        Tuples of (first_line, stop_line, header, xs, zs) where the line
+        numbers are 0-based and ``stop_line`` is exclusive. Blocks without
+        valid coordinates are included with empty ``xs``/``zs``.
+    """
+    source = iter(lines)
+    window: deque[str] = deque()
+    head = 0  # line number of window[0]
+
+    def fill(n: int) -> bool:
+        while len(window) < n:
+            line = next(source, None)
+            if line is None:
+                return False
+            window.append(line)
+        return True
+
+    while fill(1):
+        line = window[0].strip()
+
+        # Skip empty lines
+        if not line:
+            window.popleft()
+            head += 1
+            continue
+
+        # A profile header is followed by a positive point count
+        if fill(3):
+            try:
+                point_count = int(window[1].strip())
+            except ValueError:
+                point_count = 0
+
+            if point_count > 0:
+                first = head
+                window.popleft()
+                window.popleft()
+                head += 2
+                xs: List[float] = []
+                zs: List[float] = []
+                for _ in range(point_count):
+                    if not fill(1):
+                        break
+                    parts = window.popleft().split()
+                    head += 1
+                    if len(parts) >= 2:
+                        try:
+                            x = float(parts[0])
+                            z = float(parts[1])
+                        except ValueError:
+                            continue
+                        xs.append(x)
+                        zs.append(z)
+
+                yield first, head, line, xs, zs
+                continue
+
+        window.popleft()
+        head += 1
+
+
+def _iter_bmap_lines(lines: Iterable[str]) -> Iterator[Profile]:
+    """Yield profiles with coordinates from BMAP free format lines."""
+    for _, _, header, xs, zs in _iter_bmap_blocks(lines):
+        if xs:
+            yield _profile_from_header(
+                _parse_bmap_profile_header(header),
+                np.array(xs, dtype=float),
+                np.array(zs, dtype=float),
+            )
+
+
+def iter_bmap_profiles(source: str | Path | TextIO) -> Iterator[Profile]:
+    """
+    Stream Profile objects from a BMAP free format file one at a time.
+
+    Unlike ``read_bmap_freeformat``, the file is never loaded as a whole:
+    memory use stays constant beyond the profile currently being built, so
+    multi-GB archives can be processed in a single pass. Profiles are
+    identical to those returned by ``read_bmap_freeformat`` for BMAP files.
+
+    Args:
+        source: Path to a BMAP file, or an open text file handle
+
+    Yields:
+        Profile objects in file order (profiles without coordinates are skipped)
+    """
+    if isinstance(source, (str, Path)):
+        if not os.path.exists(source):
+            raise FileNotFoundError(source)
+        with open(source, encoding="utf-8", errors="ignore") as fh:
+            yield from _iter_bmap_lines(fh)
+    else:
+        yield from _iter_bmap_lines(source)
+
+
 def read_bmap_freeformat(file_path: str) -> List[Profile]:
     """
     Reads a BMAP Free Format file with one or more profiles.
     Automatically corrects for mismatched point counts.
 
-    Now uses the centralized format detection and parsing system.
+    Now uses the centralized format detection and parsing system. BMAP
+    files are parsed in columnar mode, so coordinates go straight into
+    NumPy arrays without per-point intermediate objects. Results are served
+    from the parse cache when it is enabled.
     """
+    return read_through_cache(
+        "bmap_freeformat",
+        file_path,
+        lambda: _read_bmap_freeformat_uncached(file_path),
+    )
+
+
+def _read_bmap_freeformat_uncached(file_path: str | Path) -> List[Profile]:
+    """Parse a BMAP free format file without consulting the parse cache."""
     # Use the centralized parser
     parsed_file = parse_file_centralized(
-        Path(file_path), skip_confirmation=True
+        Path(file_path), skip_confirmation=True, columnar=True
     )
 
+    if parsed_file.columns is not None:
+        return _convert_columns_to_profiles(parsed_file.columns)
+
     # Convert to legacy Profile format
     return _convert_parsed_file_to_profiles(parsed_file)
 
@@ -691,7 +867,7 @@ def write_bmap_profiles(
             )
             filename_identifier = f"from_{basename}"
 
-        with open(file_path, "w") as f:
+        with open(file_path, "w", buffering=BMAP_WRITE_BUFFER_SIZE) as f:
             for profile in profiles:
                 # Write header line: profile_name [date] [description]
                 header_parts = [profile.name]
@@ -717,14 +893,13 @@ def write_bmap_profiles(
                 if profile.description:
                     header_parts.append(profile.description)
 
-                f.write(" ".join(header_parts) + "\n")
-
-                # Write point count
-                f.write(f"{len(profile.x)}\n")
-
-                # Write coordinate pairs
-                for x, z in zip(profile.x, profile.z):
-                    f.write(f"{x:.3f} {z:.3f}\n")
+                write_bmap_block(
+                    f,
+                    " ".join(header_parts),
+                    profile.x,
+                    profile.z,
+                    point_count=len(profile.x),
+                )
 
                 # Add blank line between profiles
                 f.write("\n")
@@ -734,3 +909,42 @@ def write_bmap_profiles(
             f"Failed to write BMAP file {file_path}: {e}",
             category=ErrorCategory.FILE_IO,
         )
+
+
+def write_bmap_block(
+    f: TextIO,
+    header: str,
+    x: Iterable[Any],
+    z: Iterable[Any],
+    point_count: Optional[int] = None,
+    pair_format: str = "%.3f %.3f\n",
+) -> None:
+    """
+    Write one BMAP profile block: header, point count and coordinates.
+
+    Coordinates are formatted in large blocks with a single string
+    operation instead of one formatted write per point. Output matches
+    formatting each pair individually with ``pair_format``.
+
+    Args:
+        f: Text stream to write to
+        header: Profile header line (without newline)
+        x: X coordinates
+        z: Z (elevation) coordinates
+        point_count: Count to write on line 2 (defaults to the number of
+            coordinate pairs)
+        pair_format: %-style format for one coordinate line
+    """
+    xs = x.tolist() if isinstance(x, np.ndarray) else list(x)
+    zs = z.tolist() if isinstance(z, np.ndarray) else list(z)
+    n = min(len(xs), len(zs))
+    if point_count is None:
+        point_count = n
+
+    f.write(f"{header}\n{point_count}\n")
+    for start in range(0, n, _WRITE_BLOCK_POINTS):
+        stop = min(start + _WRITE_BLOCK_POINTS, n)
+        values: List[Any] = [None] * (2 * (stop - start))
+        values[0::2] = xs[start:stop]
+        values[1::2] = zs[start:stop]
+        f.write((pair_format * (stop - start)) % tuple(values))
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 from .error_handler import LogComponent, get_logger
@@ -39,3 +40,62 @@ def get_dx(default: float = 10.0) -> float:
             f"Failed to load config from {config_path}, using default dx={default}: {e}"
         )
         return default
+
+
+def get_parse_cache_settings() -> dict:
+    """Get the parse cache settings from configuration.
+
+    Reads the ``parse_cache`` section of config.json. The environment
+    variables ``PROFCALC_PARSE_CACHE`` ("1"/"0"), ``PROFCALC_CACHE_DIR`` and
+    ``PROFCALC_CACHE_MAX_MB`` override the file values.
+
+    Returns:
+        Dictionary with keys ``enabled`` (bool), ``max_size_mb`` (float) and
+        ``directory`` (str or None). The cache is disabled by default.
+
+    Raises:
+        This function handles all exceptions internally and logs warnings,
+        never raising exceptions to calling code.
+    """
+    settings: dict = {
+        "enabled": False,
+        "max_size_mb": 512.0,
+        "directory": None,
+    }
+    config_path: Path = Path(__file__).parent / "config.json"
+    try:
+        with open(config_path, "r") as f:
+            cfg: dict = json.load(f)
+        section = cfg.get("parse_cache") or {}
+        settings["enabled"] = bool(section.get("enabled", False))
+        settings["max_size_mb"] = float(section.get("max_size_mb", 512.0))
+        settings["directory"] = section.get("directory")
+    except (
+        FileNotFoundError,
+        json.JSONDecodeError,
+        ValueError,
+        TypeError,
+        AttributeError,
+    ) as e:
+        logger = get_logger(LogComponent.FILE_IO)
+        logger.warning(
+            f"Failed to load parse cache settings from {config_path}: {e}"
+        )
+
+    env_enabled = os.environ.get("PROFCALC_PARSE_CACHE")
+    if env_enabled is not None:
+        settings["enabled"] = env_enabled.strip().lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+    if os.environ.get("PROFCALC_CACHE_DIR"):
+        settings["directory"] = os.environ["PROFCALC_CACHE_DIR"]
+    if os.environ.get("PROFCALC_CACHE_MAX_MB"):
+        try:
+            settings["max_size_mb"] = float(
+                os.environ["PROFCALC_CACHE_MAX_MB"]
+            )
+        except ValueError:
+            pass
+    return settings
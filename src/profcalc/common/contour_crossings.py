@@ -0,0 +1,157 @@
+"""
+Contour Crossings Module
+
+This module finds where profiles cross contour elevations, for a whole
+columnar profile set (concatenated ``x``/``z`` arrays plus ``offsets``, as
+held by ProfileCollection) and any number of contours in one vectorized
+pass. Contours may be shared by every profile or given per profile (e.g.
+MHW from the profile network file).
+
+Crossing rules:
+- A segment whose ends lie strictly on opposite sides of the contour
+  crosses it at the linearly interpolated X
+- A point lying exactly on the contour is a crossing at its own X
+  (reported once, however many segments touch it)
+- Points are taken in stored order; ``first`` and ``last`` follow that
+  order and ``seaward`` is the crossing with the largest X. For profiles
+  stored landward to seaward, ``last`` and ``seaward`` agree and
+  ``first`` is the landward-most crossing.
+
+Example (shorelines of a whole project in one call):
+    collection = ProfileCollection.from_bmap(path)
+    found = find_contour_crossings(
+        collection.x, collection.z, collection.offsets, 0.0
+    )
+    shoreline_x = found["seaward"][:, 0]
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .profile_batch import segment_index
+
+CROSSING_SELECTORS = ("first", "last", "seaward")
+
+
+def _contour_levels(contours, n_profiles: int) -> np.ndarray:
+    """Broadcast contours to one row of levels per profile.
+
+    A scalar or 1-D array is shared by every profile; a 2-D array holds
+    one row per profile.
+    """
+    levels = np.asarray(contours, dtype=float)
+    if levels.ndim <= 1:
+        levels = np.atleast_1d(levels)
+        return np.broadcast_to(levels, (n_profiles, len(levels)))
+    if levels.ndim != 2 or levels.shape[0] != n_profiles:
+        raise ValueError("Per-profile contours must have one row per profile")
+    return levels
+
+
+def find_contour_crossings(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    contours,
+) -> Dict[str, np.ndarray]:
+    """
+    Find every crossing of every contour in every profile.
+
+    Args:
+        x: Concatenated cross-shore distances
+        z: Concatenated elevations
+        offsets: Profile start offsets plus the total point count
+        contours: Contour elevation(s): a scalar or 1-D array shared by
+            all profiles, or a 2-D array with one row per profile (pass
+            ``mhw[:, None]`` for one per-profile contour). NaN contours
+            have no crossings.
+
+    Returns:
+        Dict with the individual crossings, ordered by profile, contour and
+        position along the profile:
+
+        - ``profile``: profile index of each crossing
+        - ``contour``: contour (column) index of each crossing
+        - ``x``: X of each crossing
+
+        and the selected crossing of each profile and contour, as arrays
+        with one row per profile and one column per contour (NaN where
+        the profile never reaches the contour):
+
+        - ``first``, ``last``: first and last crossing in stored order
+        - ``seaward``: crossing with the largest X
+    """
+    x = np.asarray(x, dtype=float)
+    z = np.asarray(z, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    n_profiles = len(offsets) - 1
+    levels = _contour_levels(contours, n_profiles)
+    n_contours = levels.shape[1]
+    owner = segment_index(offsets)
+    h = z[:, None] - levels[owner]
+
+    # Points on the contour, at their own position along the profile
+    node, node_col = np.nonzero(h == 0.0)
+
+    # Segments (within a profile) changing sign strictly
+    inside = owner[1:] == owner[:-1]
+    seg, seg_col = np.nonzero(inside[:, None] & (h[:-1] * h[1:] < 0.0))
+    c = levels[owner[seg], seg_col]
+    frac = (c - z[seg]) / (z[seg + 1] - z[seg])
+    seg_x = x[seg] + frac * (x[seg + 1] - x[seg])
+
+    # Order crossings by profile, contour and position (a segment
+    # crossing sits half-way between its two points)
+    profile = np.concatenate([owner[node], owner[seg]])
+    contour = np.concatenate([node_col, seg_col])
+    position = np.concatenate([node, seg + 0.5])
+    cross_x = np.concatenate([x[node], seg_x])
+    order = np.lexsort((position, contour, profile))
+    profile, contour, cross_x = profile[order], contour[order], cross_x[order]
+
+    result = {"profile": profile, "contour": contour, "x": cross_x}
+    group = profile * n_contours + contour
+    starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    ends = np.r_[starts[1:], len(group)] - 1
+    for name in CROSSING_SELECTORS:
+        table = np.full(n_profiles * n_contours, np.nan)
+        if len(group):
+            if name == "first":
+                values = cross_x[starts]
+            elif name == "last":
+                values = cross_x[ends]
+            else:
+                values = np.maximum.reduceat(cross_x, starts)
+            table[group[starts]] = values
+        result[name] = table.reshape(n_profiles, n_contours)
+    return result
+
+
+def crossing_x(
+    x: np.ndarray, z: np.ndarray, contour: float, selector: str = "seaward"
+) -> Optional[float]:
+    """
+    Selected crossing of one contour by a single profile.
+
+    Args:
+        x: Cross-shore distances (in stored order)
+        z: Elevations
+        contour: Contour elevation
+        selector: One of ``CROSSING_SELECTORS``
+
+    Returns:
+        X of the selected crossing, or None if the contour is not crossed
+
+    Raises:
+        ValueError: If the selector is not recognised
+    """
+    if selector not in CROSSING_SELECTORS:
+        raise ValueError(
+            f"Unknown crossing selector {selector!r}; "
+            f"expected one of {', '.join(CROSSING_SELECTORS)}"
+        )
+    x = np.asarray(x, dtype=float)
+    found = find_contour_crossings(x, z, np.array([0, len(x)]), contour)
+    value = found[selector][0, 0]
+    return None if np.isnan(value) else float(value)
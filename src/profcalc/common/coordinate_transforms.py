@@ -13,7 +13,7 @@ Key transformations:
 - 3D survey points → 2D profile lines
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -75,6 +75,155 @@ def calculate_point_profile_offset(
     return y_rotated
 
 
+def _baseline_terms(
+    count: int,
+    profile_index: Optional[np.ndarray],
+    origin_x: np.ndarray | float,
+    origin_y: np.ndarray | float,
+    azimuth: np.ndarray | float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return per-point origin X/Y and azimuth (radians) for batch transforms.
+
+    Trigonometry is evaluated per point from the same azimuth values, so
+    results are bit-identical to the single-profile functions.
+    """
+    origin_x = np.asarray(origin_x, dtype=float)
+    origin_y = np.asarray(origin_y, dtype=float)
+    azimuth_rad = np.radians(np.asarray(azimuth, dtype=float))
+    if not (origin_x.shape == origin_y.shape == azimuth_rad.shape):
+        raise BeachProfileError(
+            "Baseline origin X, origin Y and azimuth arrays must have the "
+            "same shape",
+            category=ErrorCategory.SPATIAL,
+        )
+
+    if profile_index is None:
+        if origin_x.ndim != 0 and origin_x.shape != (count,):
+            raise BeachProfileError(
+                "A profile index is required when transforming against "
+                "more than one baseline",
+                category=ErrorCategory.SPATIAL,
+            )
+        return origin_x, origin_y, azimuth_rad
+
+    index = np.asarray(profile_index, dtype=np.intp)
+    if index.shape != (count,):
+        raise BeachProfileError(
+            f"Profile index length ({len(index)}) doesn't match the number "
+            f"of points ({count})",
+            category=ErrorCategory.SPATIAL,
+        )
+    if count and (index.min() < 0 or index.max() >= origin_x.size):
+        raise BeachProfileError(
+            f"Profile index out of range for {origin_x.size} baselines",
+            category=ErrorCategory.SPATIAL,
+        )
+    return origin_x[index], origin_y[index], azimuth_rad[index]
+
+
+def batch_convert_3d_to_2d(
+    x_coords: np.ndarray,
+    y_coords: np.ndarray,
+    origin_x: np.ndarray | float,
+    origin_y: np.ndarray | float,
+    azimuth: np.ndarray | float,
+    profile_index: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Project survey points onto their profile baselines in one operation.
+
+    Array-native counterpart of ``calculate_point_profile_offset`` for a
+    whole survey: every point is transformed against the baseline selected
+    by ``profile_index`` using broadcast NumPy arithmetic.
+
+    Args:
+        x_coords: X coordinates of all points
+        y_coords: Y coordinates of all points
+        origin_x: Baseline origin X coordinates (one per baseline)
+        origin_y: Baseline origin Y coordinates (one per baseline)
+        azimuth: Baseline azimuths in degrees (0 = north, 90 = east)
+        profile_index: Baseline index of each point (e.g.
+            ``ProfileCollection.point_profile_index()``); may be omitted
+            when a single baseline is given as scalars
+
+    Returns:
+        Tuple of (cross_shore_distances, along_shore_distances); cross-shore
+        values equal ``calculate_point_profile_offset`` exactly
+
+    Raises:
+        BeachProfileError: If array lengths or the profile index are invalid
+    """
+    x_coords = np.asarray(x_coords, dtype=float)
+    y_coords = np.asarray(y_coords, dtype=float)
+    if x_coords.shape != y_coords.shape:
+        raise BeachProfileError(
+            f"Coordinate arrays must have same length: X={len(x_coords)}, Y={len(y_coords)}",
+            category=ErrorCategory.SPATIAL,
+        )
+
+    x0, y0, azimuth_rad = _baseline_terms(
+        len(x_coords), profile_index, origin_x, origin_y, azimuth
+    )
+    cos_a = np.cos(azimuth_rad)
+    sin_a = np.sin(azimuth_rad)
+
+    dx = x_coords - x0
+    dy = y_coords - y0
+    cross_shore = -dx * sin_a + dy * cos_a
+    along_shore = dx * cos_a + dy * sin_a
+    return cross_shore, along_shore
+
+
+def batch_convert_2d_to_3d(
+    cross_shore_distances: np.ndarray,
+    origin_x: np.ndarray | float,
+    origin_y: np.ndarray | float,
+    azimuth: np.ndarray | float,
+    profile_index: Optional[np.ndarray] = None,
+    along_shore_distances: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Place profile coordinates back into map coordinates in one operation.
+
+    Inverse of ``batch_convert_3d_to_2d``. Without along-shore distances
+    the points are placed on the baseline normal, exactly as
+    ``convert_2d_to_3d_profile`` does.
+
+    Args:
+        cross_shore_distances: Cross-shore distances of all points
+        origin_x: Baseline origin X coordinates (one per baseline)
+        origin_y: Baseline origin Y coordinates (one per baseline)
+        azimuth: Baseline azimuths in degrees (0 = north, 90 = east)
+        profile_index: Baseline index of each point; may be omitted when a
+            single baseline is given as scalars
+        along_shore_distances: Optional along-shore distances of all points
+
+    Returns:
+        Tuple of (x_coords, y_coords)
+
+    Raises:
+        BeachProfileError: If array lengths or the profile index are invalid
+    """
+    cross_shore_distances = np.asarray(cross_shore_distances, dtype=float)
+    x0, y0, azimuth_rad = _baseline_terms(
+        len(cross_shore_distances), profile_index, origin_x, origin_y, azimuth
+    )
+
+    # Cross-shore axis points along azimuth + 90°
+    x_coords = x0 + cross_shore_distances * np.cos(azimuth_rad + np.pi / 2)
+    y_coords = y0 + cross_shore_distances * np.sin(azimuth_rad + np.pi / 2)
+
+    if along_shore_distances is not None:
+        along_shore_distances = np.asarray(along_shore_distances, dtype=float)
+        if along_shore_distances.shape != cross_shore_distances.shape:
+            raise BeachProfileError(
+                f"Coordinate arrays must have same length: cross_shore={len(cross_shore_distances)}, along_shore={len(along_shore_distances)}",
+                category=ErrorCategory.SPATIAL,
+            )
+        x_coords = x_coords + along_shore_distances * np.cos(azimuth_rad)
+        y_coords = y_coords + along_shore_distances * np.sin(azimuth_rad)
+
+    return x_coords, y_coords
+
+
 def convert_3d_to_2d_profile(
     x_coords: np.ndarray,
     y_coords: np.ndarray,
@@ -106,11 +255,8 @@ def convert_3d_to_2d_profile(
         )
 
     # Calculate cross-shore distances for all points
-    cross_shore_distances = np.array(
-        [
-            calculate_point_profile_offset(origin_x, origin_y, azimuth, x, y)
-            for x, y in zip(x_coords, y_coords)
-        ]
+    cross_shore_distances, _ = batch_convert_3d_to_2d(
+        x_coords, y_coords, origin_x, origin_y, azimuth
     )
 
     return cross_shore_distances, z_coords
@@ -136,6 +282,30 @@ def transform_profile_to_2d(
     Raises:
         CoordinateTransformError: If profile doesn't have required 3D coordinates
     """
+    y_coords = _profile_y_coordinates(profile)
+
+    # Convert to 2D coordinates
+    cross_shore_distances, elevations = convert_3d_to_2d_profile(
+        profile.x, y_coords, profile.z, origin_x, origin_y, azimuth
+    )
+
+    return _build_2d_profile(
+        profile,
+        y_coords,
+        cross_shore_distances,
+        elevations,
+        origin_x,
+        origin_y,
+        azimuth,
+    )
+
+
+def _profile_y_coordinates(profile: Profile) -> np.ndarray:
+    """Return a profile's Y coordinates from metadata, validating them.
+
+    Raises:
+        BeachProfileError: If the profile has no matching Y coordinates
+    """
     # Check if profile has Y coordinates in metadata
     if not hasattr(profile, "metadata") or profile.metadata is None:
         raise BeachProfileError(
@@ -156,13 +326,21 @@ def transform_profile_to_2d(
             category=ErrorCategory.SPATIAL,
         )
 
-    # Convert to 2D coordinates
-    cross_shore_distances, elevations = convert_3d_to_2d_profile(
-        profile.x, y_coords, profile.z, origin_x, origin_y, azimuth
-    )
+    return y_coords
+
 
+def _build_2d_profile(
+    profile: Profile,
+    y_coords: np.ndarray,
+    cross_shore_distances: np.ndarray,
+    elevations: np.ndarray,
+    origin_x: float,
+    origin_y: float,
+    azimuth: float,
+) -> Profile:
+    """Create the 2D Profile for transformed coordinates of a 3D profile."""
     # Create new profile with 2D coordinates
-    new_metadata = profile.metadata.copy()
+    new_metadata = dict(profile.metadata or {})
     new_metadata["original_3d_coords"] = {
         "x": profile.x.copy(),
         "y": y_coords.copy(),
@@ -269,11 +447,8 @@ def estimate_profile_baseline(
 
     # Find origin as the point with minimum cross-shore distance
     # (assuming the profile extends seaward from the origin)
-    cross_shore_distances = np.array(
-        [
-            calculate_point_profile_offset(x_mean, y_mean, azimuth, x, y)
-            for x, y in zip(x_coords, y_coords)
-        ]
+    cross_shore_distances, _ = batch_convert_3d_to_2d(
+        x_coords, y_coords, x_mean, y_mean, azimuth
     )
 
     min_distance_idx = np.argmin(cross_shore_distances)
@@ -283,6 +458,78 @@ def estimate_profile_baseline(
     return origin_x, origin_y, azimuth
 
 
+def batch_estimate_profile_baselines(
+    x_coords: np.ndarray,
+    y_coords: np.ndarray,
+    profile_index: np.ndarray,
+    n_profiles: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Estimate the baselines of many point groups at once.
+
+    Batched form of ``estimate_profile_baseline``: per-group covariance
+    matrices are accumulated with ``np.bincount``, all principal components
+    come from one stacked eigen decomposition, and origins are found with a
+    single cross-shore projection of every point.
+
+    Args:
+        x_coords: X coordinates of all points
+        y_coords: Y coordinates of all points
+        profile_index: Group (profile) index of each point, 0-based
+        n_profiles: Number of groups (defaults to ``max(profile_index) + 1``)
+
+    Returns:
+        Tuple of (origin_x, origin_y, azimuth) arrays with one entry per
+        group. Groups with fewer than two points have a NaN azimuth; their
+        origin is their first point (NaN for empty groups).
+    """
+    x_coords = np.asarray(x_coords, dtype=float)
+    y_coords = np.asarray(y_coords, dtype=float)
+    index = np.asarray(profile_index, dtype=np.intp)
+    if n_profiles is None:
+        n_profiles = int(index.max()) + 1 if len(index) else 0
+
+    counts = np.bincount(index, minlength=n_profiles)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = np.bincount(index, x_coords, n_profiles) / counts
+        y_mean = np.bincount(index, y_coords, n_profiles) / counts
+        dx = x_coords - x_mean[index]
+        dy = y_coords - y_mean[index]
+        cov = np.empty((n_profiles, 2, 2))
+        cov[:, 0, 0] = np.bincount(index, dx * dx, n_profiles) / (counts - 1)
+        cov[:, 1, 1] = np.bincount(index, dy * dy, n_profiles) / (counts - 1)
+        cov[:, 0, 1] = cov[:, 1, 0] = np.bincount(
+            index, dx * dy, n_profiles
+        ) / (counts - 1)
+
+    # Principal component (direction of maximum variance) of each group
+    azimuth = np.full(n_profiles, np.nan)
+    valid = (counts >= 2) & np.isfinite(cov).all(axis=(1, 2))
+    if valid.any():
+        eigenvalues, eigenvectors = np.linalg.eig(cov[valid])
+        principal = np.argmax(eigenvalues.real, axis=1)
+        components = eigenvectors.real[np.arange(len(principal)), :, principal]
+        # atan2(dx, dy) gives angle from north
+        azimuth[valid] = np.degrees(
+            np.arctan2(components[:, 0], components[:, 1])
+        )
+        azimuth[azimuth < 0] += 360
+
+    # Origin: point with minimum cross-shore distance in each group
+    cross_shore, _ = batch_convert_3d_to_2d(
+        x_coords, y_coords, x_mean, y_mean, azimuth, profile_index=index
+    )
+    cross_shore[np.isnan(cross_shore)] = np.inf
+    order = np.lexsort((cross_shore, index))
+    first = np.searchsorted(index[order], np.arange(n_profiles))
+    origin_x = np.full(n_profiles, np.nan)
+    origin_y = np.full(n_profiles, np.nan)
+    present = counts > 0
+    origin_x[present] = x_coords[order[first[present]]]
+    origin_y[present] = y_coords[order[first[present]]]
+
+    return origin_x, origin_y, azimuth
+
+
 def load_profile_baselines(
     baseline_file_path: str,
 ) -> dict[str, dict[str, float]]:
@@ -306,11 +553,16 @@ def load_profile_baselines(
         )
 
     baselines = {}
-    for _, row in df.iterrows():
-        baselines[row["profile_name"]] = {
-            "x0": float(row["x0"]),
-            "y0": float(row["y0"]),
-            "azimuth": float(row["azimuth"]),
+    for name, x0, y0, azimuth in zip(
+        df["profile_name"].tolist(),
+        df["x0"].tolist(),
+        df["y0"].tolist(),
+        df["azimuth"].tolist(),
+    ):
+        baselines[name] = {
+            "x0": float(x0),
+            "y0": float(y0),
+            "azimuth": float(azimuth),
         }
 
     return baselines
@@ -340,25 +592,54 @@ def transform_profiles_with_baselines(
             cannot be read.
     """
     baselines = load_profile_baselines(baseline_file_path)
-    transformed_profiles = []
+    logger = get_logger(LogComponent.SPATIAL)
 
+    # Collect the profiles that have a baseline and valid 3D coordinates
+    selected = []
     for profile in profiles:
         baseline = baselines.get(profile.name)
         if baseline is None:
-            logger = get_logger(LogComponent.SPATIAL)
             logger.warning(
                 f"No baseline found for profile {profile.name}, skipping transformation"
             )
             continue
 
         try:
-            transformed = transform_profile_to_2d(
-                profile, baseline["x0"], baseline["y0"], baseline["azimuth"]
-            )
-            transformed_profiles.append(transformed)
+            y_coords = _profile_y_coordinates(profile)
         except Exception as e:
-            logger = get_logger(LogComponent.SPATIAL)
             logger.error(f"Failed to transform profile {profile.name}: {e}")
+            continue
+        selected.append((profile, y_coords, baseline))
+
+    if not selected:
+        return []
+
+    # Project every point against its own baseline in one operation
+    counts = [len(profile.x) for profile, _, _ in selected]
+    cross_shore, _ = batch_convert_3d_to_2d(
+        np.concatenate([np.asarray(p.x, dtype=float) for p, _, _ in selected]),
+        np.concatenate([np.asarray(y, dtype=float) for _, y, _ in selected]),
+        np.asarray([b["x0"] for _, _, b in selected], dtype=float),
+        np.asarray([b["y0"] for _, _, b in selected], dtype=float),
+        np.asarray([b["azimuth"] for _, _, b in selected], dtype=float),
+        profile_index=np.repeat(np.arange(len(selected)), counts),
+    )
+
+    transformed_profiles = []
+    for (profile, y_coords, baseline), distances in zip(
+        selected, np.split(cross_shore, np.cumsum(counts)[:-1])
+    ):
+        transformed_profiles.append(
+            _build_2d_profile(
+                profile,
+                y_coords,
+                distances,
+                profile.z,
+                baseline["x0"],
+                baseline["y0"],
+                baseline["azimuth"],
+            )
+        )
 
     return transformed_profiles
 
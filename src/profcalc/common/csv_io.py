@@ -13,10 +13,11 @@ Supported CSV structures:
 - Support for various delimiters and quote characters
 """
 
+import itertools
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional
 
 import numpy as np
 import pandas as pd
@@ -29,12 +30,22 @@ from .error_handler import (
     LogComponent,
     get_logger,
 )
-from .file_parser import ParsedFile
+from .file_parser import (
+    BMAPColumns,
+    CSVColumns,
+    ParsedFile,
+    iter_column_profiles,
+)
 from .file_parser import parse_file as parse_file_centralized
+from .parse_cache import read_through_cache
+from .transect_index import TransectIndex
 
 # Type alias: mapping values may be a column name (str) or a list of extra column names
 ColumnMapping = dict[str, str | list[str]]
 
+# Number of points (lines) read per block from XYZ files
+XYZ_CHUNK_SIZE = 250_000
+
 
 class CSVImportError(Exception):
     """Exception raised when CSV import operations fail.
@@ -323,10 +334,11 @@ class CSVParser:
         try:
             # Extract metadata
             metadata: dict[str, Any] = {}
+            survey_date_str: Any = None
             if "survey_date" in column_mapping and isinstance(
                 column_mapping["survey_date"], str
             ):
-                survey_date_str: Any = df[column_mapping["survey_date"]].iloc[
+                survey_date_str = df[column_mapping["survey_date"]].iloc[
                     0
                 ]  # type: ignore
                 if pd.notna(survey_date_str):  # type: ignore
@@ -353,55 +365,62 @@ class CSVParser:
             else:
                 extra_column_names = []
 
-            # Collect coordinate arrays and extra data
-            x_coords = []
-            y_coords = []
-            z_coords = []
-            extra_data: list[list] = []
+            # Convert coordinate columns in bulk (same rules as _parse_point)
+            x_col = column_mapping.get("x")
+            y_col = column_mapping.get("y")
+            z_col = column_mapping.get("z")
+            coord_cols = [x_col, y_col]
+            if isinstance(z_col, str):
+                coord_cols.append(z_col)
+            if not all(
+                isinstance(col, str) and col in df.columns
+                for col in coord_cols
+            ):
+                self.logger.warning(
+                    f"No valid points found for profile {profile_id}: "
+                    "coordinate columns missing"
+                )
+                return None
 
-            for row_num, (idx, row) in enumerate(df.iterrows()):
-                try:
-                    point = self._parse_point(row, column_mapping, row_num + 1)
-                    if point:
-                        x_coords.append(point["x"])
-                        y_coords.append(point["y"])
-                        z_coords.append(point["z"])
-
-                        # Collect extra columns
-                        if extra_column_names:
-                            extra_values: list = []
-                            for col_name in extra_column_names:
-                                # row.get works with Pandas Series
-                                # Removed unused variable `extra_value`
-                                # Ensure val is a scalar if it's a Series
-                                if isinstance(val, pd.Series):
-                                    val = val.iloc[0] if len(val) > 0 else None
-                                if pd.notna(val):  # type: ignore
-                                    # Try to convert to float, otherwise keep as string
-                                    try:
-                                        extra_values.append(float(val))
-                                    except (ValueError, TypeError):
-                                        extra_values.append(str(val))
-                                else:
-                                    extra_values.append(None)
-                            extra_data.append(extra_values)
-
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(
-                        f"Skipping invalid point at row {idx}: {e}"
-                    )
-                    continue
+            x_all, x_ok = self._coordinate_column(df[x_col])
+            y_all, y_ok = self._coordinate_column(df[y_col])
+            if isinstance(z_col, str):
+                z_all, z_ok = self._coordinate_column(df[z_col])
+            else:
+                z_all, z_ok = np.zeros(len(df)), np.ones(len(df), dtype=bool)
+
+            valid = x_ok & y_ok & z_ok
+            for idx in df.index[~valid]:
+                self.logger.warning(
+                    f"Skipping invalid point at row {idx}: "
+                    "invalid coordinate data"
+                )
 
-            if not x_coords:
+            if not valid.any():
                 self.logger.warning(
                     f"No valid points found for profile {profile_id}"
                 )
                 return None
 
-            # Validate coordinate arrays
-            x_array = np.array(x_coords, dtype=float)
-            z_array = np.array(z_coords, dtype=float)
+            x_array = x_all[valid]
+            y_coords = y_all[valid]
+            z_array = z_all[valid]
 
+            # Collect extra columns for the valid rows
+            extra_data: list[list] = []
+            if extra_column_names:
+                extra_columns = [
+                    [
+                        self._extra_value(value)
+                        for value in df[col_name].to_numpy()[valid].tolist()
+                    ]
+                    if col_name in df.columns
+                    else [None] * len(x_array)
+                    for col_name in extra_column_names
+                ]
+                extra_data = [list(row) for row in zip(*extra_columns)]
+
+            # Validate coordinate arrays
             x_validation = validate_array_properties(
                 x_array, "x_coordinates", allow_nan=False
             )
@@ -429,7 +448,7 @@ class CSVParser:
                 description = "; ".join(desc_parts)
 
             # Add y_coords to metadata
-            metadata["y_coordinates"] = np.array(y_coords, dtype=float)
+            metadata["y_coordinates"] = y_coords
 
             # Add extra columns to metadata if present
             if extra_column_names and extra_data:
@@ -453,6 +472,46 @@ class CSVParser:
             self.logger.error(f"Failed to parse profile {profile_id}: {e}")
             return None
 
+    @staticmethod
+    def _coordinate_column(
+        column: pd.Series,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Convert a coordinate column to floats following ``_parse_point``.
+
+        Missing values become 0.0; values that cannot be converted are
+        marked invalid.
+
+        Args:
+            column: Column of a profile DataFrame
+
+        Returns:
+            Tuple of (float values, validity mask)
+        """
+        if pd.api.types.is_numeric_dtype(column):
+            values = column.to_numpy(dtype=float, na_value=0.0)
+            return values, np.ones(len(values), dtype=bool)
+
+        values = np.zeros(len(column))
+        valid = np.ones(len(column), dtype=bool)
+        for i, value in enumerate(column.tolist()):
+            if pd.isna(value):
+                continue
+            try:
+                values[i] = float(value)
+            except (ValueError, TypeError):
+                valid[i] = False
+        return values, valid
+
+    @staticmethod
+    def _extra_value(value: Any) -> Any:
+        """Convert an extra column value (float if possible, else str)."""
+        if pd.isna(value):
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return str(value)
+
     def _parse_point(
         self, row: pd.Series, column_mapping: ColumnMapping, row_idx: int
     ) -> dict[str, Any] | None:
@@ -613,6 +672,33 @@ def _convert_parsed_file_to_profiles(parsed_file: ParsedFile) -> List[Profile]:
     return profiles
 
 
+def _convert_columns_to_profiles(
+    columns: BMAPColumns | CSVColumns,
+) -> List[Profile]:
+    """Convert columnar parse output to the legacy Profile format.
+
+    Equivalent to ``_convert_parsed_file_to_profiles`` for the same file:
+    profiles without coordinates, or whose coordinates fail validation,
+    are dropped. Each profile's arrays are views into the shared columns.
+
+    Args:
+        columns: BMAPColumns or CSVColumns from the centralized parser.
+
+    Returns:
+        List of Profile objects with coordinate arrays.
+    """
+    return [
+        Profile(
+            name=profile_dict.get("profile_id", "UNKNOWN"),
+            date=profile_dict.get("date"),
+            description=profile_dict.get("purpose") or None,
+            x=x,
+            z=z,
+        )
+        for profile_dict, x, z in iter_column_profiles(columns, validate=True)
+    ]
+
+
 def read_csv_profiles(
     file_path: str | Path, config: dict[str, Any] | None = None
 ) -> List[Profile]:
@@ -633,14 +719,21 @@ def read_csv_profiles(
     Note:
         This function uses the centralized format detection and parsing system
         for robust handling of various CSV formats and automatic column detection.
+        Results are served from the parse cache when it is enabled.
     """
-    # Use the centralized parser
-    parsed_file = parse_file_centralized(
-        Path(file_path), skip_confirmation=True
-    )
 
-    # Convert to legacy Profile format
-    return _convert_parsed_file_to_profiles(parsed_file)
+    def parse() -> List[Profile]:
+        # Use the centralized parser
+        parsed_file = parse_file_centralized(
+            Path(file_path), skip_confirmation=True, columnar=True
+        )
+
+        # Convert to legacy Profile format
+        if parsed_file.columns is not None:
+            return _convert_columns_to_profiles(parsed_file.columns)
+        return _convert_parsed_file_to_profiles(parsed_file)
+
+    return read_through_cache("csv", file_path, parse, options=config)
 
 
 def write_csv_profiles(
@@ -808,73 +901,144 @@ def read_xyz_profiles(
 
     Raises:
         BeachProfileError: If reading or assignment fails
+
+    Note:
+        Results are served from the parse cache when it is enabled; the
+        origin azimuth file is part of the cache key.
     """
-    try:
-        # Read XYZ file (whitespace separated, no header)
-        df = pd.read_csv(
-            file_path,
-            sep=r"\s+",
-            header=None,
-            names=["x", "y", "z"],
-            engine="python",
-        )
+    return read_through_cache(
+        "xyz",
+        file_path,
+        lambda: _read_xyz_profiles_uncached(
+            file_path, origin_azimuth_file, tolerance_ft
+        ),
+        options={"tolerance_ft": tolerance_ft},
+        dependencies=[origin_azimuth_file],
+    )
 
-        # Validate basic structure
-        if len(df.columns) != 3 or not all(
-            col in df.columns for col in ["x", "y", "z"]
-        ):
-            raise BeachProfileError(
-                f"XYZ file must have exactly 3 columns (X, Y, Z), found: {list(df.columns)}",
-                category=ErrorCategory.VALIDATION,
-            )
 
-        # Check for missing values
-        if df.isnull().any().any():
-            null_counts = df.isnull().sum()
-            null_rows = df[df.isnull().any(axis=1)]
-            raise BeachProfileError(
-                f"XYZ file contains missing values - all points must have valid X, Y, Z coordinates. "
-                f"Null counts by column: {null_counts.to_dict()}. "
-                f"First few rows with nulls: {null_rows.head(3).to_string() if len(null_rows) > 0 else 'None'}",
-                category=ErrorCategory.VALIDATION,
-            )
+def iter_xyz_chunks(
+    file_path: str | Path, chunksize: int = XYZ_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Stream an XYZ point file in blocks of at most ``chunksize`` points.
 
-        # Load profile baselines
-        origin_azimuths_df = _load_profile_origin_azimuths(origin_azimuth_file)
+    Only one block is held in memory at a time, so arbitrarily large point
+    files can be processed with bounded memory. Values are parsed exactly
+    (``float()`` semantics) by the pandas C parser.
 
-        # Assign points to profiles
-        assigned_df = _assign_points_to_profiles_by_distance(
-            df, origin_azimuths_df, tolerance_ft
-        )
+    Args:
+        file_path: Path to the XYZ file (whitespace-separated, no header,
+            3 columns: X Y Z)
+        chunksize: Maximum number of points per block
+
+    Yields:
+        DataFrames with columns ``x``, ``y`` and ``z``; the index
+        continues across blocks (it is the 0-based point number)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        pandas.errors.EmptyDataError: If the file is empty
+        BeachProfileError: If a block contains missing values
+    """
+    reader = pd.read_csv(
+        file_path,
+        sep=r"\s+",
+        header=None,
+        names=["x", "y", "z"],
+        engine="c",
+        float_precision="round_trip",
+        chunksize=chunksize,
+    )
+    with reader:
+        for chunk in reader:
+            # Check for missing values
+            if chunk.isnull().any().any():
+                null_counts = chunk.isnull().sum()
+                null_rows = chunk[chunk.isnull().any(axis=1)]
+                raise BeachProfileError(
+                    f"XYZ file contains missing values - all points must have valid X, Y, Z coordinates. "
+                    f"Null counts by column: {null_counts.to_dict()}. "
+                    f"First few rows with nulls: {null_rows.head(3).to_string() if len(null_rows) > 0 else 'None'}",
+                    category=ErrorCategory.VALIDATION,
+                )
+            yield chunk
+
+
+def _read_xyz_profiles_uncached(
+    file_path: str | Path,
+    origin_azimuth_file: str | Path,
+    tolerance_ft: float,
+    chunksize: int = XYZ_CHUNK_SIZE,
+) -> List[Profile]:
+    """Read and assign XYZ points without consulting the parse cache.
+
+    Points are read and assigned one block at a time; only the assigned
+    points of each profile are kept between blocks.
+    """
+    try:
+        chunks = iter_xyz_chunks(file_path, chunksize)
+        first_chunk = next(chunks, None)
+
+        # Load profile baselines and index them once for all blocks
+        origin_azimuths_df = load_profile_origin_azimuths(origin_azimuth_file)
+        transect_index = TransectIndex.from_dataframe(origin_azimuths_df)
+
+        # Assign each block and collect the assigned points per profile
+        total_count = 0
+        assigned_count = 0
+        assigned_blocks: dict[Any, list[tuple[np.ndarray, ...]]] = {}
+        if first_chunk is not None:
+            for chunk in itertools.chain([first_chunk], chunks):
+                total_count += len(chunk)
+                assigned_df = _assign_points_to_profiles_by_distance(
+                    chunk,
+                    origin_azimuths_df,
+                    tolerance_ft,
+                    log_unassigned=False,
+                    transect_index=transect_index,
+                )
+                assigned_count += len(assigned_df)
+                for profile_id, group in assigned_df.groupby(
+                    "profile_id", sort=False
+                ):
+                    assigned_blocks.setdefault(profile_id, []).append(
+                        (
+                            group["x"].to_numpy(dtype=float),
+                            group["y"].to_numpy(dtype=float),
+                            group["z"].to_numpy(dtype=float),
+                        )
+                    )
 
-        # Group by profile and create Profile objects
+        # Create Profile objects (profiles in sorted ID order, as groupby)
         profiles = []
-        for profile_id, group in assigned_df.groupby("profile_id"):
+        for profile_id in sorted(assigned_blocks):
+            blocks = assigned_blocks.pop(profile_id)
+            x, y, z = (np.concatenate(column) for column in zip(*blocks))
+
             # Sort by X coordinate for consistent ordering
-            group = group.sort_values("x")
+            order = np.argsort(x, kind="quicksort")
 
             # Create Profile object
             profile = Profile(
                 name=str(profile_id),
                 date=datetime.now().strftime("%Y-%m-%d"),
                 description=f"Profile assigned from XYZ data within {tolerance_ft} ft tolerance",
-                x=np.array(group["x"].values, dtype=float),
-                z=np.array(group["z"].values, dtype=float),
+                x=x[order],
+                z=z[order],
                 metadata={
-                    "y_coordinates": np.array(group["y"].values, dtype=float),
+                    "y_coordinates": y[order],
                     "source_file": str(file_path),
                     "assignment_method": "perpendicular_distance",
                     "tolerance_ft": tolerance_ft,
                     "origin_azimuth_file": str(origin_azimuth_file),
-                    "point_count": len(group),
+                    "point_count": len(x),
                 },
             )
             profiles.append(profile)
 
         # Log summary
         logger = get_logger(LogComponent.FILE_IO)
-        assigned_count = len(assigned_df)
-        unassigned_count = len(df) - assigned_count
+        unassigned_count = total_count - assigned_count
 
         logger.info(
             f"XYZ profile assignment complete: {len(profiles)} profiles created, "
@@ -912,23 +1076,28 @@ def read_xyz_profiles(
         ) from e
 
 
-def _load_profile_origin_azimuths(
+def load_profile_origin_azimuths(
     origin_azimuth_file: str | Path,
 ) -> pd.DataFrame:
     """Load profile origin azimuth data from a CSV file.
 
+    Accepts the origin/azimuth file or the profile network file; common
+    column name variants (e.g. ``profile_name``, ``x0``/``y0``) are
+    recognised.
+
     Args:
         origin_azimuth_file: Path to the origin azimuth CSV file
 
     Returns:
-        DataFrame with origin azimuth profile data
+        DataFrame with origin azimuth profile data, with columns renamed to
+        ``profile_id``, ``azimuth``, ``origin_x`` and ``origin_y``
 
     Raises:
         BeachProfileError: If loading fails
     """
     try:
-        # Read origin azimuth data
-        df = pd.read_csv(origin_azimuth_file)
+        # Read origin azimuth data (coordinates may use thousands separators)
+        df = pd.read_csv(origin_azimuth_file, thousands=",")
 
         # Handle different possible column name formats
         column_mapping = {}
@@ -982,61 +1151,94 @@ def _load_profile_origin_azimuths(
         ) from e
 
 
+
+def load_network_columns(
+    csv_path: str | Path,
+    columns: Mapping[str, str],
+    name_column: str = "profile_name",
+) -> Dict[str, pd.Series]:
+    """Read per-line values from the profile network file.
+
+    Shared by the tools that take breakpoint elevations or volume limits
+    from a column of ``beach_profile_network.csv`` (e.g. ``MHW_Elev``).
+
+    Args:
+        csv_path: Network CSV with one row per profile line
+        columns: Mapping of value name to CSV column, e.g.
+            ``{"MHW": "MHW_Elev", "closure": "ClosureDep"}``
+        name_column: Column with the profile line names
+
+    Returns:
+        Dict mapping each value name to a float Series indexed by line name
+        (NaN where the value is blank or not numeric)
+
+    Raises:
+        ValueError: If a requested column is missing from the file
+    """
+    table = pd.read_csv(csv_path, encoding="utf-8-sig", thousands=",")
+    missing = [
+        col for col in [name_column, *columns.values()] if col not in table
+    ]
+    if missing:
+        raise ValueError(f"Network file missing required columns: {missing}")
+    table = table.drop_duplicates(name_column).set_index(name_column)
+    return {
+        name: pd.to_numeric(table[col], errors="coerce").astype(float)
+        for name, col in columns.items()
+    }
+
+
 def _assign_points_to_profiles_by_distance(
     points_df: pd.DataFrame,
     origin_azimuths_df: pd.DataFrame,
     tolerance_ft: float,
+    log_unassigned: bool = True,
+    transect_index: Optional[TransectIndex] = None,
 ) -> pd.DataFrame:
     """Assign survey points to profiles based on perpendicular distance to origin azimuths.
 
+    Each point goes to the nearest transect (origin and azimuth line); the
+    search uses a spatial index of the transects and runs on whole arrays.
+
     Args:
         points_df: DataFrame with points (x, y, z)
         origin_azimuths_df: DataFrame with profile origin azimuths (profile_id, azimuth, origin_x, origin_y)
         tolerance_ft: Maximum distance in feet for assigning points to profiles
+        log_unassigned: If True, log a warning when points are left
+            unassigned (callers assigning in blocks log a single summary)
+        transect_index: Prebuilt index of ``origin_azimuths_df`` (built on
+            demand if omitted; pass one when assigning many blocks)
 
     Returns:
-        DataFrame with points and assigned profile_id
+        DataFrame with points, assigned profile_id and signed
+        perpendicular profile_offset
 
     Raises:
         BeachProfileError: If assignment fails
     """
-    from .coordinate_transforms import calculate_point_profile_offset
-
     tolerance_m = tolerance_ft * 0.3048  # Convert feet to meters
-    assigned_profile_ids = []
-
-    for _, point in points_df.iterrows():
-        min_distance = float("inf")
-        best_profile = None
-
-        # Find the profile with minimum perpendicular distance
-        for _, origin_azimuth in origin_azimuths_df.iterrows():
-            distance = calculate_point_profile_offset(
-                origin_azimuth["origin_x"],
-                origin_azimuth["origin_y"],
-                origin_azimuth["azimuth"],
-                point["x"],
-                point["y"],
-            )
-            if distance < min_distance:
-                min_distance = distance
-                best_profile = origin_azimuth["profile_id"]
 
-        # Assign if within tolerance
-        if min_distance <= tolerance_m:
-            assigned_profile_ids.append(best_profile)
-        else:
-            assigned_profile_ids.append(None)  # Unassigned
+    if transect_index is None:
+        transect_index = TransectIndex.from_dataframe(origin_azimuths_df)
+    nearest, offsets = transect_index.nearest(
+        points_df["x"].to_numpy(dtype=float),
+        points_df["y"].to_numpy(dtype=float),
+        tolerance_m,
+    )
+    assigned_profile_ids = np.where(
+        nearest >= 0, transect_index.profile_ids[nearest], np.nan
+    )
 
     points_df = points_df.copy()
     points_df["profile_id"] = assigned_profile_ids
+    points_df["profile_offset"] = offsets
 
     # Remove unassigned points
     assigned_df = points_df.dropna(subset=["profile_id"])
 
     # Log unassigned points
     unassigned_count = len(points_df) - len(assigned_df)
-    if unassigned_count > 0:
+    if log_unassigned and unassigned_count > 0:
         logger = get_logger(LogComponent.FILE_IO)
         logger.warning(
             f"{unassigned_count} points could not be assigned to any profile within {tolerance_ft} ft tolerance",
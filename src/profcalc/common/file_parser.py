@@ -8,13 +8,19 @@ This module provides centralized file parsing that handles:
 All parsers return standardized data structures for downstream processing.
 """
 
+import csv
+from io import StringIO
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Union
 
+import numpy as np
+import pandas as pd
+
+from .data_validation import validate_array_properties
 from .format_detection import (
+    DetectedFile,
     FormatDetectionResult,
     detect_csv_has_header,
-    detect_file_format_detailed,
     get_format_description,
 )
 
@@ -30,6 +36,8 @@ class ParsedFile:
         has_header: Whether delimited file has header row(s)
         column_mapping: Mapping of column names to indices
         delimiter: Delimiter character used (for CSV files)
+        columns: Columnar coordinate storage (files parsed with
+            ``columnar=True``); profile dicts then carry no "coordinates"
     """
 
     def __init__(
@@ -40,6 +48,7 @@ class ParsedFile:
         has_header: bool = False,
         column_mapping: Optional[dict[str, int]] = None,
         delimiter: str = ",",
+        columns: Optional[Union["BMAPColumns", "CSVColumns"]] = None,
     ):
         self.format_type = format_type
         self.profiles = profiles
@@ -47,6 +56,7 @@ class ParsedFile:
         self.has_header = has_header
         self.column_mapping = column_mapping or {}
         self.delimiter = delimiter
+        self.columns = columns
 
     def __repr__(self) -> str:
         return (
@@ -56,13 +66,210 @@ class ParsedFile:
         )
 
 
-def parse_file(file_path: Path, skip_confirmation: bool = False) -> ParsedFile:
+class BMAPColumns:
+    """
+    Columnar storage for the coordinates of a BMAP free format file.
+
+    All coordinate pairs of the file live in two contiguous float64 arrays.
+    Profile ``i`` owns the slice ``offsets[i]:offsets[i + 1]`` of both
+    arrays, so per-profile access is a zero-copy view.
+
+    Attributes:
+        x: Concatenated X (cross-shore) values for all profiles
+        y: Concatenated second column values (elevation for BMAP files)
+        offsets: Profile boundaries into ``x``/``y`` (length n_profiles + 1)
+        headers: Parsed header dicts (profile_id, date, purpose, raw_header)
+        declared_counts: Point counts as written in the file
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        offsets: np.ndarray,
+        headers: list[dict[str, Any]],
+        declared_counts: np.ndarray,
+    ):
+        self.x = x
+        self.y = y
+        self.offsets = offsets
+        self.headers = headers
+        self.declared_counts = declared_counts
+
+    def __len__(self) -> int:
+        return len(self.headers)
+
+    def __repr__(self) -> str:
+        return f"BMAPColumns(profiles={len(self)}, points={len(self.x)})"
+
+    @property
+    def actual_counts(self) -> np.ndarray:
+        """Number of coordinate pairs actually read for each profile."""
+        return np.diff(self.offsets)
+
+    def profile_arrays(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return (x, y) views for one profile."""
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return self.x[start:stop], self.y[start:stop]
+
+    def to_profile_dicts(
+        self, include_coordinates: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Build the per-profile dictionaries used by ``ParsedFile.profiles``.
+
+        Args:
+            include_coordinates: If True, add the legacy ``coordinates`` list
+                of ``{"x": ..., "y": ...}`` dicts to each profile
+
+        Returns:
+            List of profile dictionaries in file order
+        """
+        profiles: list[dict[str, Any]] = []
+        actual = self.actual_counts
+        for i, header in enumerate(self.headers):
+            profile_data = dict(header)
+            profile_data["point_count"] = int(self.declared_counts[i])
+            profile_data["actual_point_count"] = int(actual[i])
+            if include_coordinates:
+                xs, ys = self.profile_arrays(i)
+                profile_data["coordinates"] = [
+                    {"x": x, "y": y} for x, y in zip(xs.tolist(), ys.tolist())
+                ]
+            profiles.append(profile_data)
+        return profiles
+
+
+class CSVColumns:
+    """
+    Columnar storage for the coordinates of a delimited (CSV) file.
+
+    Rows are grouped by profile ID in order of first appearance, keeping
+    file order within each profile. Profile ``i`` owns the slice
+    ``offsets[i]:offsets[i + 1]`` of the coordinate arrays.
+
+    Attributes:
+        x: Concatenated X values for all profiles
+        y: Concatenated Y values for all profiles
+        z: Concatenated elevations; rows without a Z value use Y, matching
+            the legacy profile conversion
+        offsets: Profile boundaries into the arrays (length n_profiles + 1)
+        profile_ids: Profile IDs in order of first appearance (profiles
+            without valid coordinates are kept with zero points)
+        dates: Date of each profile (first non-empty DATE value), or None
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray,
+        offsets: np.ndarray,
+        profile_ids: list[str],
+        dates: list[Optional[str]],
+    ):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.offsets = offsets
+        self.profile_ids = profile_ids
+        self.dates = dates
+
+    def __len__(self) -> int:
+        return len(self.profile_ids)
+
+    def __repr__(self) -> str:
+        return f"CSVColumns(profiles={len(self)}, points={len(self.x)})"
+
+    @property
+    def actual_counts(self) -> np.ndarray:
+        """Number of valid coordinate rows for each profile."""
+        return np.diff(self.offsets)
+
+    def profile_arrays(
+        self, index: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (x, y, z) views for one profile."""
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return (
+            self.x[start:stop],
+            self.y[start:stop],
+            self.z[start:stop],
+        )
+
+    def to_profile_dicts(
+        self, include_coordinates: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Build the per-profile dictionaries used by ``ParsedFile.profiles``.
+
+        Args:
+            include_coordinates: If True, add a ``coordinates`` list of
+                ``{"x": ..., "y": ..., "z": ...}`` dicts to each profile
+
+        Returns:
+            List of profile dictionaries in order of first appearance
+        """
+        profiles: list[dict[str, Any]] = []
+        actual = self.actual_counts.tolist()
+        for i, profile_id in enumerate(self.profile_ids):
+            profile_data: dict[str, Any] = {
+                "profile_id": profile_id,
+                "date": self.dates[i],
+                "point_count": actual[i],
+                "actual_point_count": actual[i],
+            }
+            if include_coordinates:
+                xs, ys, zs = self.profile_arrays(i)
+                profile_data["coordinates"] = [
+                    {"x": x, "y": y, "z": z}
+                    for x, y, z in zip(xs.tolist(), ys.tolist(), zs.tolist())
+                ]
+            profiles.append(profile_data)
+        return profiles
+
+
+def iter_column_profiles(
+    columns: Union[BMAPColumns, CSVColumns], validate: bool = False
+) -> Iterator[tuple[dict[str, Any], np.ndarray, np.ndarray]]:
+    """
+    Yield ``(profile_dict, x, z)`` for each profile that has coordinates.
+
+    Elevation is the last column: ``y`` for BMAP files, ``z`` for
+    delimited files. The arrays are views into the shared columns.
+
+    Args:
+        columns: BMAPColumns or CSVColumns from the centralized parser
+        validate: If True, also skip profiles whose coordinates fail
+            ``validate_array_properties`` (e.g. contain NaN)
+
+    Yields:
+        Profile dictionary (without coordinates), x array, z array
+    """
+    for i, profile_dict in enumerate(columns.to_profile_dicts(False)):
+        arrays = columns.profile_arrays(i)
+        x, z = arrays[0], arrays[-1]
+        if len(x) == 0:
+            continue
+        if validate and (
+            validate_array_properties(x, "x_coordinates", allow_nan=False)
+            or validate_array_properties(z, "z_coordinates", allow_nan=False)
+        ):
+            continue
+        yield profile_dict, x, z
+
+
+def parse_file(
+    file_path: Path, skip_confirmation: bool = False, columnar: bool = False
+) -> ParsedFile:
     """
     Parse a file and return standardized data structure.
 
     Args:
         file_path: Path to file to parse
         skip_confirmation: If False, will prompt user to confirm detected format
+        columnar: If True, coordinates are returned in
+            ``ParsedFile.columns`` instead of per-point dicts
 
     Returns:
         ParsedFile object with structured data
@@ -71,53 +278,37 @@ def parse_file(file_path: Path, skip_confirmation: bool = False) -> ParsedFile:
         ValueError: If file format is unknown or parsing fails
         FileNotFoundError: If file does not exist
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    # Detect format with detailed analysis
-    detection_result = detect_file_format_detailed(file_path)
-
-    if detection_result.format_type == "unknown":
-        error_msg = f"Cannot determine file format for: {file_path}\n"
-        error_msg += "Supported formats: BMAP free format, CSV (automatic column detection)\n"
-        if detection_result.warnings:
-            error_msg += f"Warnings: {', '.join(detection_result.warnings)}"
-        raise ValueError(error_msg)
-
-    # Show detection summary and get user confirmation (unless skipped)
-    if not skip_confirmation:
-        confirmed = _confirm_format_detection(detection_result, file_path)
-        if not confirmed:
-            raise ValueError("Format detection cancelled by user")
-
-    # Read file lines (try multiple encodings)
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = [line.rstrip("\n\r") for line in f.readlines()]
-    except UnicodeDecodeError:
-        # Try with different encodings if UTF-8 fails
-        for encoding in [
-            "utf-16",
-            "utf-16-le",
-            "utf-16-be",
-            "latin-1",
-            "cp1252",
-        ]:
-            try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    lines = [line.rstrip("\n\r") for line in f.readlines()]
-                break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-        else:
-            raise ValueError("Unable to read file with standard encodings")
+    # Open once: detection samples the prefix and the parser reuses the
+    # same decoded stream
+    with DetectedFile(file_path) as detected:
+        detection_result = detected.result
+
+        if detection_result.format_type == "unknown":
+            error_msg = f"Cannot determine file format for: {file_path}\n"
+            error_msg += "Supported formats: BMAP free format, CSV (automatic column detection)\n"
+            if detection_result.warnings:
+                error_msg += (
+                    f"Warnings: {', '.join(detection_result.warnings)}"
+                )
+            raise ValueError(error_msg)
+
+        # Show detection summary and get user confirmation (unless skipped)
+        if not skip_confirmation:
+            confirmed = _confirm_format_detection(detection_result, file_path)
+            if not confirmed:
+                raise ValueError("Format detection cancelled by user")
+
+        lines = detected.read_lines()
+        detection_result = detected.result
 
     # Parse based on format
     format_type = detection_result.format_type
     if format_type == "bmap":
-        return parse_bmap(lines, file_path, detection_result)
+        return parse_bmap(
+            lines, file_path, detection_result, columnar=columnar
+        )
     elif format_type == "csv":
-        return parse_csv(lines, file_path, detection_result)
+        return parse_csv(lines, file_path, detection_result, columnar=columnar)
     else:
         raise ValueError(f"Unsupported format: {format_type}")
 
@@ -160,6 +351,7 @@ def parse_bmap(
     lines: list[str],
     file_path: Path,
     detection_result: Optional[FormatDetectionResult] = None,
+    columnar: bool = False,
 ) -> ParsedFile:
     """
     Parse BMAP free format file.
@@ -173,14 +365,54 @@ def parse_bmap(
         lines: List of file lines
         file_path: Path to source file
         detection_result: Optional detection result for additional context
+        columnar: If True, keep coordinates in ``ParsedFile.columns`` and
+            omit the per-point ``coordinates`` lists from the profile dicts
 
     Returns:
         ParsedFile with BMAP profiles
     """
-    profiles: list[dict[str, Any]] = []
-    i: int = 0
+    columns = parse_bmap_columns(lines)
 
-    while i < len(lines):
+    metadata = {
+        "source_file": str(file_path),
+        "format_description": get_format_description("bmap"),
+    }
+
+    return ParsedFile(
+        format_type="bmap",
+        profiles=columns.to_profile_dicts(include_coordinates=not columnar),
+        metadata=metadata,
+        columns=columns if columnar else None,
+    )
+
+
+def parse_bmap_columns(lines: list[str]) -> BMAPColumns:
+    """
+    Scan BMAP free format lines once into columnar coordinate arrays.
+
+    Coordinates are written straight into preallocated float64 arrays.
+    Point-count handling matches the legacy parser: the declared count
+    defines the window of lines read for a profile, and blank or
+    non-numeric lines inside that window are skipped, so a profile's
+    actual point count can be lower than the declared one.
+
+    Args:
+        lines: List of file lines
+
+    Returns:
+        BMAPColumns holding coordinates, offsets and parsed headers
+    """
+    n_lines = len(lines)
+    # Every coordinate occupies its own line, so n_lines bounds the capacity
+    x_buf = np.empty(n_lines, dtype=np.float64)
+    y_buf = np.empty(n_lines, dtype=np.float64)
+    offsets: list[int] = [0]
+    headers: list[dict[str, Any]] = []
+    declared: list[int] = []
+    n_points = 0
+    i = 0
+
+    while i < n_lines:
         line = lines[i].strip()
 
         # Skip empty lines
@@ -188,56 +420,43 @@ def parse_bmap(
             i += 1
             continue
 
-        # Check if this could be a profile header
-        if i + 2 < len(lines):
-            count_line = lines[i + 1].strip()
-
-            # Try to parse as point count
+        # A profile header is followed by a positive point count
+        if i + 2 < n_lines:
             try:
-                point_count = int(count_line)
-                if point_count > 0:
-                    # Found a profile
-                    profile_header = line
-                    profile_data = _parse_bmap_profile_header(profile_header)
-
-                    # Read coordinate pairs
-                    coordinates = []
-                    for j in range(
-                        i + 2, min(i + 2 + point_count, len(lines))
-                    ):
-                        coord_line = lines[j].strip()
-                        if not coord_line:
+                point_count = int(lines[i + 1].strip())
+            except ValueError:
+                point_count = 0
+
+            if point_count > 0:
+                for j in range(i + 2, min(i + 2 + point_count, n_lines)):
+                    parts = lines[j].split()
+                    if len(parts) >= 2:
+                        try:
+                            x = float(parts[0])
+                            y = float(parts[1])
+                        except ValueError:
                             continue
+                        x_buf[n_points] = x
+                        y_buf[n_points] = y
+                        n_points += 1
 
-                        parts = coord_line.split()
-                        if len(parts) >= 2:
-                            try:
-                                x = float(parts[0])
-                                y = float(parts[1])
-                                coordinates.append({"x": x, "y": y})
-                            except ValueError:
-                                continue
-
-                    profile_data["point_count"] = point_count
-                    profile_data["actual_point_count"] = len(coordinates)
-                    profile_data["coordinates"] = coordinates
-
-                    profiles.append(profile_data)
+                headers.append(_parse_bmap_profile_header(line))
+                declared.append(point_count)
+                offsets.append(n_points)
 
-                    # Move index past this profile
-                    i += 2 + point_count
-                    continue
-            except ValueError:
-                pass
+                # Move index past this profile
+                i += 2 + point_count
+                continue
 
         i += 1
 
-    metadata = {
-        "source_file": str(file_path),
-        "format_description": get_format_description("bmap"),
-    }
-
-    return ParsedFile(format_type="bmap", profiles=profiles, metadata=metadata)
+    return BMAPColumns(
+        x=x_buf[:n_points].copy(),
+        y=y_buf[:n_points].copy(),
+        offsets=np.asarray(offsets, dtype=np.int64),
+        headers=headers,
+        declared_counts=np.asarray(declared, dtype=np.int64),
+    )
 
 
 def _parse_bmap_profile_header(header: str) -> dict[str, Any]:
@@ -281,6 +500,7 @@ def parse_csv(
     lines: list[str],
     file_path: Path,
     detection_result: Optional[FormatDetectionResult] = None,
+    columnar: bool = False,
 ) -> ParsedFile:
     """
     Parse delimited file (CSV/TSV/space-delimited, 3-9 columns, with/without headers).
@@ -299,6 +519,10 @@ def parse_csv(
         lines: List of file lines
         file_path: Path to source file
         detection_result: Optional detection result for delimiter info
+        columnar: If True, rows are parsed in bulk into ``ParsedFile.columns``
+            (see ``parse_csv_columns``) and profile dicts carry no
+            "coordinates" or "all_columns"; files the bulk parser cannot
+            handle are parsed row by row as usual
 
     Returns:
         ParsedFile with parsed profiles
@@ -348,6 +572,29 @@ def parse_csv(
         _build_column_mapping(header_line, delimiter) if header_line else {}
     )
 
+    metadata = {
+        "source_file": str(file_path),
+        "format_description": get_format_description("csv"),
+        "has_header": has_header,
+        "header_lines": metadata_lines,
+        "delimiter": delimiter,
+    }
+
+    if columnar:
+        columns = parse_csv_columns(
+            lines[data_start:], delimiter, column_mapping
+        )
+        if columns is not None:
+            return ParsedFile(
+                format_type="csv",
+                profiles=columns.to_profile_dicts(include_coordinates=False),
+                metadata=metadata,
+                has_header=has_header,
+                column_mapping=column_mapping,
+                delimiter=delimiter,
+                columns=columns,
+            )
+
     # Parse data rows
     profiles_dict: dict[str, dict[str, Any]] = {}  # Group by profile ID
 
@@ -407,14 +654,6 @@ def parse_csv(
         profile["point_count"] = len(profile["coordinates"])
         profile["actual_point_count"] = len(profile["coordinates"])
 
-    metadata = {
-        "source_file": str(file_path),
-        "format_description": get_format_description("csv"),
-        "has_header": has_header,
-        "header_lines": metadata_lines,
-        "delimiter": delimiter,
-    }
-
     return ParsedFile(
         format_type="csv",
         profiles=profiles,
@@ -611,6 +850,240 @@ def _extract_coordinates(
     return None
 
 
+def parse_csv_columns(
+    lines: list[str], delimiter: str, column_mapping: dict[str, int]
+) -> Optional[CSVColumns]:
+    """
+    Parse delimited data rows into columnar arrays in bulk.
+
+    The rows are tokenized by pandas' C parser and converted column by
+    column, reproducing the row-by-row rules of ``_extract_profile_id`` and
+    ``_extract_coordinates`` exactly (values are parsed with ``float()``
+    semantics, so coordinates are bit-identical).
+
+    Args:
+        lines: Data lines (header lines already removed)
+        delimiter: Single-character field delimiter
+        column_mapping: Column name to index mapping from the header
+
+    Returns:
+        CSVColumns, or None if the rows cannot be handled in bulk (ragged
+        rows, multi-character delimiter); callers then use the row parser
+    """
+    if len(delimiter) != 1:
+        return None
+
+    if delimiter.isspace():
+        # The row parser strips each line before splitting, which changes
+        # the field count when the delimiter is whitespace
+        rows = [row for row in (line.strip() for line in lines) if row]
+    else:
+        rows = lines
+    first = next((row for row in rows if row.strip()), None)
+    n_fields = first.count(delimiter) + 1 if first is not None else 0
+    if n_fields < 3:
+        # Rows with fewer than three fields are never profile data
+        if any(row.count(delimiter) >= 2 for row in rows):
+            return None
+        return CSVColumns(
+            np.empty(0),
+            np.empty(0),
+            np.empty(0),
+            np.zeros(1, np.int64),
+            [],
+            [],
+        )
+
+    text = "\n".join(rows)
+
+    # Profile ID, date and (4+ columns) the first field are kept as text
+    text_cols = {
+        column_mapping[key]
+        for key in ("PROFILE_ID", "DATE")
+        if column_mapping.get(key, n_fields) < n_fields
+    }
+    if n_fields >= 4:
+        text_cols.add(0)
+
+    def read(**options: Any) -> pd.DataFrame:
+        return pd.read_csv(
+            StringIO(text),
+            sep=delimiter,
+            header=None,
+            na_filter=False,
+            quoting=csv.QUOTE_NONE,
+            float_precision="round_trip",
+            engine="c",
+            low_memory=False,
+            **options,
+        )
+
+    try:
+        df = read(dtype={i: str for i in text_cols})
+        # Blank lines are skipped by pandas as by the row parser; any short
+        # row shows up as a missing delimiter (long rows raise)
+        n_rows = len(df)
+        if df.shape[1] != n_fields or text.count(delimiter) != n_rows * (
+            n_fields - 1
+        ):
+            return None
+        # Integer parsing drops the sign of "-0"; read those columns as
+        # floats instead
+        int_cols = [
+            i
+            for i in range(n_fields)
+            if df[i].dtype.kind in "iu" and not df[i].all()
+        ]
+        if int_cols:
+            floats = read(
+                usecols=int_cols, dtype={i: np.float64 for i in int_cols}
+            )
+            for i in int_cols:
+                df[i] = floats[i]
+    except (pd.errors.ParserError, ValueError):
+        return None
+
+    texts: dict[int, tuple[np.ndarray, list[str]]] = {}
+    numbers: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    def text_column(i: int) -> tuple[np.ndarray, list[str]]:
+        """Return (codes, distinct stripped values) for column i."""
+        if i not in texts:
+            texts[i] = _factorize_text(df[i])
+        return texts[i]
+
+    def numeric(i: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return (values, valid) for column i using float() rules."""
+        if i not in numbers:
+            if df[i].dtype.kind in "iuf":
+                numbers[i] = (
+                    df[i].to_numpy(dtype=float),
+                    np.ones(n_rows, dtype=bool),
+                )
+            elif df[i].dtype.kind == "b":
+                # "True"/"False" tokens are not numbers
+                numbers[i] = (np.zeros(n_rows), np.zeros(n_rows, dtype=bool))
+            else:
+                numbers[i] = _parse_text_floats(*text_column(i))
+        return numbers[i]
+
+    # Profile IDs (see _extract_profile_id)
+    id_col = column_mapping.get("PROFILE_ID", n_fields)
+    if id_col < n_fields:
+        id_codes, id_values = text_column(id_col)
+    elif n_fields >= 4:
+        id_codes, id_values = text_column(0)
+        id_codes = id_codes.copy()
+        if "UNKNOWN" not in id_values:
+            id_values = id_values + ["UNKNOWN"]
+        id_codes[numeric(0)[1]] = id_values.index("UNKNOWN")
+    else:
+        id_codes, id_values = np.zeros(n_rows, dtype=np.intp), ["UNKNOWN"]
+
+    # Coordinates (see _extract_coordinates): mapped columns first
+    x = np.zeros(n_rows)
+    y = np.zeros(n_rows)
+    z = np.zeros(n_rows)
+    valid = np.zeros(n_rows, dtype=bool)
+
+    x_col, y_col = column_mapping.get("X"), column_mapping.get("Y")
+    if x_col is not None and y_col is not None:
+        # No Z column: Y doubles as elevation
+        mapped = (x_col, y_col, column_mapping.get("Z", y_col))
+        if all(i < n_fields for i in mapped):
+            (xv, xok), (yv, yok), (zv, zok) = (numeric(i) for i in mapped)
+            valid = xok & yok & zok
+            x[valid], y[valid], z[valid] = xv[valid], yv[valid], zv[valid]
+
+    # Heuristic column positions for the remaining rows
+    if n_fields == 3:
+        candidates = [0]
+    elif n_fields == 4:
+        candidates = [1]
+    else:
+        candidates = list(range(n_fields - 2))
+    for j in candidates:
+        if valid.all():
+            break
+        (xv, xok), (yv, yok), (zv, zok) = (numeric(j + k) for k in range(3))
+        take = ~valid & xok & yok & zok
+        x[take], y[take], z[take] = xv[take], yv[take], zv[take]
+        valid |= take
+
+    # Profiles in order of first appearance over all rows, including rows
+    # without valid coordinates
+    order, first_codes = pd.factorize(id_codes, sort=False)
+    profile_ids = [id_values[code] for code in first_codes.tolist()]
+    n_profiles = len(profile_ids)
+
+    valid_profile = order[valid]
+    rows_by_profile = np.flatnonzero(valid)[
+        np.argsort(valid_profile, kind="stable")
+    ]
+    offsets = np.zeros(n_profiles + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(valid_profile, minlength=n_profiles), out=offsets[1:]
+    )
+
+    # Date: first non-empty DATE value among a profile's valid rows
+    dates: list[Optional[str]] = [None] * n_profiles
+    date_col = column_mapping.get("DATE", n_fields)
+    if date_col < n_fields:
+        date_codes, date_values = text_column(date_col)
+        for i in np.flatnonzero(np.diff(offsets)).tolist():
+            dates[i] = ""
+        dated = valid.copy()
+        if "" in date_values:
+            dated &= date_codes != date_values.index("")
+        profiles, first_rows = np.unique(order[dated], return_index=True)
+        first_dates = date_codes[dated][first_rows].tolist()
+        for i, code in zip(profiles.tolist(), first_dates):
+            dates[i] = date_values[code]
+
+    return CSVColumns(
+        x[rows_by_profile],
+        y[rows_by_profile],
+        z[rows_by_profile],
+        offsets,
+        profile_ids,
+        dates,
+    )
+
+
+def _factorize_text(column: pd.Series) -> tuple[np.ndarray, list[str]]:
+    """
+    Factorize a text column on its stripped values.
+
+    Returns:
+        (codes, values) where ``values[codes[i]]`` is row i stripped and
+        ``values`` is in order of first appearance
+    """
+    codes, uniques = pd.factorize(column, sort=False)
+    stripped = [str(value).strip() for value in uniques.tolist()]
+    remap, values = pd.factorize(np.array(stripped, dtype=object))
+    return remap[codes], list(values)
+
+
+def _parse_text_floats(
+    codes: np.ndarray, values: list[str]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert factorized text to float64 following ``float()`` semantics.
+
+    Returns:
+        (values, valid) where invalid entries are 0.0 and marked False
+    """
+    unique_values = np.zeros(len(values))
+    unique_valid = np.zeros(len(values), dtype=bool)
+    for k, value in enumerate(values):
+        try:
+            unique_values[k] = float(value)
+            unique_valid[k] = True
+        except ValueError:
+            pass
+    return unique_values[codes], unique_valid[codes]
+
+
 def parse_csv_standard(
     lines: list[str],
     file_path: Path,
@@ -2,7 +2,9 @@
 File Format Detection Module - Content-based format detection for ProfCalc.
 
 This module provides centralized format detection logic for all ProfCalc tools.
-Detection is based on file content structure, not file extensions.
+Detection is based on file content structure, not file extensions, and only
+examines a bounded prefix of each file. DetectedFile keeps the decoded stream
+open so parsers can reuse the detected encoding and the sampled lines.
 
 Supported Formats:
 - BMAP Free Format: Profile header + count line + coordinate pairs
@@ -10,7 +12,21 @@ Supported Formats:
 """
 
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
+
+# Encodings tried, in order, when decoding input files
+TEXT_ENCODINGS = (
+    "utf-8",
+    "utf-16",
+    "utf-16-le",
+    "utf-16-be",
+    "latin-1",
+    "cp1252",
+)
+
+# Upper bounds on the leading portion of a file examined by format detection
+DETECTION_SAMPLE_LINES = 5000
+DETECTION_SAMPLE_CHARS = 256 * 1024
 
 
 class FormatDetectionResult:
@@ -85,6 +101,11 @@ def detect_file_format_detailed(file_path: Path) -> FormatDetectionResult:
     """
     Detect file format with detailed results including confidence and warnings.
 
+    Only a bounded prefix of the file is examined (see DETECTION_SAMPLE_LINES
+    and DETECTION_SAMPLE_CHARS). When the prefix is not the whole file,
+    ``details`` reports ``sampled_lines`` and BMAP profile counts appear as
+    ``profiles_in_sample`` instead of ``profiles_detected``.
+
     Args:
         file_path: Path to the file to analyze
 
@@ -95,34 +116,23 @@ def detect_file_format_detailed(file_path: Path) -> FormatDetectionResult:
         FileNotFoundError: If file does not exist
         PermissionError: If file cannot be read
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    with DetectedFile(file_path) as detected:
+        return detected.result
 
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = [line.rstrip("\n\r") for line in f.readlines()]
-    except UnicodeDecodeError:
-        # Try with different encodings if UTF-8 fails
-        for encoding in [
-            "utf-16",
-            "utf-16-le",
-            "utf-16-be",
-            "latin-1",
-            "cp1252",
-        ]:
-            try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    lines = [line.rstrip("\n\r") for line in f.readlines()]
-                break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-        else:
-            return FormatDetectionResult(
-                "unknown",
-                confidence="low",
-                warnings=["Unable to read file with standard encodings"],
-            )
 
+def detect_format_from_lines(
+    lines: list[str], file_path: Path
+) -> FormatDetectionResult:
+    """
+    Detect file format from already-decoded lines.
+
+    Args:
+        lines: File lines (or a leading sample of them) without line endings
+        file_path: Path to source file (used for extension details)
+
+    Returns:
+        FormatDetectionResult with format type, confidence, details, and warnings
+    """
     if not lines:
         return FormatDetectionResult(
             "unknown", confidence="low", warnings=["File is empty"]
@@ -145,6 +155,131 @@ def detect_file_format_detailed(file_path: Path) -> FormatDetectionResult:
     )
 
 
+class DetectedFile:
+    """
+    Open text file with its detected encoding and format.
+
+    The file is opened once with the first encoding in TEXT_ENCODINGS that
+    decodes it. Detection runs on a bounded prefix, and the prefix lines are
+    kept so read_lines() can return the whole file in a single pass without
+    decoding it again.
+
+    Attributes:
+        file_path: Path of the opened file
+        encoding: Encoding used to decode the file (None if none worked)
+        result: Format detection result for the sampled prefix
+
+    Example:
+        >>> with DetectedFile(path) as detected:
+        ...     if detected.result.format_type == "bmap":
+        ...         lines = detected.read_lines()
+    """
+
+    def __init__(self, file_path: Path):
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        self.file_path = file_path
+        self.encoding: Optional[str] = None
+        self.result = FormatDetectionResult(
+            "unknown",
+            confidence="low",
+            warnings=["Unable to read file with standard encodings"],
+        )
+        self._stream: Optional[TextIO] = None
+        self._sample: list[str] = []
+        self._exhausted = False
+        self._open(TEXT_ENCODINGS)
+
+    def _open(self, encodings: tuple[str, ...]) -> None:
+        """Open the file with the first encoding that decodes the prefix."""
+        self.close()
+        for encoding in encodings:
+            stream = open(self.file_path, "r", encoding=encoding)
+            try:
+                sample, exhausted = _read_sample(stream)
+            except (UnicodeDecodeError, UnicodeError):
+                stream.close()
+                continue
+
+            self._stream = stream
+            self._sample = sample
+            self._exhausted = exhausted
+            self.encoding = encoding
+            self.result = detect_format_from_lines(sample, self.file_path)
+            if not exhausted:
+                details = self.result.details
+                details["sampled_lines"] = len(sample)
+                # Only the prefix was scanned, so this is not the file total
+                if "profiles_detected" in details:
+                    details["profiles_in_sample"] = details.pop(
+                        "profiles_detected"
+                    )
+            return
+
+    def read_lines(self) -> list[str]:
+        """
+        Return all file lines (without line endings), reusing the sample.
+
+        If the remainder of the file fails to decode with the detected
+        encoding, the file is reopened with the next encoding in
+        TEXT_ENCODINGS and detection is repeated.
+
+        Raises:
+            ValueError: If no standard encoding can decode the file
+        """
+        while self._stream is not None:
+            try:
+                if self._exhausted:
+                    rest = []
+                else:
+                    rest = [line.rstrip("\n\r") for line in self._stream]
+            except (UnicodeDecodeError, UnicodeError):
+                remaining = TEXT_ENCODINGS[
+                    TEXT_ENCODINGS.index(self.encoding) + 1 :  # type: ignore[arg-type]
+                ]
+                self.encoding = None
+                self._open(remaining)
+                continue
+
+            self._exhausted = True
+            return self._sample + rest
+
+        raise ValueError("Unable to read file with standard encodings")
+
+    def close(self) -> None:
+        """Close the underlying stream."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def __enter__(self) -> "DetectedFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _read_sample(stream: TextIO) -> tuple[list[str], bool]:
+    """
+    Read the leading lines of a stream used for format detection.
+
+    Returns:
+        Tuple of (lines without line endings, True if the stream was exhausted)
+    """
+    lines: list[str] = []
+    chars = 0
+    for line in stream:
+        lines.append(line.rstrip("\n\r"))
+        chars += len(line)
+        if (
+            len(lines) >= DETECTION_SAMPLE_LINES
+            or chars >= DETECTION_SAMPLE_CHARS
+        ):
+            return lines, False
+    return lines, True
+
+
 def _check_bmap_format(
     lines: list[str], file_path: Path
 ) -> FormatDetectionResult:
@@ -0,0 +1,128 @@
+"""
+Grid Clustering Module
+
+This module groups survey points into spatial clusters without external
+dependencies. Points are binned into a uniform hash grid and occupied cells
+that touch (including diagonally) are merged with a vectorized union-find,
+so a whole survey is clustered in a few NumPy passes over the points.
+
+Clustering rules:
+- Cells are ``cell_size`` wide, so any two points closer than ``cell_size``
+  in both X and Y fall into the same or adjacent cells and are clustered
+  together
+- A cluster is a connected set of occupied cells (8-neighbourhood)
+- Clusters with fewer than ``min_samples`` points are labelled noise (-1)
+- Cluster labels are numbered in order of each cluster's first point
+"""
+
+import numpy as np
+import pandas as pd
+
+# Offsets of the forward half of the 8-neighbourhood (the other half is
+# covered when the neighbouring cell looks back)
+_NEIGHBOUR_OFFSETS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _union_find(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Return the root of each node after joining every edge ``(a, b)``.
+
+    Vectorized union-find: each round hooks the larger root of every
+    unjoined edge onto the smaller one, then compresses paths fully.
+    Roots are the smallest node of each component.
+    """
+    parent = np.arange(n)
+    while len(a):
+        root_a = parent[a]
+        root_b = parent[b]
+        low = np.minimum(root_a, root_b)
+        high = np.maximum(root_a, root_b)
+        pending = low != high
+        if not pending.any():
+            break
+        a, b = a[pending], b[pending]
+        np.minimum.at(parent, high[pending], low[pending])
+
+        # Path compression until every node points at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    return parent
+
+
+def grid_cluster_labels(
+    x_coords: np.ndarray,
+    y_coords: np.ndarray,
+    cell_size: float,
+    min_samples: int = 1,
+) -> np.ndarray:
+    """
+    Cluster points by merging touching cells of a uniform grid.
+
+    Args:
+        x_coords: X coordinates of the points
+        y_coords: Y coordinates of the points
+        cell_size: Grid cell width in coordinate units (the linking
+            distance)
+        min_samples: Minimum number of points in a cluster; smaller
+            clusters are labelled noise
+
+    Returns:
+        int64 array of cluster labels (0, 1, ... in order of each cluster's
+        first point; -1 for noise)
+
+    Raises:
+        ValueError: If ``cell_size`` is not positive, the coordinates are
+            not finite, or the grid would be too large to index
+    """
+    x = np.asarray(x_coords, dtype=float)
+    y = np.asarray(y_coords, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same length")
+    if not cell_size > 0:
+        raise ValueError("cell_size must be positive")
+    if len(x) == 0:
+        return np.empty(0, dtype=np.int64)
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        raise ValueError("Coordinates must be finite")
+
+    # Bin points into cells; keys leave a one-cell margin on each side so
+    # neighbour keys never collide
+    col = np.floor((x - x.min()) / cell_size)
+    row = np.floor((y - y.min()) / cell_size)
+    stride = row.max() + 3
+    if (col.max() + 2) * stride >= 2**62:
+        raise ValueError(
+            "Grid too large for the coordinate range; increase cell_size"
+        )
+    keys = col.astype(np.int64) * int(stride) + row.astype(np.int64) + 1
+
+    # Hash occupied cells; point_cell maps each point to its cell
+    point_cell, cell_keys = pd.factorize(keys)
+    cells = pd.Index(cell_keys)
+    n_cells = len(cells)
+
+    # Edges between occupied neighbouring cells
+    cell_ids = np.arange(n_cells)
+    sources = []
+    targets = []
+    for d_col, d_row in _NEIGHBOUR_OFFSETS:
+        neighbour = cells.get_indexer(cell_keys + d_col * int(stride) + d_row)
+        found = neighbour >= 0
+        sources.append(cell_ids[found])
+        targets.append(neighbour[found])
+    root = _union_find(
+        n_cells, np.concatenate(sources), np.concatenate(targets)
+    )
+
+    # Number clusters by first point (cells are numbered in point order,
+    # so the smallest cell of a cluster holds its first point)
+    _, cluster = np.unique(root, return_inverse=True)
+    labels = cluster[point_cell]
+
+    # Drop clusters that are too small
+    sizes = np.bincount(labels)
+    keep = sizes >= min_samples
+    new_label = np.where(keep, np.cumsum(keep) - 1, -1)
+    return new_label[labels].astype(np.int64)
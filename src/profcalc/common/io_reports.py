@@ -15,7 +15,7 @@ import numpy as np
 def write_volume_report(
     file_path: str,
     results: list[dict],
-    contour_level: float = 0.0,
+    contour_level: Optional[float] = 0.0,
     title: Optional[str] = "Untitled",
 ):
     """
@@ -28,14 +28,22 @@ def write_volume_report(
         - x_off (float)
         - volume_cuyd_per_ft (float)
         - contour_location (float)
+        - zref (float, only when contour_level is None)
+    contour_level: contour used for every profile, or None when each
+        profile has its own (written in an extra Zref column)
     """
+    per_line = contour_level is None
     Path(file_path).parent.mkdir(parents=True, exist_ok=True)
     with open(file_path, "w") as f:
         f.write(f"{title}\n")
         f.write("Profile Volume Report\n")
-        f.write(f"Contour Level:\t{contour_level:.2f} ft\t\t\t\n\n")
+        if per_line:
+            f.write("Contour Level:\tper profile (see Zref column)\t\t\t\n\n")
+        else:
+            f.write(f"Contour Level:\t{contour_level:.2f} ft\t\t\t\n\n")
         f.write(
-            "Profile\tXOn(ft)\tXOff(ft)\tVolume(cu. yd/ft)\tContour Location(ft)\n"
+            "Profile\tXOn(ft)\tXOff(ft)\tVolume(cu. yd/ft)\tContour Location(ft)"
+            + ("\tZref(ft)\n" if per_line else "\n")
         )
 
         for r in results:
@@ -51,7 +59,8 @@ def write_volume_report(
                 f"{r.get('x_on', 0):.2f}\t"
                 f"{r.get('x_off', 0):.2f}\t"
                 f"{r.get('volume_cuyd_per_ft', 0):.3f}\t"
-                f"{r.get('contour_location', 0):.2f}\n"
+                f"{r.get('contour_location', 0):.2f}"
+                + (f"\t{r['zref']:.2f}\n" if per_line else "\n")
             )
 
     print(f"\n? BMAP-style Volume Report written to: {file_path}")
@@ -21,7 +21,7 @@ from typing import Any, List, Optional
 import numpy as np
 import pandas as pd
 
-from .bmap_io import Profile
+from .bmap_io import BMAP_WRITE_BUFFER_SIZE, Profile
 from .data_validation import validate_array_properties
 from .error_handler import (
     BeachProfileError,
@@ -29,6 +29,10 @@ from .error_handler import (
     LogComponent,
     get_logger,
 )
+from .parse_cache import read_through_cache
+
+# Rows formatted per string operation when writing
+_WRITE_BLOCK_ROWS = 65536
 
 
 class NineColImportError(Exception):
@@ -82,24 +86,35 @@ class NineColumnParser:
             raise FileNotFoundError(filepath)
 
         with open(filepath, encoding="utf-8", errors="ignore") as fh:
-            lines = fh.readlines()
-
-        header_idx = None
-        for i, ln in enumerate(lines):
-            if "PROFILE ID" in ln:
-                header_idx = i
-                break
+            # Seek to the header row instead of reading the whole file
+            while True:
+                line = fh.readline()
+                if not line or "PROFILE ID" in line:
+                    break
+
+            if not line:
+                raise BeachProfileError(
+                    "Could not find header row containing 'PROFILE ID'",
+                    category=ErrorCategory.FILE_IO,
+                )
 
-        if header_idx is None:
-            raise BeachProfileError(
-                "Could not find header row containing 'PROFILE ID'",
-                category=ErrorCategory.FILE_IO,
-            )
+            # Use the header line to name columns
+            columns = pd.read_csv(StringIO(line.strip()), nrows=0).columns
+            data_start = fh.tell()
 
-        # Use the header line to name columns
-        header_line = lines[header_idx].strip()
-        content = header_line + "\n" + "".join(lines[header_idx + 1 :])
-        df = pd.read_csv(StringIO(content), header=0)
+            try:
+                df = pd.read_csv(
+                    fh,
+                    header=None,
+                    names=columns,
+                    dtype=self._column_dtypes(columns),
+                )
+            except ValueError as e:
+                # Non-numeric coordinates: let pandas infer the column
+                # types so bad rows are reported per profile
+                self.logger.debug(f"Reading 9-column data untyped: {e}")
+                fh.seek(data_start)
+                df = pd.read_csv(fh, header=None, names=columns)
 
         # Check for required columns
         missing_columns = set(self.required_columns) - set(df.columns)
@@ -111,6 +126,51 @@ class NineColumnParser:
 
         return df
 
+    @staticmethod
+    def _column_dtypes(columns: pd.Index) -> dict[str, Any]:
+        """Return explicit read dtypes for the known 9-column fields."""
+        dtypes: dict[str, Any] = {
+            "PROFILE ID": "category",
+            "DATE": str,
+            "TIME (EST)": str,
+            "POINT #": np.float64,
+            "EASTING (X)": np.float64,
+            "NORTHING (Y)": np.float64,
+            "ELEVATION (Z)": np.float64,
+            "TYPE": str,
+            "DESCRIPTION": str,
+        }
+        return {name: dtypes[name] for name in columns if name in dtypes}
+
+    @staticmethod
+    def _order_profile_ids(ids: pd.Series) -> pd.Series:
+        """Return profile IDs as a categorical in profile output order.
+
+        When every ID is an integer, IDs are written without leading zeros
+        ("0118" becomes "118"), as reading the column as numbers did, and
+        ordered numerically (so profile 10 follows profile 9). Otherwise
+        IDs are kept as written and ordered lexically.
+        """
+        if not isinstance(ids.dtype, pd.CategoricalDtype):
+            return ids
+        categories = ids.cat.categories
+        integer_ids = categories.str.fullmatch(r"\s*[+-]?\d+\s*")
+        if len(categories) and integer_ids.all():
+            # Padded spellings of one number ("09", "9") become one ID
+            names = np.array([str(int(c)) for c in categories])
+            unique, inverse = np.unique(names, return_inverse=True)
+            codes = ids.cat.codes.to_numpy()
+            codes = np.where(codes >= 0, inverse[codes], -1)
+            ids = pd.Series(
+                pd.Categorical.from_codes(codes, unique), index=ids.index
+            )
+            categories = ids.cat.categories
+        numeric = pd.to_numeric(categories, errors="coerce")
+        if len(categories) and not np.isnan(numeric).any():
+            order = np.argsort(numeric, kind="stable")
+            ids = ids.cat.reorder_categories(categories[order])
+        return ids
+
     def parse_file(self, file_path: str | Path) -> List[Profile]:
         """Parse a 9-column file and extract beach profile data.
 
@@ -129,7 +189,8 @@ class NineColumnParser:
 
             # Group by profile and date to create profiles
             profiles = []
-            grouped = df.groupby(["PROFILE ID", "DATE"])
+            df["PROFILE ID"] = self._order_profile_ids(df["PROFILE ID"])
+            grouped = df.groupby(["PROFILE ID", "DATE"], observed=True)
 
             for (profile_id, date_str), profile_points in grouped:
                 profile = self._convert_to_profile(
@@ -281,9 +342,17 @@ def read_9col_profiles(
 
     Raises:
         BeachProfileError: If reading fails
+
+    Note:
+        Results are served from the parse cache when it is enabled.
     """
     parser = NineColumnParser(config)
-    return parser.parse_file(file_path)
+    return read_through_cache(
+        "9col",
+        file_path,
+        lambda: parser.parse_file(file_path),
+        options=config,
+    )
 
 
 def write_9col_profiles(
@@ -299,7 +368,7 @@ def write_9col_profiles(
         BeachProfileError: If writing fails
     """
     try:
-        with open(file_path, "w") as f:
+        with open(file_path, "w", buffering=BMAP_WRITE_BUFFER_SIZE) as f:
             # Write header
             f.write(
                 "PROFILE ID\tDATE\tPOINT #\tEASTING (X)\tNORTHING (Y)\tELEVATION (Z)\tTYPE\tDESCRIPTION\n"
@@ -351,20 +420,55 @@ def write_9col_profiles(
                     profile.date or "19000101"
                 )  # Default date if none provided
 
-                # Write each point
-                for i, (x, y, z) in enumerate(
-                    zip(profile.x, y_coords, profile.z)
-                ):
-                    point_type = point_types[i] if i < len(point_types) else ""
-                    desc = descriptions[i] if i < len(descriptions) else ""
-
-                    f.write(
-                        f"{profile.name}\t{date_str}\t{point_counter}\t{x:.3f}\t{y:.3f}\t{z:.3f}\t{point_type}\t{desc}\n"
-                    )
-                    point_counter += 1
+                # Write all points of the profile in bulk
+                n = min(len(profile.x), len(y_coords), len(profile.z))
+                point_types = list(point_types[:n])
+                descriptions = list(descriptions[:n])
+                point_types.extend([""] * (n - len(point_types)))
+                descriptions.extend([""] * (n - len(descriptions)))
+
+                prefix = f"{profile.name}\t{date_str}\t".replace("%", "%%")
+                _write_rows(
+                    f,
+                    prefix + "%d\t%.3f\t%.3f\t%.3f\t%s\t%s\n",
+                    [
+                        range(point_counter, point_counter + n),
+                        _as_list(profile.x, n),
+                        _as_list(y_coords, n),
+                        _as_list(profile.z, n),
+                        point_types,
+                        descriptions,
+                    ],
+                )
+                point_counter += n
 
     except Exception as e:
         raise BeachProfileError(
             f"Failed to write 9-column file {file_path}: {e}",
             category=ErrorCategory.FILE_IO,
         ) from e
+
+
+def _as_list(values: Any, n: int) -> List[Any]:
+    """Return the first ``n`` values as a list of Python scalars."""
+    if isinstance(values, np.ndarray):
+        return values[:n].tolist()
+    return list(values[:n])
+
+
+def _write_rows(f: Any, row_format: str, columns: List[Any]) -> None:
+    """Write rows built from whole columns with one %-format per block.
+
+    Args:
+        f: Text stream to write to
+        row_format: %-style format for one row (one field per column)
+        columns: Equal-length column sequences
+    """
+    n = len(columns[0])
+    width = len(columns)
+    for start in range(0, n, _WRITE_BLOCK_ROWS):
+        stop = min(start + _WRITE_BLOCK_ROWS, n)
+        values: List[Any] = [None] * (width * (stop - start))
+        for i, column in enumerate(columns):
+            values[i::width] = column[start:stop]
+        f.write((row_format * (stop - start)) % tuple(values))
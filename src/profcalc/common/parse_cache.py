@@ -0,0 +1,353 @@
+"""
+Parse Cache Module
+
+Opt-in persistent cache of parsed survey files. The first time a file is
+read, the parsed profile arrays and header metadata are stored as a compact
+``.npz`` entry in a user cache directory; later reads of the same unchanged
+file load that entry instead of re-parsing the text.
+
+Cache behavior:
+- Entries are keyed by reader, reader options, resolved path, file size,
+  mtime and a BLAKE2 hash of the file content
+- The total cache size is bounded; least recently used entries are evicted
+- Profiles are returned exactly as first parsed (including import-time
+  fields such as the date assigned to XYZ profiles)
+- Results whose metadata cannot be stored losslessly are simply not cached
+- Any cache failure falls back to parsing; the cache never changes results
+
+Enable it with ``"parse_cache": {"enabled": true}`` in config.json or the
+``PROFCALC_PARSE_CACHE=1`` environment variable (see
+``config_utils.get_parse_cache_settings``).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config_utils import get_parse_cache_settings
+from .error_handler import LogComponent, get_logger
+
+if TYPE_CHECKING:
+    from .bmap_io import Profile
+
+CACHE_VERSION = 1
+ENTRY_SUFFIX = ".npz"
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for parsed survey files."""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or str(
+            Path.home() / "AppData" / "Local"
+        )
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "profcalc" / "parse_cache"
+
+
+def file_fingerprint(file_path: str | Path) -> Tuple[str, int, int, str]:
+    """
+    Return (resolved path, size, mtime_ns, content hash) for a file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return str(path), stat.st_size, stat.st_mtime_ns, digest.hexdigest()
+
+
+class ParseCache:
+    """
+    Directory of cached parse results with a size limit and LRU eviction.
+
+    Entry recency is tracked with the entry file's modification time, which
+    is refreshed on every hit.
+
+    Attributes:
+        directory: Cache directory
+        max_bytes: Maximum total size of all entries in bytes
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.logger = get_logger(LogComponent.FILE_IO)
+
+    def entry_key(
+        self,
+        reader: str,
+        file_path: str | Path,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the cache key for a reader call on a file."""
+        parts = {
+            "version": CACHE_VERSION,
+            "reader": reader,
+            "file": file_fingerprint(file_path),
+            "options": options or {},
+        }
+        text = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.blake2b(
+            text.encode("utf-8"), digest_size=20
+        ).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def load(self, key: str) -> Optional[List["Profile"]]:
+        """Return cached profiles for ``key``, or None on a miss."""
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                profiles = _unpack_profiles(data)
+            _touch(path)  # mark as most recently used
+        except Exception as e:
+            self.logger.warning(
+                f"Discarding unreadable cache entry {path}: {e}"
+            )
+            path.unlink(missing_ok=True)
+            return None
+        return profiles
+
+    def store(self, key: str, profiles: List["Profile"]) -> bool:
+        """
+        Store profiles under ``key`` and evict old entries if over the limit.
+
+        Returns:
+            True if the entry was written, False if the profiles cannot be
+            cached losslessly or the write failed
+        """
+        arrays = _pack_profiles(profiles)
+        if arrays is None:
+            self.logger.debug(
+                "Parse result not cacheable; skipping cache store"
+            )
+            return False
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                # Keys are fixed array names, never savez's allow_pickle flag
+                np.savez(f, **arrays)  # type: ignore[arg-type]
+            os.replace(tmp_name, self._entry_path(key))
+            _touch(self._entry_path(key))
+        except OSError as e:
+            self.logger.warning(f"Could not write parse cache entry: {e}")
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Delete least recently used entries until within ``max_bytes``."""
+        try:
+            entries = [
+                (p.stat().st_mtime_ns, p.stat().st_size, p)
+                for p in self.directory.glob(f"*{ENTRY_SUFFIX}")
+            ]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                continue
+
+    def clear(self) -> None:
+        """Delete all cache entries."""
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+def _touch(path: Path) -> None:
+    """Set an entry's mtime to the current high-resolution time.
+
+    Filesystem timestamps from writes can be coarse, so recency is set
+    explicitly to keep LRU ordering exact.
+    """
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Return the configured parse cache, or None if caching is disabled."""
+    settings = get_parse_cache_settings()
+    if not settings["enabled"]:
+        return None
+    directory = settings["directory"] or default_cache_dir()
+    max_bytes = int(float(settings["max_size_mb"]) * 1024 * 1024)
+    return ParseCache(directory, max_bytes)
+
+
+def read_through_cache(
+    reader: str,
+    file_path: str | Path,
+    parse: Callable[[], List["Profile"]],
+    options: Optional[Dict[str, Any]] = None,
+    dependencies: Optional[List[str | Path]] = None,
+) -> List["Profile"]:
+    """
+    Return profiles for a file from the parse cache, parsing on a miss.
+
+    When caching is disabled this simply calls ``parse()``.
+
+    Args:
+        reader: Name of the reader (part of the cache key)
+        file_path: Survey file being read
+        parse: Callable that parses the file without the cache
+        options: Reader options that affect the result (part of the key)
+        dependencies: Other files the result depends on (e.g. a baseline
+            file); their fingerprints are part of the key
+
+    Returns:
+        List of Profile objects
+    """
+    cache = get_parse_cache()
+    if cache is None:
+        return parse()
+
+    try:
+        key_options = dict(options or {})
+        if dependencies:
+            key_options["_dependencies"] = [
+                file_fingerprint(dep) for dep in dependencies
+            ]
+        key = cache.entry_key(reader, file_path, key_options)
+    except OSError:
+        # Missing files are reported by the reader itself
+        return parse()
+
+    cached = cache.load(key)
+    if cached is not None:
+        return cached
+
+    profiles = parse()
+    cache.store(key, profiles)
+    return profiles
+
+
+# ----------------------------------------------------------------------
+# Entry encoding
+# ----------------------------------------------------------------------
+
+
+def _pack_profiles(
+    profiles: List["Profile"],
+) -> Optional[Dict[str, np.ndarray]]:
+    """Encode profiles as npz arrays; None if not losslessly representable.
+
+    Coordinates are concatenated into ``x``/``z`` with an ``offsets`` array.
+    1-D float metadata arrays (e.g. ``y_coordinates``) are concatenated into
+    ``meta_values`` and referenced from the JSON header by slice.
+    """
+    xs: List[np.ndarray] = []
+    zs: List[np.ndarray] = []
+    meta_arrays: List[np.ndarray] = []
+    meta_pos = 0
+    headers: List[Dict[str, Any]] = []
+    offsets = [0]
+
+    for p in profiles:
+        x = np.asarray(p.x)
+        z = np.asarray(p.z)
+        if (
+            x.dtype != np.float64
+            or z.dtype != np.float64
+            or x.ndim != 1
+            or x.shape != z.shape
+        ):
+            return None
+        xs.append(x)
+        zs.append(z)
+        offsets.append(offsets[-1] + len(x))
+
+        metadata = None
+        if p.metadata is not None:
+            metadata = {}
+            for k, v in p.metadata.items():
+                if isinstance(v, np.ndarray):
+                    if v.dtype != np.float64 or v.ndim != 1:
+                        return None
+                    meta_arrays.append(v)
+                    metadata[k] = {"__array__": [meta_pos, meta_pos + len(v)]}
+                    meta_pos += len(v)
+                else:
+                    metadata[k] = v
+        headers.append(
+            {
+                "name": p.name,
+                "date": p.date,
+                "description": p.description,
+                "metadata": metadata,
+            }
+        )
+
+    # Only cache headers that survive a JSON round trip unchanged
+    try:
+        header_text = json.dumps(headers, allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    if json.loads(header_text) != headers:
+        return None
+
+    return {
+        "x": np.concatenate(xs) if xs else np.empty(0),
+        "z": np.concatenate(zs) if zs else np.empty(0),
+        "offsets": np.asarray(offsets, dtype=np.int64),
+        "meta_values": (
+            np.concatenate(meta_arrays) if meta_arrays else np.empty(0)
+        ),
+        "headers": np.array(header_text),
+    }
+
+
+def _unpack_profiles(data: Any) -> List["Profile"]:
+    """Rebuild profiles from the arrays written by ``_pack_profiles``."""
+    from .bmap_io import Profile
+
+    x = data["x"]
+    z = data["z"]
+    offsets = data["offsets"].tolist()
+    meta_values = data["meta_values"]
+    headers = json.loads(str(data["headers"]))
+
+    profiles: List[Profile] = []
+    for i, header in enumerate(headers):
+        start, stop = offsets[i], offsets[i + 1]
+        metadata = header["metadata"]
+        if metadata is not None:
+            for k, v in metadata.items():
+                if isinstance(v, dict) and set(v) == {"__array__"}:
+                    a, b = v["__array__"]
+                    metadata[k] = meta_values[a:b]
+        profiles.append(
+            Profile(
+                name=header["name"],
+                date=header["date"],
+                description=header["description"],
+                x=x[start:stop],
+                z=z[start:stop],
+                metadata=metadata,
+            )
+        )
+    return profiles
@@ -0,0 +1,409 @@
+"""
+Profile Collection Module
+
+This module provides ProfileCollection, a columnar container for many beach
+profiles. All coordinates live in a few concatenated arrays indexed by an
+offsets array, and the per-profile labels (name, date, purpose, description)
+are stored as categorical codes. Compared with a ``List[Profile]`` this keeps
+the per-point overhead to the coordinate values themselves and lets whole
+project operations run as single NumPy calls.
+
+Layout:
+- ``x``, ``z`` (and optional ``y``): float64 arrays of every point
+- ``offsets``: int64 array of length ``n_profiles + 1``; profile ``i``
+  occupies ``offsets[i]:offsets[i + 1]``
+- ``name``/``date``/``purpose``/``description``: integer codes into
+  category lists (-1 for missing values)
+
+Per-profile access returns views into the shared arrays, so no coordinates
+are copied when iterating.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .bmap_io import Profile
+from .file_parser import BMAPColumns, parse_file
+
+
+def _encode_categories(
+    values: Iterable[Optional[str]],
+) -> Tuple[np.ndarray, List[str]]:
+    """Encode values as int32 codes into first-appearance ordered categories.
+
+    Missing values (None or empty strings) are encoded as -1.
+    """
+    lookup: Dict[str, int] = {}
+    codes: List[int] = []
+    for value in values:
+        if not value:
+            codes.append(-1)
+            continue
+        code = lookup.get(value)
+        if code is None:
+            code = len(lookup)
+            lookup[value] = code
+        codes.append(code)
+    return np.asarray(codes, dtype=np.int32), list(lookup)
+
+
+class ProfileCollection:
+    """
+    Ragged columnar container for many profiles.
+
+    Attributes:
+        x: Concatenated cross-shore distances of all profiles
+        z: Concatenated elevations of all profiles
+        y: Concatenated alongshore/northing values, or None
+        offsets: Start offset of each profile plus the total point count
+        name_codes, date_codes, purpose_codes, description_codes: int32
+            codes into the matching ``*_categories`` lists (-1 = missing)
+        metadata: Optional per-profile metadata dicts (None if no profile
+            carried metadata)
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        z: np.ndarray,
+        offsets: np.ndarray,
+        names: Sequence[Optional[str]],
+        dates: Optional[Sequence[Optional[str]]] = None,
+        purposes: Optional[Sequence[Optional[str]]] = None,
+        descriptions: Optional[Sequence[Optional[str]]] = None,
+        y: Optional[np.ndarray] = None,
+        metadata: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ):
+        self.x = np.asarray(x, dtype=float)
+        self.z = np.asarray(z, dtype=float)
+        self.y = None if y is None else np.asarray(y, dtype=float)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+        n = len(self.offsets) - 1
+        if n < 0 or len(names) != n:
+            raise ValueError(
+                f"offsets describe {max(n, 0)} profiles but {len(names)} names were given"
+            )
+        if len(self.x) != len(self.z) or self.offsets[-1] != len(self.x):
+            raise ValueError("x/z lengths do not match offsets")
+        if self.y is not None and len(self.y) != len(self.x):
+            raise ValueError("y length does not match x")
+
+        missing = [None] * n
+        self.name_codes, self.name_categories = _encode_categories(names)
+        self.date_codes, self.date_categories = _encode_categories(
+            dates if dates is not None else missing
+        )
+        self.purpose_codes, self.purpose_categories = _encode_categories(
+            purposes if purposes is not None else missing
+        )
+        self.description_codes, self.description_categories = (
+            _encode_categories(
+                descriptions if descriptions is not None else missing
+            )
+        )
+        self.metadata = (
+            metadata
+            if metadata is not None and any(m is not None for m in metadata)
+            else None
+        )
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[Profile]) -> "ProfileCollection":
+        """
+        Build a collection from Profile objects (list or generator).
+
+        The purpose column is filled from ``metadata["purpose"]`` when present.
+
+        Args:
+            profiles: Iterable of Profile objects
+
+        Returns:
+            ProfileCollection holding copies of the coordinates
+        """
+        xs: List[np.ndarray] = []
+        zs: List[np.ndarray] = []
+        names: List[str] = []
+        dates: List[Optional[str]] = []
+        purposes: List[Optional[str]] = []
+        descriptions: List[Optional[str]] = []
+        metadata: List[Optional[Dict[str, Any]]] = []
+        counts: List[int] = []
+
+        for p in profiles:
+            x = np.asarray(p.x, dtype=float)
+            xs.append(x)
+            zs.append(np.asarray(p.z, dtype=float))
+            counts.append(len(x))
+            names.append(p.name)
+            dates.append(p.date)
+            descriptions.append(p.description)
+            metadata.append(p.metadata)
+            purposes.append((p.metadata or {}).get("purpose"))
+
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(
+            np.concatenate(xs) if xs else np.empty(0),
+            np.concatenate(zs) if zs else np.empty(0),
+            offsets,
+            names,
+            dates=dates,
+            purposes=purposes,
+            descriptions=descriptions,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def from_bmap_columns(cls, columns: BMAPColumns) -> "ProfileCollection":
+        """
+        Build a collection from columnar BMAP parse output without copying.
+
+        Descriptions follow ``read_bmap_freeformat`` ("purpose raw_header").
+        Profiles without coordinates are kept as empty profiles.
+
+        Args:
+            columns: Output of ``parse_bmap_columns``
+
+        Returns:
+            ProfileCollection sharing the column arrays
+        """
+        descriptions = []
+        for header in columns.headers:
+            parts = [
+                v
+                for v in (header.get("purpose"), header.get("raw_header"))
+                if v
+            ]
+            descriptions.append(" ".join(parts) if parts else None)
+
+        return cls(
+            columns.x,
+            columns.y,
+            columns.offsets,
+            [h.get("profile_id", "UNKNOWN") for h in columns.headers],
+            dates=[h.get("date") for h in columns.headers],
+            purposes=[h.get("purpose") for h in columns.headers],
+            descriptions=descriptions,
+        )
+
+    @classmethod
+    def from_bmap(cls, file_path: str | Path) -> "ProfileCollection":
+        """
+        Read a BMAP free format file directly into a collection.
+
+        Profiles without coordinates are dropped, matching
+        ``read_bmap_freeformat``.
+
+        Args:
+            file_path: Path to the BMAP file
+
+        Returns:
+            ProfileCollection with one entry per profile in the file
+        """
+        parsed = parse_file(
+            Path(file_path), skip_confirmation=True, columnar=True
+        )
+        if not isinstance(parsed.columns, BMAPColumns):
+            raise ValueError(f"Not a BMAP free format file: {file_path}")
+        collection = cls.from_bmap_columns(parsed.columns)
+        nonempty = np.flatnonzero(collection.counts > 0)
+        if len(nonempty) == len(collection):
+            return collection
+        return collection.take(nonempty)
+
+    # ------------------------------------------------------------------
+    # Sizes and labels
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __repr__(self) -> str:
+        return (
+            f"ProfileCollection(profiles={len(self)}, points={self.n_points}, "
+            f"lines={len(self.name_categories)})"
+        )
+
+    @property
+    def n_points(self) -> int:
+        """Total number of points in the collection."""
+        return int(self.offsets[-1])
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of points in each profile."""
+        return np.diff(self.offsets)
+
+    @staticmethod
+    def _decode(
+        codes: np.ndarray, categories: List[str]
+    ) -> List[Optional[str]]:
+        return [categories[c] if c >= 0 else None for c in codes.tolist()]
+
+    @property
+    def names(self) -> List[Optional[str]]:
+        """Profile (line) name of each profile."""
+        return self._decode(self.name_codes, self.name_categories)
+
+    @property
+    def dates(self) -> List[Optional[str]]:
+        """Survey date string of each profile."""
+        return self._decode(self.date_codes, self.date_categories)
+
+    @property
+    def purposes(self) -> List[Optional[str]]:
+        """Survey purpose code of each profile."""
+        return self._decode(self.purpose_codes, self.purpose_categories)
+
+    @property
+    def descriptions(self) -> List[Optional[str]]:
+        """Description of each profile."""
+        return self._decode(
+            self.description_codes, self.description_categories
+        )
+
+    def point_profile_index(self) -> np.ndarray:
+        """Return the owning profile index of every point."""
+        return np.repeat(np.arange(len(self)), self.counts)
+
+    # ------------------------------------------------------------------
+    # Per-profile access
+    # ------------------------------------------------------------------
+
+    def profile_arrays(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (x, z) views for one profile."""
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return self.x[start:stop], self.z[start:stop]
+
+    def __getitem__(self, index: int) -> Profile:
+        """Return profile ``index`` as a Profile whose arrays are views."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"profile index {index} out of range")
+        x, z = self.profile_arrays(index)
+
+        def label(codes: np.ndarray, categories: List[str]) -> Optional[str]:
+            code = int(codes[index])
+            return categories[code] if code >= 0 else None
+
+        return Profile(
+            name=label(self.name_codes, self.name_categories) or "UNKNOWN",
+            date=label(self.date_codes, self.date_categories),
+            description=label(
+                self.description_codes, self.description_categories
+            ),
+            x=x,
+            z=z,
+            metadata=self.metadata[index] if self.metadata else None,
+        )
+
+    def __iter__(self) -> Iterator[Profile]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_profiles(self) -> List[Profile]:
+        """Convert to a list of Profile objects (arrays are views)."""
+        return list(self)
+
+    def take(self, indices: Sequence[int] | np.ndarray) -> "ProfileCollection":
+        """
+        Return a new collection with the selected profiles (copied).
+
+        Args:
+            indices: Profile indices, in the desired order
+
+        Returns:
+            ProfileCollection containing only the selected profiles
+        """
+        idx = np.asarray(indices, dtype=np.int64)
+        counts = self.counts[idx]
+        offsets = np.zeros(len(idx) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # Gather point positions of all selected profiles in one shot
+        starts = np.repeat(self.offsets[idx] - offsets[:-1], counts)
+        points = starts + np.arange(offsets[-1])
+
+        def pick(values: List[Optional[str]]) -> List[Optional[str]]:
+            return [values[i] for i in idx.tolist()]
+
+        return ProfileCollection(
+            self.x[points],
+            self.z[points],
+            offsets,
+            pick(self.names),
+            dates=pick(self.dates),
+            purposes=pick(self.purposes),
+            descriptions=pick(self.descriptions),
+            y=None if self.y is None else self.y[points],
+            metadata=(
+                [self.metadata[i] for i in idx.tolist()]
+                if self.metadata
+                else None
+            ),
+        )
+
+    def group_by_name(self) -> Iterator[Tuple[str, np.ndarray]]:
+        """
+        Iterate over profile lines.
+
+        Yields:
+            (name, indices) for each distinct profile name in first-appearance
+            order, where ``indices`` are the positions of that line's surveys
+        """
+        order = np.argsort(self.name_codes, kind="stable")
+        codes = self.name_codes[order]
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        for group in np.split(order, bounds):
+            if len(group) == 0:
+                continue
+            code = int(self.name_codes[group[0]])
+            name = self.name_categories[code] if code >= 0 else "UNKNOWN"
+            yield name, group
+
+    # ------------------------------------------------------------------
+    # Vectorized reductions
+    # ------------------------------------------------------------------
+
+    def reduce(self, ufunc: np.ufunc, values: np.ndarray) -> np.ndarray:
+        """
+        Reduce a per-point array to one value per profile.
+
+        Args:
+            ufunc: Binary ufunc such as ``np.minimum``, ``np.maximum`` or
+                ``np.add``
+            values: Per-point values (e.g. ``self.z``)
+
+        Returns:
+            float array with one result per profile (NaN for empty profiles)
+        """
+        out = np.full(len(self), np.nan)
+        nonempty = self.counts > 0
+        if self.n_points:
+            out[nonempty] = ufunc.reduceat(values, self.offsets[:-1][nonempty])
+        return out
+
+    def to_points_dict(self) -> Dict[str, List[List[Tuple[float, float]]]]:
+        """
+        Convert to the ``{name: [[(x, z), ...], ...]}`` mapping used by
+        ``core.profile_stats.calculate_common_ranges``.
+        """
+        xs = self.x.tolist()
+        zs = self.z.tolist()
+        offsets = self.offsets.tolist()
+        result: Dict[str, List[List[Tuple[float, float]]]] = {}
+        for i, name in enumerate(self.names):
+            start, stop = offsets[i], offsets[i + 1]
+            result.setdefault(name or "UNKNOWN", []).append(
+                list(zip(xs[start:stop], zs[start:stop]))
+            )
+        return result
@@ -0,0 +1,258 @@
+"""
+Transect Index Module
+
+This module provides a spatial index of profile transects (origin point and
+azimuth) for assigning large numbers of survey points to their nearest
+profile. Transect lines are densified into vertices held in a KD-tree, so
+each point is only compared against the few transects that pass near it
+instead of against every transect in the network.
+
+Index features:
+- Transects are segments starting at the profile origin and running
+  ``length`` coordinate units along the azimuth (0° = north, clockwise)
+- Nearest-transect queries for whole point arrays in vectorized batches
+- Exact results: the KD-tree only preselects candidates, distances are
+  computed analytically for every candidate
+- Ties go to the transect listed first, as in the origin azimuth file
+"""
+
+from typing import Any, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import (
+    cKDTree,  # type: ignore  # scipy lacks complete type stubs
+)
+
+from .error_handler import BeachProfileError, ErrorCategory
+
+# Default transect length in coordinate units (seaward from the origin)
+DEFAULT_TRANSECT_LENGTH = 10_000.0
+
+# Default spacing of the densified transect vertices in coordinate units
+DEFAULT_VERTEX_SPACING = 50.0
+
+# Point/transect pairs evaluated per block in exhaustive searches
+_BLOCK_PAIRS = 1_000_000
+
+
+class TransectIndex:
+    """
+    Spatial index of profile transects for nearest-transect queries.
+
+    Attributes:
+        profile_ids: Profile ID of each transect, in input order
+        origin_x: Origin X coordinate of each transect
+        origin_y: Origin Y coordinate of each transect
+        azimuth: Azimuth of each transect in degrees
+        length: Transect length in coordinate units
+        spacing: Spacing of the indexed vertices in coordinate units
+    """
+
+    def __init__(
+        self,
+        profile_ids: Iterable[Any],
+        origin_x: Iterable[float],
+        origin_y: Iterable[float],
+        azimuth: Iterable[float],
+        length: float = DEFAULT_TRANSECT_LENGTH,
+        spacing: float = DEFAULT_VERTEX_SPACING,
+    ):
+        self.profile_ids = np.asarray(list(profile_ids), dtype=object)
+        self.origin_x = np.asarray(origin_x, dtype=float)
+        self.origin_y = np.asarray(origin_y, dtype=float)
+        self.azimuth = np.asarray(azimuth, dtype=float)
+        self.length = float(length)
+        self.spacing = float(spacing)
+
+        n = len(self.profile_ids)
+        if not (
+            len(self.origin_x) == len(self.origin_y) == len(self.azimuth) == n
+        ):
+            raise BeachProfileError(
+                "Transect IDs, origins and azimuths must have equal lengths",
+                category=ErrorCategory.VALIDATION,
+            )
+        if not (
+            np.isfinite(self.origin_x).all()
+            and np.isfinite(self.origin_y).all()
+            and np.isfinite(self.azimuth).all()
+        ):
+            raise BeachProfileError(
+                "Transect origins and azimuths must be finite numbers",
+                category=ErrorCategory.VALIDATION,
+            )
+        if self.length < 0 or self.spacing <= 0:
+            raise BeachProfileError(
+                "Transect length must be >= 0 and vertex spacing > 0",
+                category=ErrorCategory.VALIDATION,
+            )
+
+        # Unit direction of each transect (0° = north, clockwise positive)
+        azimuth_rad = np.radians(self.azimuth)
+        self._ux = np.sin(azimuth_rad)
+        self._uy = np.cos(azimuth_rad)
+
+        # Densify transects into vertices from the origin to the end point
+        steps = int(np.ceil(self.length / self.spacing))
+        stations = np.minimum(np.arange(steps + 1) * self.spacing, self.length)
+        vertex_x = self.origin_x[:, None] + self._ux[:, None] * stations
+        vertex_y = self.origin_y[:, None] + self._uy[:, None] * stations
+        self._vertex_transect = np.repeat(np.arange(n), len(stations))
+        self._vertices_per_transect = len(stations)
+        self._tree = (
+            cKDTree(np.column_stack([vertex_x.ravel(), vertex_y.ravel()]))
+            if n
+            else None
+        )
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        origin_azimuths_df: pd.DataFrame,
+        length: float = DEFAULT_TRANSECT_LENGTH,
+        spacing: float = DEFAULT_VERTEX_SPACING,
+    ) -> "TransectIndex":
+        """Build an index from an origin azimuth table.
+
+        Args:
+            origin_azimuths_df: DataFrame with ``profile_id``, ``azimuth``,
+                ``origin_x`` and ``origin_y`` columns
+            length: Transect length in coordinate units
+            spacing: Spacing of the indexed vertices in coordinate units
+
+        Returns:
+            TransectIndex over the rows of the table
+        """
+        return cls(
+            origin_azimuths_df["profile_id"],
+            pd.to_numeric(origin_azimuths_df["origin_x"]),
+            pd.to_numeric(origin_azimuths_df["origin_y"]),
+            pd.to_numeric(origin_azimuths_df["azimuth"]),
+            length=length,
+            spacing=spacing,
+        )
+
+    def __len__(self) -> int:
+        return len(self.profile_ids)
+
+    def nearest(
+        self,
+        x: Any,
+        y: Any,
+        max_distance: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest transect to each point within ``max_distance``.
+
+        Distances are measured to the transect segment, so points beside a
+        transect are measured perpendicular to it and points beyond its
+        ends are measured to the nearest end point.
+
+        Args:
+            x: X coordinates of the points
+            y: Y coordinates of the points
+            max_distance: Largest distance (inclusive) for an assignment
+
+        Returns:
+            Tuple of (transect index per point, -1 where no transect is
+            within ``max_distance``; signed perpendicular offset from the
+            assigned transect, positive to the right looking along the
+            azimuth, NaN where unassigned)
+        """
+        px = np.asarray(x, dtype=float).ravel()
+        py = np.asarray(y, dtype=float).ravel()
+        best = np.full(len(px), -1, dtype=np.int64)
+        offsets = np.full(len(px), np.nan)
+        if self._tree is None or len(px) == 0 or not max_distance >= 0:
+            return best, offsets
+
+        # Any transect within max_distance has a vertex within this radius
+        # (widened slightly to absorb rounding in the vertex coordinates)
+        radius = float(np.hypot(max_distance, self.spacing / 2))
+        radius = radius * (1 + 1e-9) + 1e-6
+        per_transect = min(
+            self._vertices_per_transect,
+            int(2 * radius / self.spacing) + 2,
+        )
+        k = min(self._tree.n, 8 * per_transect)
+        _, vertex = self._tree.query(
+            np.column_stack([px, py]), k=k, distance_upper_bound=radius
+        )
+        vertex = vertex.reshape(len(px), k)
+
+        found = vertex < self._tree.n
+        candidates = np.where(
+            found, self._vertex_transect[np.where(found, vertex, 0)], -1
+        )
+        best, distance = self._closest(px, py, candidates)
+
+        # Points with every neighbour slot filled may have more candidates
+        # than were returned; search those exhaustively
+        crowded = np.flatnonzero(found[:, -1])
+        if len(crowded):
+            best[crowded], distance[crowded] = self._closest_exhaustive(
+                px[crowded], py[crowded]
+            )
+
+        unassigned = ~(distance <= max_distance)
+        best[unassigned] = -1
+        assigned = ~unassigned
+        offsets[assigned] = self._offsets(
+            px[assigned], py[assigned], best[assigned]
+        )
+        return best, offsets
+
+    def _segment_distance(
+        self, px: np.ndarray, py: np.ndarray, transect: np.ndarray
+    ) -> np.ndarray:
+        """Distance from points to transect segments (broadcasting)."""
+        dx = px - self.origin_x[transect]
+        dy = py - self.origin_y[transect]
+        ux = self._ux[transect]
+        uy = self._uy[transect]
+        station = dx * ux + dy * uy
+        beyond = station - np.clip(station, 0.0, self.length)
+        return np.hypot(dx * uy - dy * ux, beyond)
+
+    def _offsets(
+        self, px: np.ndarray, py: np.ndarray, transect: np.ndarray
+    ) -> np.ndarray:
+        """Signed perpendicular offsets of points from transect lines."""
+        dx = px - self.origin_x[transect]
+        dy = py - self.origin_y[transect]
+        return dx * self._uy[transect] - dy * self._ux[transect]
+
+    def _closest(
+        self, px: np.ndarray, py: np.ndarray, candidates: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pick the closest candidate transect per point (-1 = none)."""
+        valid = candidates >= 0
+        safe = np.where(valid, candidates, 0)
+        distance = self._segment_distance(px[:, None], py[:, None], safe)
+        distance[~valid] = np.inf
+
+        # Lowest transect index among the equally closest candidates
+        closest = distance.min(axis=1)
+        tied = valid & (distance == closest[:, None])
+        best = np.where(tied, candidates, len(self)).min(axis=1)
+        best[~np.isfinite(closest)] = -1
+        return best.astype(np.int64), closest
+
+    def _closest_exhaustive(
+        self, px: np.ndarray, py: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Closest transect per point, comparing against every transect."""
+        best = np.empty(len(px), dtype=np.int64)
+        distance = np.empty(len(px))
+        transects = np.arange(len(self))
+        block = max(1, _BLOCK_PAIRS // len(self))
+        for start in range(0, len(px), block):
+            stop = start + block
+            d = self._segment_distance(
+                px[start:stop, None], py[start:stop, None], transects
+            )
+            # argmin returns the first (lowest index) of tied minima
+            best[start:stop] = d.argmin(axis=1)
+            distance[start:stop] = d.min(axis=1)
+        return best, distance
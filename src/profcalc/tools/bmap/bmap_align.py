@@ -20,11 +20,13 @@ Example:
 
 import pandas as pd
 
+from profcalc.common.contour_crossings import crossing_x
+
 
 def _find_x_at_elevation(profile: pd.DataFrame, z_ref: float) -> float | None:
     """
-    Find the X coordinate where the profile crosses a given elevation (Z_ref)
-    using linear interpolation between adjacent points.
+    Find the X coordinate where the profile first crosses a given elevation
+    (Z_ref) using linear interpolation between adjacent points.
 
     Parameters
     ----------
@@ -38,16 +40,7 @@ def _find_x_at_elevation(profile: pd.DataFrame, z_ref: float) -> float | None:
     float | None
         X coordinate of crossing if found, else None.
     """
-    x = profile["X"].values
-    z = profile["Z"].values
-
-    for i in range(len(x) - 1):
-        if (z[i] - z_ref) * (z[i + 1] - z_ref) <= 0 and z[i] != z[i + 1]:
-            # Linear interpolation
-            frac = (z_ref - z[i]) / (z[i + 1] - z[i])
-            return x[i] + frac * (x[i + 1] - x[i])
-
-    return None
+    return crossing_x(profile["X"].values, profile["Z"].values, z_ref, "first")
 
 
 def compute_align_profiles(
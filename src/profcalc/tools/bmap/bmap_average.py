@@ -9,6 +9,17 @@ Generates:
   • Maximum envelope profile
   • Standard deviation profile
 
+``compute_average_profiles`` is the two-profile BMAP tool.
+``compute_ensemble_profiles`` generalizes it to any number of surveys, and
+``compute_ensemble_batch`` runs it over every line of a project. Surveys
+are resampled one at a time onto one grid per line and folded into an
+``EnsembleAccumulator`` (Welford mean/variance, min/max envelope and a
+per-node elevation histogram of at most ``MAX_HISTOGRAM_BINS`` bins for
+approximate percentiles), so the resampled surveys are never held
+together in memory. Given a BMAP file path, the batch reads one line's
+surveys at a time through the profile index instead of loading the
+whole project.
+
 This tool belongs to the 'profcalc.modules' package
 and uses shared interpolation logic from profcalc.core.resampling_core.
 
@@ -16,13 +27,31 @@ Author: Rob & GPT-5
 Date: October 2025
 """
 
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+from profcalc.common.bmap_index import ProfileIndexEntry, load_bmap_index
+from profcalc.common.bmap_io import Profile
+from profcalc.common.error_handler import LogComponent, get_logger
 from profcalc.common.resampling_core import interpolate_to_common_grid
 
+EXTENTS = ("overlap", "union")
+
+# Upper limit on elevation histogram bins per grid node; wider ranges
+# (e.g. -999 fill values) get wider bins instead of more of them
+MAX_HISTOGRAM_BINS = 256
+
+_STAT_NAMES = [
+    "count",
+    "average",
+    "min_envelope",
+    "max_envelope",
+    "std_dev",
+]
+
 
 def compute_average_profiles(
     prof1: pd.DataFrame, prof2: pd.DataFrame, dx: float = 10.0
@@ -60,3 +89,300 @@ def compute_average_profiles(
         "max_envelope": pd.DataFrame({"X": x_common, "Z": z_max}),
         "std_dev": pd.DataFrame({"X": x_common, "Z": z_std}),
     }
+
+
+class EnsembleAccumulator:
+    """
+    Streaming statistics of surveys resampled onto one grid.
+
+    Each ``update`` folds one survey into per-node running statistics:
+    count, mean and sum of squared deviations (Welford's update), the
+    min/max envelope, and a histogram of elevations with ``bin_width``
+    bins from which percentiles are interpolated. Memory depends on the
+    grid and histogram size only, not on the number of surveys, and is
+    at most ``n_nodes * max_bins`` histogram counts.
+
+    Args:
+        n_nodes: Number of grid nodes
+        z_min: Lower edge of the elevation histogram
+        z_max: Upper edge of the elevation histogram (elevations outside
+            the range are counted in the edge bins)
+        bin_width: Requested histogram bin width; widened when the range
+            would need more than ``max_bins`` bins. Percentiles are
+            accurate to within one bin (see the ``bin_width`` attribute).
+        max_bins: Maximum number of histogram bins per node
+    """
+
+    def __init__(
+        self,
+        n_nodes: int,
+        z_min: float,
+        z_max: float,
+        bin_width: float = 0.1,
+        max_bins: int = MAX_HISTOGRAM_BINS,
+    ) -> None:
+        if not bin_width > 0:
+            raise ValueError("bin_width must be positive")
+        if not z_max >= z_min:
+            raise ValueError("z_max must not be below z_min")
+        if max_bins < 1:
+            raise ValueError("max_bins must be at least 1")
+        self.z_min = float(z_min)
+        self.bin_width = float(bin_width)
+        if (z_max - z_min) / self.bin_width >= max_bins:
+            # Spread max_bins bins over the range (the top edge is open)
+            self.bin_width = (z_max - z_min) / max_bins
+        n_bins = min(
+            int(np.floor((z_max - z_min) / self.bin_width)) + 1, max_bins
+        )
+        self.count = np.zeros(n_nodes, dtype=np.int64)
+        self.mean = np.zeros(n_nodes)
+        self.m2 = np.zeros(n_nodes)
+        self.min = np.full(n_nodes, np.nan)
+        self.max = np.full(n_nodes, np.nan)
+        self.histogram = np.zeros((n_nodes, n_bins), dtype=np.int32)
+
+    def update(self, z: np.ndarray) -> None:
+        """Add one survey's elevations at the grid nodes (NaN = no data)."""
+        z = np.asarray(z, dtype=float)
+        node = np.flatnonzero(~np.isnan(z))
+        value = z[node]
+        self.count[node] += 1
+        delta = value - self.mean[node]
+        self.mean[node] += delta / self.count[node]
+        self.m2[node] += delta * (value - self.mean[node])
+        self.min[node] = np.fmin(self.min[node], value)
+        self.max[node] = np.fmax(self.max[node], value)
+        n_bins = self.histogram.shape[1]
+        bin_index = np.clip(
+            np.floor((value - self.z_min) / self.bin_width), 0, n_bins - 1
+        ).astype(np.int64)
+        self.histogram[node, bin_index] += 1
+
+    def std(self, ddof: int = 0) -> np.ndarray:
+        """Standard deviation per node (population by default, as BMAP)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = self.m2 / (self.count - ddof)
+        return np.sqrt(np.where(self.count > ddof, variance, np.nan))
+
+    def average(self) -> np.ndarray:
+        """Mean per node (NaN where no survey has data)."""
+        return np.where(self.count > 0, self.mean, np.nan)
+
+    def percentile(self, q: float) -> np.ndarray:
+        """
+        Approximate ``q``-th percentile per node.
+
+        The rank ``q / 100 * count`` is located in the cumulative
+        histogram and interpolated linearly within its bin, then limited
+        to the exact min/max envelope.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentiles must be between 0 and 100")
+        cumulative = np.cumsum(self.histogram, axis=1)
+        target = q / 100.0 * self.count
+        bin_index = np.argmax(cumulative >= target[:, None], axis=1)
+        rows = np.arange(len(self.count))
+        in_bin = self.histogram[rows, bin_index]
+        before = cumulative[rows, bin_index] - in_bin
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(in_bin > 0, (target - before) / in_bin, 0.0)
+        value = self.z_min + (bin_index + frac) * self.bin_width
+        value = np.minimum(np.maximum(value, self.min), self.max)
+        return np.where(self.count > 0, value, np.nan)
+
+
+def _ensemble_grid(ranges: np.ndarray, dx: float, extent: str) -> np.ndarray:
+    """Grid of ``dx`` spacing over the common or combined survey range."""
+    if extent == "overlap":
+        start, stop = ranges[:, 0].max(), ranges[:, 1].min()
+        if start >= stop:
+            raise ValueError("Profiles do not overlap in X-range.")
+    else:
+        start, stop = ranges[:, 0].min(), ranges[:, 1].max()
+    grid = np.arange(start, stop + dx, dx)
+    return np.unique(np.append(grid[grid <= stop], stop))
+
+
+def _line_ensemble(
+    surveys: Sequence[Tuple[np.ndarray, np.ndarray]],
+    dx: float,
+    extent: str,
+    percentiles: Sequence[float],
+    bin_width: float,
+) -> Dict[str, np.ndarray]:
+    """Ensemble statistics of one line's (x, z) surveys."""
+    if not dx > 0:
+        raise ValueError("dx must be positive")
+    if extent not in EXTENTS:
+        raise ValueError(
+            f"Unknown extent {extent!r}; expected one of {', '.join(EXTENTS)}"
+        )
+    ranges = np.array([(x.min(), x.max()) for x, _ in surveys])
+    grid = _ensemble_grid(ranges, dx, extent)
+    z_min = min(float(np.min(z)) for _, z in surveys)
+    z_max = max(float(np.max(z)) for _, z in surveys)
+    accumulator = EnsembleAccumulator(len(grid), z_min, z_max, bin_width)
+    for (x, z), (x_start, x_end) in zip(surveys, ranges):
+        order = np.argsort(x, kind="stable")
+        z_grid = np.interp(grid, x[order], z[order])
+        covered = (grid >= x_start) & (grid <= x_end)
+        accumulator.update(np.where(covered, z_grid, np.nan))
+
+    stats = {
+        "X": grid,
+        "count": accumulator.count,
+        "average": accumulator.average(),
+        "min_envelope": accumulator.min,
+        "max_envelope": accumulator.max,
+        "std_dev": accumulator.std(),
+    }
+    for q in percentiles:
+        stats[f"p{q:g}"] = accumulator.percentile(q)
+    return stats
+
+
+def compute_ensemble_profiles(
+    profiles: Iterable[pd.DataFrame],
+    dx: float = 10.0,
+    extent: str = "overlap",
+    percentiles: Sequence[float] = (10, 50, 90),
+    bin_width: float = 0.1,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Compute average, envelope, std. deviation and percentile profiles of
+    any number of surveys of one line.
+
+    Parameters
+    ----------
+    profiles : iterable of pd.DataFrame
+        Input profiles, each with columns ['X', 'Z'].
+    dx : float, optional
+        Global X spacing for interpolation (default = 10 ft).
+    extent : str, optional
+        "overlap" (default) uses the X range common to every survey;
+        "union" uses the combined range, each node summarizing the surveys
+        that cover it.
+    percentiles : sequence of float, optional
+        Percentiles to estimate (default 10, 50 and 90).
+    bin_width : float, optional
+        Elevation histogram bin width in ft; percentiles are accurate to
+        within one bin (default = 0.1 ft). Bins are widened where a line's
+        elevation range would need more than ``MAX_HISTOGRAM_BINS``.
+
+    Returns
+    -------
+    profiles : dict of pd.DataFrame
+        {
+            "average", "min_envelope", "max_envelope", "std_dev",
+            "p10", "p50", "p90", ...: DataFrame(X, Z),
+            "count": DataFrame(X, Z) with the number of surveys per node
+        }
+        The standard deviation is the population value, as in
+        ``compute_average_profiles``.
+    """
+    surveys = [
+        (
+            np.asarray(p["X"], dtype=float),
+            np.asarray(p["Z"], dtype=float),
+        )
+        for p in profiles
+    ]
+    surveys = [(x, z) for x, z in surveys if len(x) > 0]
+    if not surveys:
+        raise ValueError("At least one non-empty profile is required")
+    stats = _line_ensemble(surveys, dx, extent, percentiles, bin_width)
+    x_grid = stats.pop("X")
+    return {
+        name: pd.DataFrame({"X": x_grid, "Z": values})
+        for name, values in stats.items()
+    }
+
+
+def _surveys_by_line(
+    profiles: Iterable[Profile] | str | Path,
+    lines: Optional[Sequence[str]],
+) -> Iterator[Tuple[str, List[Tuple[np.ndarray, np.ndarray]]]]:
+    """Yield each line's non-empty (x, z) surveys, one line at a time.
+
+    A BMAP file path is grouped through its profile index, so only the
+    surveys of the current line are read into memory.
+    """
+    wanted = None if lines is None else set(lines)
+    if isinstance(profiles, (str, Path)):
+        index = load_bmap_index(profiles)
+        entries: Dict[str, List[ProfileIndexEntry]] = {}
+        for entry in index:
+            if wanted is None or entry.name in wanted:
+                entries.setdefault(entry.name, []).append(entry)
+        for name, line_entries in entries.items():
+            surveys = [index.read_profile(e) for e in line_entries]
+            yield name, [_survey_xz(p) for p in surveys if len(p.x) > 0]
+        return
+
+    grouped: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
+    for p in profiles:
+        if len(p.x) > 0 and (wanted is None or p.name in wanted):
+            grouped.setdefault(p.name, []).append(_survey_xz(p))
+    yield from grouped.items()
+
+
+def _survey_xz(profile: Profile) -> Tuple[np.ndarray, np.ndarray]:
+    """Float (x, z) arrays of a profile (no copy if already float)."""
+    return (
+        np.asarray(profile.x, dtype=float),
+        np.asarray(profile.z, dtype=float),
+    )
+
+
+def compute_ensemble_batch(
+    profiles: Iterable[Profile] | str | Path,
+    dx: float = 10.0,
+    extent: str = "overlap",
+    percentiles: Sequence[float] = (10, 50, 90),
+    bin_width: float = 0.1,
+    lines: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Ensemble statistics of every line in a project.
+
+    Surveys are grouped by profile name; see ``compute_ensemble_profiles``
+    for the parameters.
+
+    Parameters
+    ----------
+    profiles : iterable of Profile, or str or Path
+        Profiles of all lines and surveys, or the path of a BMAP free
+        format file. A path is read one line at a time through its
+        profile index (``bmap_index.load_bmap_index``), so large projects
+        are never loaded whole; profiles given in memory are grouped
+        without copying their coordinates.
+    lines : sequence of str, optional
+        Lines to process (default: every line, in first-appearance order).
+
+    Returns
+    -------
+    pd.DataFrame
+        Long table with one row per line and grid node: line, X, count,
+        average, min_envelope, max_envelope, std_dev and one column per
+        percentile (p10, p50, p90, ...). Lines whose surveys do not
+        overlap (with ``extent="overlap"``) are skipped with a warning.
+    """
+    logger = get_logger(LogComponent.DATA_PROCESSING)
+    blocks = []
+    for name, surveys in _surveys_by_line(profiles, lines):
+        try:
+            stats = _line_ensemble(surveys, dx, extent, percentiles, bin_width)
+        except ValueError as e:
+            logger.warning(f"Ensemble skipped for line {name}: {e}")
+            continue
+        block = pd.DataFrame(stats)
+        block.insert(0, "line", name)
+        blocks.append(block)
+
+    if not blocks:
+        return pd.DataFrame(
+            columns=["line", "X", *_STAT_NAMES]
+            + [f"p{q:g}" for q in percentiles]
+        )
+    return pd.concat(blocks, ignore_index=True)
@@ -17,6 +17,8 @@ Behavior (matches BMAP):
     * Bar Length (XEnd - XStart)
     * Center of Mass X (centroid of bar volume above trough baseline)
 - Preserve directional behavior: crossings come from sign changes of (Z_ref - Z_spec).
+- ``--method exact`` computes the Specific profile properties from its own
+  points (analytic integration) instead of the dX grid.
 
 CLI examples:
 (1) List crossing pairs only:
@@ -43,10 +45,17 @@ from typing import List, Tuple
 
 import numpy as np
 
-from profcalc.common.bmap_io import read_bmap_freeformat
+from profcalc.common.bmap_index import load_bmap_index
 from profcalc.common.config_utils import get_dx
 from profcalc.common.error_handler import LogComponent, get_logger
 from profcalc.common.io_reports import write_bar_properties_report
+from profcalc.common.profile_integration import (
+    INTEGRATION_METHODS,
+    area_above,
+    check_integration_method,
+    moment_above,
+    profile_window,
+)
 
 # ----------------------------
 # Small helpers
@@ -171,15 +180,24 @@ def _interp_clip(
 
 
 def compute_bar_properties_specific(
-    profile, xstart: float, xend: float, dx: float
+    profile, xstart: float, xend: float, dx: float, method: str = "grid"
 ) -> BarProps:
     """
     Compute bar properties within [xstart, xend] using SPECIFIC profile elevations.
     Baseline is horizontal at the trough elevation in that window.
+
+    ``method="exact"`` takes the trough and crest from the profile points
+    and integrates volume and moment analytically instead of on the dX grid.
     """
-    xg, zg = _interp_clip(
-        np.asarray(profile.x), np.asarray(profile.z), xstart, xend, dx
-    )
+    check_integration_method(method)
+    if method == "exact":
+        if xend <= xstart:
+            raise ValueError("xend must be greater than xstart")
+        xg, zg = profile_window(profile.x, profile.z, xstart, xend)
+    else:
+        xg, zg = _interp_clip(
+            np.asarray(profile.x), np.asarray(profile.z), xstart, xend, dx
+        )
 
     # Trough (minimum Z) and Crest (maximum Z) in the window
     i_tr = int(np.argmin(zg))
@@ -189,17 +207,23 @@ def compute_bar_properties_specific(
     z_cr = float(zg[i_cr])
     x_cr = float(xg[i_cr])
 
-    # Height field above trough baseline
-    h = zg - z_tr
-    h[h < 0.0] = 0.0
+    if method == "exact":
+        # Piecewise-linear profile: the trough is its lowest node, so the
+        # whole window lies on or above the baseline
+        area_ft3_per_ft = area_above(xg, zg, z_tr)
+        moment = moment_above(xg, zg, z_tr)
+    else:
+        # Height field above trough baseline
+        h = zg - z_tr
+        h[h < 0.0] = 0.0
+        area_ft3_per_ft = float(np.trapz(h, xg))
+        moment = float(np.trapz(xg * h, xg))
 
     # Volume (ft^3/ft), then convert to cu yd/ft
-    area_ft3_per_ft = float(np.trapz(h, xg))
     vol_cuyd_per_ft = area_ft3_per_ft / 27.0
 
     # Center of mass X
     if area_ft3_per_ft > 0:
-        moment = float(np.trapz(xg * h, xg))
         x_cm = moment / area_ft3_per_ft
     else:
         x_cm = float("nan")
@@ -270,18 +294,25 @@ def main():
         default=None,
         help="Analysis spacing in feet (default from config.json)",
     )
+    ap.add_argument(
+        "--method",
+        choices=INTEGRATION_METHODS,
+        default="grid",
+        help="Integration method: 'grid' (resample at dX, BMAP behavior) "
+        "or 'exact' (integrate profile segments analytically)",
+    )
     args = ap.parse_args()
 
     dx = args.dx if args.dx is not None else get_dx()
 
     # Load Specific profile (always required)
-    profs2 = read_bmap_freeformat(args.input2)
+    index2 = load_bmap_index(args.input2)
     p_spec = None
     key2 = (args.sel2 or "").strip().lower()
-    for p in profs2:
-        lab = _label(p).lower()
+    for entry in index2:
+        lab = _label(entry).lower()
         if lab == key2 or lab.startswith(key2):
-            p_spec = p
+            p_spec = index2.read_profile(entry)
             break
     if p_spec is None:
         raise SystemExit(f"No Specific profile matched: {args.sel2}")
@@ -296,13 +327,13 @@ def main():
 
     if ref_mode:
         # Load Reference profile; must be different from Specific
-        profs1 = read_bmap_freeformat(args.input1)
+        index1 = load_bmap_index(args.input1)
         p_ref = None
         key1 = args.sel1.strip().lower()
-        for p in profs1:
-            lab = _label(p).lower()
+        for entry in index1:
+            lab = _label(entry).lower()
             if lab == key1 or lab.startswith(key1):
-                p_ref = p
+                p_ref = index1.read_profile(entry)
                 break
         if p_ref is None:
             raise SystemExit(f"No Reference profile matched: {args.sel1}")
@@ -349,7 +380,9 @@ def main():
         xstart, xend = float(args.xstart), float(args.xend)
 
     # Compute properties on Specific within [xstart, xend]
-    props = compute_bar_properties_specific(p_spec, xstart, xend, dx)
+    props = compute_bar_properties_specific(
+        p_spec, xstart, xend, dx, args.method
+    )
 
     # Write report if requested
     if args.output:
@@ -10,6 +10,8 @@ Computes:
 - Horizontal shift of a user-specified contour (ft)
 
 Uses global dX from config_utils.py, consistent with BMAP behavior.
+With ``method="exact"`` the volume change is integrated analytically from
+the profile points instead (the comparison table still uses the dX grid).
 
 Example:
     diff_df, report = compute_compare_profiles(
@@ -25,25 +27,24 @@ import numpy as np
 import pandas as pd
 
 from profcalc.common.config_utils import get_dx
+from profcalc.common.contour_crossings import crossing_x
+from profcalc.common.profile_integration import (
+    check_integration_method,
+    difference_areas,
+)
 
 
 def _interp_x_at_contour(
     profile: pd.DataFrame, contour: float
 ) -> float | None:
     """
-    Find the X coordinate where the profile crosses the specified elevation (contour)
-    using linear interpolation between adjacent points.
+    Find the X coordinate where the profile first crosses the specified
+    elevation (contour), interpolating linearly between adjacent points.
     Returns None if the contour is not intersected.
     """
-    x = profile["X"].values
-    z = profile["Z"].values
-
-    for i in range(len(x) - 1):
-        if (z[i] - contour) * (z[i + 1] - contour) <= 0 and z[i] != z[i + 1]:
-            frac = (contour - z[i]) / (z[i + 1] - z[i])
-            return x[i] + frac * (x[i + 1] - x[i])
-
-    return None
+    return crossing_x(
+        profile["X"].values, profile["Z"].values, contour, "first"
+    )
 
 
 def compute_compare_profiles(
@@ -52,6 +53,7 @@ def compute_compare_profiles(
     xon: float,
     xoff: float,
     contour: float,
+    method: str = "grid",
 ) -> tuple[pd.DataFrame, str]:
     """
     Compare two profiles between Xon and Xoff using global dX spacing.
@@ -68,6 +70,9 @@ def compute_compare_profiles(
         Seaward limit (ft).
     contour : float
         Elevation (ft NAVD) at which contour change is measured.
+    method : str
+        Volume integration: "grid" (trapezoid rule on the dX grid, BMAP
+        behavior) or "exact" (piecewise-linear profiles over [xon, xoff]).
 
     Returns
     -------
@@ -84,6 +89,7 @@ def compute_compare_profiles(
 
     if xoff <= xon:
         raise ValueError("xoff must be greater than xon.")
+    check_integration_method(method)
 
     # --- Get global dX ---
     dx = get_dx()
@@ -99,7 +105,17 @@ def compute_compare_profiles(
     dz = z1 - z2
 
     # --- Volume change (ft³/ft → yd³/ft) ---
-    vol_ft3_per_ft = np.trapz(dz, x_grid)
+    if method == "exact":
+        vol_ft3_per_ft, _, _ = difference_areas(
+            profile1["X"],
+            profile1["Z"],
+            profile2["X"],
+            profile2["Z"],
+            xon,
+            xoff,
+        )
+    else:
+        vol_ft3_per_ft = float(np.trapz(dz, x_grid))
     vol_cuyd_per_ft = float(vol_ft3_per_ft) / 27.0
 
     # --- Contour change (horizontal shift) ---
@@ -120,6 +136,7 @@ def compute_compare_profiles(
         "volume_cuyd_per_ft": float(vol_cuyd_per_ft),
         "contour_change_ft": float(contour_change),
         "dx_ft": float(dx),
+        "method": method,
     }
 
     # --- Determine profile names from metadata (if available) ---
@@ -11,6 +11,9 @@ Behavior:
 - Profiles are interpolated to a uniform grid with spacing dX (default = 10 ft)
 - Volumes integrated with trapezoidal rule
 - Report format matches BMAP's Cut & Fill report
+- ``compute_cut_fill`` returns the same numbers without writing a report;
+  ``compute_cut_fill_batch`` runs many profile pairs (e.g. every line's
+  before/after-dredge surveys) into a summary table and per-cell tables
 
 Example:
     python tool_cut_fill.py \
@@ -27,13 +30,16 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 from scipy.interpolate import UnivariateSpline  # type: ignore
 
-from profcalc.common.bmap_io import read_bmap_freeformat
+from profcalc.common.bmap_index import load_bmap_index
+from profcalc.common.bmap_io import Profile
 from profcalc.common.config_utils import get_dx
+from profcalc.common.contour_crossings import crossing_x
 from profcalc.common.error_handler import LogComponent, get_logger
 from profcalc.common.io_reports import write_cutfill_detailed_report
 
@@ -132,17 +138,30 @@ def _shoreline_x(x: np.ndarray, z: np.ndarray) -> Optional[float]:
     ):
         return None
     x, z = _ensure_sorted(x, z)
-    xr = None
-    for i in range(1, len(x)):
-        z1, z2 = z[i - 1], z[i]
-        if z1 == 0.0:
-            xr = x[i - 1]
-        if (z1 * z2) < 0.0:
-            frac = -z1 / (z2 - z1)
-            xr = x[i - 1] + frac * (x[i] - x[i - 1])
-        if z2 == 0.0:
-            xr = x[i]
-    return xr
+    return crossing_x(x, z, 0.0, "last")
+
+
+def _interp_or_flat(x: np.ndarray, z: np.ndarray, xq) -> np.ndarray:
+    """BMAP-style interpolation with flat extension beyond the profile."""
+    xq = np.asarray(xq, dtype=float)
+    return np.where(
+        xq <= x[0], z[0], np.where(xq >= x[-1], z[-1], np.interp(xq, x, z))
+    )
+
+
+def _crossings(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """X positions where piecewise-linear ``y`` changes sign, in order."""
+    i = np.flatnonzero(y[:-1] * y[1:] < 0.0)
+    frac = -y[i] / (y[i + 1] - y[i])
+    return x[i] + frac * (x[i + 1] - x[i])
+
+
+def _running_total(values: np.ndarray) -> float:
+    """Sum left to right from 0.0, as a Python ``total += v`` loop does."""
+    if len(values) == 0:
+        return 0.0
+    # np.cumsum adds sequentially; adding 0.0 turns a -0.0 result into 0.0
+    return float(np.cumsum(values)[-1]) + 0.0
 
 
 # Module-level helper: split trapezoid area across datum (z=0)
@@ -168,11 +187,329 @@ def split_trap_area(
             return area2, area1
 
 
+def split_trap_areas(
+    xa: np.ndarray, xb: np.ndarray, za: np.ndarray, zb: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``split_trap_area`` over arrays of trapezoids.
+
+    Returns:
+        Tuple of (area_above, area_below) arrays, element-wise identical
+        to calling ``split_trap_area`` on each trapezoid
+    """
+    xa, xb, za, zb = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (xa, xb, za, zb))
+    )
+    whole = 0.5 * (za + zb) * (xb - xa)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = -za / (zb - za)
+        x_cross = xa + frac * (xb - xa)
+        area1 = 0.5 * (za + 0) * (x_cross - xa)
+        area2 = 0.5 * (0 + zb) * (xb - x_cross)
+    above_only = (za >= 0) & (zb >= 0)
+    below_only = ~above_only & (za <= 0) & (zb <= 0)
+    crossing = ~(above_only | below_only)
+    first_above = za > 0
+    above = np.where(
+        above_only,
+        whole,
+        np.where(crossing, np.where(first_above, area1, area2), 0.0),
+    )
+    below = np.where(
+        below_only,
+        whole,
+        np.where(crossing, np.where(first_above, area2, area1), 0.0),
+    )
+    return above, below
+
+
+def _datum_areas(
+    z0: np.ndarray, z1: np.ndarray, x0: np.ndarray, x1: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Areas strictly above and below z=0 of linear segments.
+
+    Ported ProfileAnalysis_v129 rules (a zero end counts as neither above
+    nor below), which differ from ``split_trap_areas`` at z=0 exactly.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Crossing measured from the positive and from the negative end
+        x_down = x0 + (z0 / (z0 - z1)) * (x1 - x0)
+        x_up = x0 + (-z0 / (z1 - z0)) * (x1 - x0)
+    whole = 0.5 * (z0 + z1) * (x1 - x0)
+    above = np.select(
+        [(z0 > 0) & (z1 > 0), (z0 > 0) & (z1 <= 0), (z0 <= 0) & (z1 > 0)],
+        [
+            whole,
+            0.5 * (z0 + 0.0) * (x_down - x0),
+            0.5 * (0.0 + z1) * (x1 - x_up),
+        ],
+        0.0,
+    )
+    below = np.select(
+        [(z0 < 0) & (z1 < 0), (z0 < 0) & (z1 >= 0), (z0 >= 0) & (z1 < 0)],
+        [
+            whole,
+            0.5 * (z0 + 0.0) * (x_up - x0),
+            0.5 * (0.0 + z1) * (x1 - x_down),
+        ],
+        0.0,
+    )
+    return above, below
+
+
 # ---------------------------------------------------------------------
 # Core computation
 # ---------------------------------------------------------------------
 
 
+def _cut_fill_arrays(
+    x1: np.ndarray,
+    z1: np.ndarray,
+    x2: np.ndarray,
+    z2: np.ndarray,
+    x_on: float,
+    x_off: float,
+    dx: float,
+    use_ported_logic: bool,
+) -> dict:
+    """Cut/fill between two sorted (and smoothed) profiles over Xon..Xoff.
+
+    Every cell is computed at once with array operations; running totals
+    are accumulated left to right so results match the per-cell loops of
+    the original implementation exactly.
+    """
+    if use_ported_logic:
+        # --- Ported logic from ProfileAnalysis_v129.py ---
+        # Cell boundaries: profile intersections and endpoints only
+        xs_all = np.union1d(x1, x2)
+        dz_all = _interp_or_flat(x2, z2, xs_all) - _interp_or_flat(
+            x1, z1, xs_all
+        )
+        intersection_xs = _crossings(xs_all, dz_all)
+        inside = (intersection_xs > x_on) & (intersection_xs < x_off)
+        edges = np.concatenate(
+            [[x_on], np.sort(intersection_xs[inside]), [x_off]]
+        )
+    else:
+        # --- Original logic: uniform grid (dx) with datum crossings ---
+        edges = np.arange(x_on, x_off + dx, dx)
+        if edges[-1] > x_off:
+            edges[-1] = x_off
+        datum_xs = np.concatenate([_crossings(x1, z1), _crossings(x2, z2)])
+        inside = (datum_xs > x_on) & (datum_xs < x_off)
+        edges = np.unique(np.concatenate([edges, datum_xs[inside]]))
+
+    z1_e = _interp_or_flat(x1, z1, edges)
+    z2_e = _interp_or_flat(x2, z2, edges)
+    dz_e = z2_e - z1_e
+    x0, x1_ = edges[:-1], edges[1:]
+
+    # Δz and per-cell volume (variable-width cells)
+    cell_thickness = 0.5 * (dz_e[:-1] + dz_e[1:])
+    cell_vol_cuyd_per_ft = cell_thickness * (x1_ - x0) / 27.0
+    cells = {
+        "end_x": x1_,
+        "end_z2": z2_e[1:],
+        "cell_vol_cuyd_per_ft": cell_vol_cuyd_per_ft,
+        "cell_thickness_ft": cell_thickness,
+        "cum_vol_cuyd_per_ft": np.cumsum(cell_vol_cuyd_per_ft),
+        "gross_vol_cuyd_per_ft": np.cumsum(np.abs(cell_vol_cuyd_per_ft)),
+    }
+
+    abv1, blw1 = split_trap_areas(x0, x1_, z1_e[:-1], z1_e[1:])
+    abv2, blw2 = split_trap_areas(x0, x1_, z2_e[:-1], z2_e[1:])
+    if use_ported_logic:
+        # BMAP-style:
+        #   Above datum: (Template above datum) - (BD above datum)
+        #   Below datum: (BD below datum) - (Template below datum)
+        above_t, below_t = _datum_areas(z1_e[:-1], z1_e[1:], x0, x1_)
+        above_b, below_b = _datum_areas(z2_e[:-1], z2_e[1:], x0, x1_)
+        above_datum = _running_total(above_t - above_b) / 27.0
+        below_datum = _running_total(below_b - below_t) / 27.0
+        total_volume = float(np.sum(cell_vol_cuyd_per_ft))
+
+        # Per-cell above/below datum split of each profile and of Δz
+        abv_d, blw_d = split_trap_areas(x0, x1_, dz_e[:-1], dz_e[1:])
+        cells.update(
+            {
+                "z1_above": abv1,
+                "z1_below": blw1,
+                "z2_above": abv2,
+                "z2_below": blw2,
+                "dz_above": abv_d,
+                "dz_below": blw_d,
+                "dz_net": abv_d + blw_d,
+            }
+        )
+    else:
+        # Split each profile at datum and compute net above/below areas
+        above_datum = _running_total((abv2 - abv1) / 27.0)
+        below_datum = _running_total((blw2 - blw1) / 27.0)
+        total_volume = _running_total(cell_vol_cuyd_per_ft)
+
+    # Shoreline intersection (seaward-most crossing)
+    xs1_sh = _shoreline_x(x1, z1)
+    xs2_sh = _shoreline_x(x2, z2)
+    if xs1_sh is not None and xs2_sh is not None:
+        sh_change = float(xs2_sh - xs1_sh)
+        xs1_out, xs2_out = float(xs1_sh), float(xs2_sh)
+    else:
+        sh_change = float("nan")
+        xs1_out, xs2_out = float("nan"), float("nan")
+
+    return {
+        "x_on": float(x_on),
+        "x_off": float(x_off),
+        "above_datum_cuyd_per_ft": above_datum,
+        "below_datum_cuyd_per_ft": below_datum,
+        "total_volume_cuyd_per_ft": total_volume,
+        "shoreline_from_x": xs1_out,
+        "shoreline_to_x": xs2_out,
+        "shoreline_change": sh_change,
+        "cells": cells,
+    }
+
+
+def compute_cut_fill(
+    p1,
+    p2,
+    dx: float = 10.0,
+    smoothing: Optional[float] = None,
+    use_ported_logic: bool = False,
+) -> dict:
+    """
+    Compute BMAP-style cut and fill between two profiles.
+
+    This is the calculation behind ``compute_cut_fill_detailed`` without
+    the report: the same numbers, returned as a dict.
+
+    Args:
+        p1: First profile (e.g. the before-dredge survey)
+        p2: Second profile (e.g. the after-dredge survey)
+        dx: Grid spacing in ft (original logic only)
+        smoothing: Spline smoothing factor (see ``smooth_profile``)
+        use_ported_logic: Use the ProfileAnalysis_v129 cell boundaries
+            (profile intersections only) and datum rules
+
+    Returns:
+        Dict with x_on, x_off, above_datum_cuyd_per_ft,
+        below_datum_cuyd_per_ft, total_volume_cuyd_per_ft,
+        shoreline_from_x, shoreline_to_x and shoreline_change (NaN when
+        either profile has no shoreline), plus ``cells``: a dict of
+        per-cell arrays (end_x, end_z2, cell_vol_cuyd_per_ft,
+        cell_thickness_ft, cum_vol_cuyd_per_ft, gross_vol_cuyd_per_ft and,
+        for the ported logic, the above/below datum split of each cell)
+
+    Raises:
+        ValueError: If the profiles do not overlap in X
+    """
+    # Sort and restrict to overlapping X range
+    x1, z1 = _ensure_sorted(p1.x, p1.z)
+    x2, z2 = _ensure_sorted(p2.x, p2.z)
+    x_on, x_off = _overlap_bounds(x1, x2)
+
+    # Apply cubic spline smoothing to both profiles
+    z1 = smooth_profile(x1, z1, smoothing)
+    z2 = smooth_profile(x2, z2, smoothing)
+    return _cut_fill_arrays(x1, z1, x2, z2, x_on, x_off, dx, use_ported_logic)
+
+
+def pair_profiles_by_name(before, after) -> list:
+    """
+    Pair each profile in ``before`` with the same-named one in ``after``.
+
+    Args:
+        before: Profiles of the earlier survey
+        after: Profiles of the later survey
+
+    Returns:
+        List of (before, after) profile tuples in ``before`` order; lines
+        missing from ``after`` are left out (the first profile of a
+        repeated name is used)
+    """
+    later: Dict[str, Profile] = {}
+    for p in after:
+        later.setdefault(p.name, p)
+    return [(p, later[p.name]) for p in before if p.name in later]
+
+
+def compute_cut_fill_batch(
+    pairs,
+    dx: float = 10.0,
+    smoothing: Optional[float] = 0.0,
+    use_ported_logic: bool = False,
+    include_cells: bool = False,
+) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """
+    Run cut and fill for many profile pairs.
+
+    Args:
+        pairs: Iterable of (profile1, profile2) tuples, e.g. from
+            ``pair_profiles_by_name``
+        dx: Grid spacing in ft (original logic only)
+        smoothing: Spline smoothing factor (default 0: no smoothing, as in
+            BMAP and the CLI)
+        use_ported_logic: Use the ProfileAnalysis_v129 logic
+        include_cells: Also return the per-cell tables
+
+    Returns:
+        Tuple of (summary, cells). ``summary`` has one row per pair with
+        the pair index, both profile labels and the ``compute_cut_fill``
+        results (NaN for pairs that do not overlap). ``cells`` is None
+        unless ``include_cells`` is set, in which case it holds every
+        cell of every pair, keyed by ``pair`` and 1-based ``cell`` number.
+    """
+    logger = get_logger(LogComponent.DATA_PROCESSING)
+    rows = []
+    cell_tables = []
+    for i, (p1, p2) in enumerate(pairs):
+        row = {
+            "pair": i,
+            "profile1": _header_string(p1),
+            "profile2": _header_string(p2),
+        }
+        try:
+            result = compute_cut_fill(
+                p1, p2, dx, smoothing, use_ported_logic=use_ported_logic
+            )
+        except ValueError as e:
+            logger.warning(f"Cut/Fill skipped for pair {i}: {e}")
+            rows.append(row)
+            continue
+        cells = result.pop("cells")
+        row.update(result)
+        rows.append(row)
+        if include_cells:
+            table = pd.DataFrame(cells)
+            table.insert(0, "cell", np.arange(1, len(table) + 1))
+            table.insert(0, "pair", i)
+            cell_tables.append(table)
+
+    summary = pd.DataFrame(
+        rows,
+        columns=[
+            "pair",
+            "profile1",
+            "profile2",
+            "x_on",
+            "x_off",
+            "above_datum_cuyd_per_ft",
+            "below_datum_cuyd_per_ft",
+            "total_volume_cuyd_per_ft",
+            "shoreline_from_x",
+            "shoreline_to_x",
+            "shoreline_change",
+        ],
+    )
+    if not include_cells:
+        return summary, None
+    cell_table = (
+        pd.concat(cell_tables, ignore_index=True)
+        if cell_tables
+        else pd.DataFrame(columns=["pair", "cell"])
+    )
+    return summary, cell_table
+
+
 def compute_cut_fill_detailed(
     p1,
     p2,
@@ -202,201 +539,10 @@ def compute_cut_fill_detailed(
     # Use smoothed profiles for all subsequent logic
     z1, z2 = z1_smoothed, z2_smoothed
 
-    if use_ported_logic:
-        # --- Ported logic from ProfileAnalysis_v129.py ---
-        xs1, ys1 = x1, z1
-        xs2, ys2 = x2, z2
-        xs_all = np.array(sorted(set(xs1) | set(xs2)))
-        y1_interp = np.array([interp_or_flat(xs1, ys1, x) for x in xs_all])
-        y2_interp = np.array([interp_or_flat(xs2, ys2, x) for x in xs_all])
-        # Cell boundaries: intersections and endpoints only
-        dz_all = y2_interp - y1_interp
-        intersection_xs = []
-        for i in range(1, len(xs_all)):
-            if dz_all[i - 1] * dz_all[i] < 0.0:
-                frac = -dz_all[i - 1] / (dz_all[i] - dz_all[i - 1])
-                x_cross = xs_all[i - 1] + frac * (xs_all[i] - xs_all[i - 1])
-                intersection_xs.append(x_cross)
-        cell_boundaries = (
-            [x_on]
-            + sorted([x for x in intersection_xs if x_on < x < x_off])
-            + [x_off]
-        )
-        z1_cb = np.array(
-            [interp_or_flat(xs1, ys1, x) for x in cell_boundaries]
-        )
-        z2_cb = np.array(
-            [interp_or_flat(xs2, ys2, x) for x in cell_boundaries]
-        )
-        # The rest of the ported logic can now use cell_boundaries, z1_cb, z2_cb
-        # (Replace all uses of cell_edges, y1_interp, y2_interp with these)
-        # Δz and per-cell volume (variable-width cells)
-        dz_cb = z2_cb - z1_cb
-        nseg = len(cell_boundaries) - 1
-        cell_vol_ft3_per_ft: np.ndarray = np.empty(nseg, dtype=float)
-        cell_vol_cuyd_per_ft: np.ndarray = np.empty(nseg, dtype=float)
-        cell_thickness: np.ndarray = np.empty(nseg, dtype=float)
-        for i in range(nseg):
-            width = cell_boundaries[i + 1] - cell_boundaries[i]
-            dz_a = dz_cb[i]
-            dz_b = dz_cb[i + 1]
-            vol_ft3 = 0.5 * (dz_a + dz_b) * width
-            cell_vol_ft3_per_ft[i] = vol_ft3
-            cell_vol_cuyd_per_ft[i] = vol_ft3 / 27.0
-            cell_thickness[i] = 0.5 * (dz_a + dz_b)
-
-        # Running totals
-        cum_vol: np.ndarray = np.cumsum(cell_vol_cuyd_per_ft)
-        gross_vol: np.ndarray = np.cumsum(np.abs(cell_vol_cuyd_per_ft))
-
-        # Above and below datum volumes (z=0) with datum-splitting for each cell
-        def split_cell_at_datum(x0, x1, z1_0, z2_0, z1_1, z2_1):
-            # Returns list of (x_start, x_end, z1_start, z2_start, z1_end, z2_end) for sub-cells split at z=0
-            # Linear interpolation for z=0 crossing
-            result = []
-            # Check for crossings in either profile
-            crossings = []
-            for z_start, z_end in [(z1_0, z1_1), (z2_0, z2_1)]:
-                if (z_start < 0 and z_end > 0) or (z_start > 0 and z_end < 0):
-                    frac = -z_start / (z_end - z_start)
-                    x_cross = x0 + frac * (x1 - x0)
-                    crossings.append(x_cross)
-            # Remove duplicates and sort
-            crossings = sorted(set([x0, x1] + crossings))
-            # Build sub-cells
-            for i in range(len(crossings) - 1):
-                xa, xb = crossings[i], crossings[i + 1]
-
-                # Interpolate z1, z2 at xa, xb
-                def interp_z(z0, z1, x0, x1, x):
-                    if x1 == x0:
-                        return z0
-                    return z0 + (z1 - z0) * (x - x0) / (x1 - x0)
-
-                za1 = interp_z(z1_0, z1_1, x0, x1, xa)
-                za2 = interp_z(z2_0, z2_1, x0, x1, xa)
-                zb1 = interp_z(z1_0, z1_1, x0, x1, xb)
-                zb2 = interp_z(z2_0, z2_1, x0, x1, xb)
-                result.append((xa, xb, za1, za2, zb1, zb2))
-            return result
-
-        # BMAP-style: For each segment (split at datum if needed),
-        #   Above datum: (Template above datum) - (BD above datum)
-        #   Below datum: (BD below datum) - (Template below datum)
-        def area_above(z0, z1, x0, x1):
-            if z0 > 0 and z1 > 0:
-                return 0.5 * (z0 + z1) * (x1 - x0)
-            elif z0 > 0 and z1 <= 0:
-                frac = z0 / (z0 - z1)
-                x_cross = x0 + frac * (x1 - x0)
-                return 0.5 * (z0 + 0.0) * (x_cross - x0)
-            elif z0 <= 0 and z1 > 0:
-                frac = -z0 / (z1 - z0)
-                x_cross = x0 + frac * (x1 - x0)
-                return 0.5 * (0.0 + z1) * (x1 - x_cross)
-            else:
-                return 0.0
-
-        def area_below(z0, z1, x0, x1):
-            if z0 < 0 and z1 < 0:
-                return 0.5 * (z0 + z1) * (x1 - x0)
-            elif z0 < 0 and z1 >= 0:
-                frac = -z0 / (z1 - z0)
-                x_cross = x0 + frac * (x1 - x0)
-                return 0.5 * (z0 + 0.0) * (x_cross - x0)
-            elif z0 >= 0 and z1 < 0:
-                frac = z0 / (z0 - z1)
-                x_cross = x0 + frac * (x1 - x0)
-                return 0.5 * (0.0 + z1) * (x1 - x_cross)
-            else:
-                return 0.0
-
-        above_sum = 0.0
-        below_sum = 0.0
-        for i in range(len(cell_boundaries) - 1):
-            x0, x1 = cell_boundaries[i], cell_boundaries[i + 1]
-            # Template (profile 1)
-            zt0, zt1 = z1_cb[i], z1_cb[i + 1]
-            # BD (profile 2)
-            zb0, zb1 = z2_cb[i], z2_cb[i + 1]
-            # Above datum: (Template above datum) - (BD above datum)
-            above_sum += area_above(zt0, zt1, x0, x1) - area_above(
-                zb0, zb1, x0, x1
-            )
-            # Below datum: (BD below datum) - (Template below datum)
-            below_sum += area_below(zb0, zb1, x0, x1) - area_below(
-                zt0, zt1, x0, x1
-            )
-        above_cuyd_per_ft = above_sum / 27.0
-        below_cuyd_per_ft = below_sum / 27.0
-
-        total_cuyd_per_ft = float(np.sum(cell_vol_cuyd_per_ft))
-
-        # Shoreline intersection (seaward-most crossing)
-        xs1_sh: Optional[float] = _shoreline_x(xs1, ys1)
-        xs2_sh: Optional[float] = _shoreline_x(xs2, ys2)
-        if xs1_sh is not None and xs2_sh is not None:
-            sh_change = float(xs2_sh - xs1_sh)
-            xs1_out, xs2_out = float(xs1_sh), float(xs2_sh)
-        else:
-            sh_change = float("nan")
-            xs1_out, xs2_out = float("nan"), float("nan")
-
-        # Build cell table with above/below datum split for each sub-cell
-
-        cells = []
-        for i in range(nseg):
-            x0, x1_ = cell_boundaries[i], cell_boundaries[i + 1]
-            dz0, dz1_ = dz_cb[i], dz_cb[i + 1]
-            z1a, z1b = z1_cb[i], z1_cb[i + 1]
-            z2a, z2b = z2_cb[i], z2_cb[i + 1]
-            width = x1_ - x0
-            vol_cuyd = cell_vol_cuyd_per_ft[i]
-            # For each profile
-            abv1, blw1 = split_trap_area(x0, x1_, z1a, z1b)
-            abv2, blw2 = split_trap_area(x0, x1_, z2a, z2b)
-            # For difference (z2-z1), net area, above datum, below datum
-            dz_a, dz_b = dz0, dz1_
-            abv_d, blw_d = split_trap_area(x0, x1_, dz_a, dz_b)
-            net_d = abv_d + blw_d
-            cells.append(
-                {
-                    "end_x": float(x1_),
-                    "end_z2": float(z2b),
-                    "cell_vol_cuyd_per_ft": float(vol_cuyd),
-                    "cell_thickness_ft": float(0.5 * (dz_a + dz_b)),
-                    "cum_vol_cuyd_per_ft": float(cum_vol[i]),
-                    "gross_vol_cuyd_per_ft": float(gross_vol[i]),
-                    "z1_above": float(abv1),
-                    "z1_below": float(blw1),
-                    "z2_above": float(abv2),
-                    "z2_below": float(blw2),
-                    "dz_above": float(abv_d),
-                    "dz_below": float(blw_d),
-                    "dz_net": float(net_d),
-                }
-            )
-
-        # Write report
-        write_cutfill_detailed_report(
-            output_path,
-            title=title,
-            profile1_label=_header_string(p1),
-            profile2_label=_header_string(p2),
-            x_on=float(x_on),
-            x_off=float(x_off),
-            above_datum_cuyd_per_ft=above_cuyd_per_ft,
-            below_datum_cuyd_per_ft=below_cuyd_per_ft,
-            total_volume_cuyd_per_ft=total_cuyd_per_ft,
-            shoreline_from_x=xs1_out,
-            shoreline_to_x=xs2_out,
-            shoreline_change=sh_change,
-            cells=cells,
-        )
-        return
-
     # --- Hybrid logic: BMAP-style cell boundaries, original above/below datum logic ---
-    if getattr(sys.modules[__name__], "use_hybrid_logic", False):
+    if not use_ported_logic and getattr(
+        sys.modules[__name__], "use_hybrid_logic", False
+    ):
         use_intersections_only = getattr(
             sys.modules[__name__], "hybrid_intersections_only", False
         )
@@ -490,7 +636,7 @@ def compute_cut_fill_detailed(
         gross_volume = 0.0
         cells = []
         for i in range(nseg):
-            x0, x1_ = cell_boundaries[i], cell_boundaries[i + 1]
+            x1_ = cell_boundaries[i + 1]
             bd_start = z1_cb[i]
             bd_end = z1_cb[i + 1]
             tmpl_start = z2_cb[i]
@@ -546,95 +692,28 @@ def compute_cut_fill_detailed(
         )
         return
 
-    # --- Original logic: uniform grid (dx) with datum splitting ---
-    # All variables scoped inside this block to avoid redefinition errors
-    x_grid = np.arange(x_on, x_off + dx, dx)
-    if x_grid[-1] > x_off:
-        x_grid[-1] = x_off
-    # Add datum crossings to x_grid
-    datum_xs = []
-    for x_arr, z_arr in [(x1, z1_smoothed), (x2, z2_smoothed)]:
-        for i in range(1, len(z_arr)):
-            if z_arr[i - 1] * z_arr[i] < 0:
-                frac = -z_arr[i - 1] / (z_arr[i] - z_arr[i - 1])
-                x_cross = x_arr[i - 1] + frac * (x_arr[i] - x_arr[i - 1])
-                if x_on < x_cross < x_off:
-                    datum_xs.append(x_cross)
-    x_grid = np.sort(np.concatenate([x_grid, datum_xs]))
-    x_grid = np.unique(x_grid)
-    nseg = len(x_grid) - 1
-    z1_grid = np.array([interp_or_flat(x1, z1_smoothed, x) for x in x_grid])
-    z2_grid = np.array([interp_or_flat(x2, z2_smoothed, x) for x in x_grid])
-    dz_grid = z2_grid - z1_grid
-    cell_vol_ft3_per_ft = np.empty(nseg, dtype=float)
-    cell_vol_cuyd_per_ft = np.empty(nseg, dtype=float)
-    cell_thickness = np.empty(nseg, dtype=float)
-    for i in range(nseg):
-        width = x_grid[i + 1] - x_grid[i]
-        dz_a = dz_grid[i]
-        dz_b = dz_grid[i + 1]
-        vol_ft3 = 0.5 * (dz_a + dz_b) * width
-        cell_vol_ft3_per_ft[i] = vol_ft3
-        cell_vol_cuyd_per_ft[i] = vol_ft3 / 27.0
-        cell_thickness[i] = 0.5 * (dz_a + dz_b)
-    cum_vol = np.cumsum(cell_vol_cuyd_per_ft)
-    gross_vol = np.cumsum(np.abs(cell_vol_cuyd_per_ft))
-    above_datum = 0.0
-    below_datum = 0.0
-    total_volume = 0.0
-    cumulative_volume = 0.0
-    gross_volume = 0.0
-    cells = []
-
-    # Use module-level split_trap_area directly
-
-    for i in range(nseg):
-        x0, x1_ = x_grid[i], x_grid[i + 1]
-        bd_start = z1_grid[i]
-        bd_end = z1_grid[i + 1]
-        tmpl_start = z2_grid[i]
-        tmpl_end = z2_grid[i + 1]
-        cell_volume_cy = cell_vol_cuyd_per_ft[i]
-        # Split each profile at datum and compute net above/below areas
-        abv1, blw1 = split_trap_area(x0, x1_, bd_start, bd_end)
-        abv2, blw2 = split_trap_area(x0, x1_, tmpl_start, tmpl_end)
-        above_datum += (abv2 - abv1) / 27.0
-        below_datum += (blw2 - blw1) / 27.0
-        total_volume += cell_volume_cy
-        cumulative_volume += cell_volume_cy
-        gross_volume += abs(cell_volume_cy)
-        cells.append(
-            {
-                "end_x": float(x1_),
-                "end_z2": float(tmpl_end),
-                "cell_vol_cuyd_per_ft": float(cell_volume_cy),
-                "cell_thickness_ft": float(cell_thickness[i]),
-                "cum_vol_cuyd_per_ft": float(cum_vol[i]),
-                "gross_vol_cuyd_per_ft": float(gross_vol[i]),
-            }
-        )
-    # Shoreline intersection (seaward-most crossing)
-    xs1_sh = _shoreline_x(x1, z1)
-    xs2_sh = _shoreline_x(x2, z2)
-    if xs1_sh is not None and xs2_sh is not None:
-        sh_change = float(xs2_sh - xs1_sh)
-        xs1_out, xs2_out = float(xs1_sh), float(xs2_sh)
-    else:
-        sh_change = float("nan")
-        xs1_out, xs2_out = float("nan"), float("nan")
+    # Ported logic or the original uniform grid (dx) with datum splitting
+    result = _cut_fill_arrays(
+        x1, z1, x2, z2, x_on, x_off, dx, use_ported_logic
+    )
+    cell_columns = result["cells"]
+    cells = [
+        dict(zip(cell_columns, row))
+        for row in zip(*(v.tolist() for v in cell_columns.values()))
+    ]
     write_cutfill_detailed_report(
         output_path,
         title=title,
         profile1_label=_header_string(p1),
         profile2_label=_header_string(p2),
-        x_on=float(x_on),
-        x_off=float(x_off),
-        above_datum_cuyd_per_ft=above_datum,
-        below_datum_cuyd_per_ft=below_datum,
-        total_volume_cuyd_per_ft=total_volume,
-        shoreline_from_x=xs1_out,
-        shoreline_to_x=xs2_out,
-        shoreline_change=sh_change,
+        x_on=result["x_on"],
+        x_off=result["x_off"],
+        above_datum_cuyd_per_ft=result["above_datum_cuyd_per_ft"],
+        below_datum_cuyd_per_ft=result["below_datum_cuyd_per_ft"],
+        total_volume_cuyd_per_ft=result["total_volume_cuyd_per_ft"],
+        shoreline_from_x=result["shoreline_from_x"],
+        shoreline_to_x=result["shoreline_to_x"],
+        shoreline_change=result["shoreline_change"],
         cells=cells,
     )
 
@@ -711,11 +790,12 @@ def main():
 
     dx = args.dx if args.dx is not None else get_dx()
 
-    profs1 = read_bmap_freeformat(args.input1)
-    p1 = _select_profile(profs1, args.sel1)
+    # Index lookups load only the two selected profiles from disk
+    index1 = load_bmap_index(args.input1)
+    p1 = index1.read_profile(_select_profile(index1, args.sel1))
 
-    profs2 = read_bmap_freeformat(args.input2) if args.input2 else profs1
-    p2 = _select_profile(profs2, args.sel2)
+    index2 = load_bmap_index(args.input2) if args.input2 else index1
+    p2 = index2.read_profile(_select_profile(index2, args.sel2))
 
     # Patch: set a module-level flag for hybrid logic
     setattr(sys.modules[__name__], "use_hybrid_logic", args.hybrid_logic)
@@ -15,14 +15,35 @@ Equation reference:
     and Gulf Coasts." Department of Civil Engineering, Ocean
     Engineering Report No. 12, University of Delaware.
 
+``compute_least_squares_batch`` fits every profile of a columnar profile
+set (e.g. every line of every survey) in a few vectorized passes, and can
+optionally fit a shoreline offset as well:
+
+    h(x) = A * (x - x0)^(2/3)
+
 Example:
     fitted_df, report = compute_least_squares(
         profile_df, xon=0.0, xoff=600.0
     )
+
+    collection = ProfileCollection.from_bmap(path)
+    table = compute_least_squares_batch(
+        collection.x, collection.z, collection.offsets, xon=0.0, xoff=600.0
+    )
+    table.insert(1, "name", collection.names)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
 import numpy as np
 import pandas as pd
+from scipy.optimize import curve_fit  # type: ignore
+
+from profcalc.common.error_handler import LogComponent, get_logger
+from profcalc.common.profile_batch import per_profile_values, segment_index
+
+FIT_MODES = ("linear", "shoreline_offset")
 
 
 def compute_least_squares(
@@ -131,3 +152,166 @@ def compute_least_squares(
     )
 
     return fitted_df, report
+
+
+def _grain_size(A: np.ndarray) -> np.ndarray:
+    """Median grain size (mm) from the Dean A-parameter."""
+    return (A / 0.21) ** (1 / 0.48)
+
+
+def _fit_shoreline_offset(
+    x: np.ndarray, h: np.ndarray, A0: float, x00: float
+) -> Tuple[float, float, float]:
+    """Nonlinear fit of h = A * (x - x0)^(2/3); returns (A, x0, R²)."""
+
+    def dean(xv, A, x0):
+        return A * np.maximum(xv - x0, 0.0) ** (2.0 / 3.0)
+
+    x_limit = float(x.min())
+    if not (np.isfinite(A0) and A0 > 0):
+        A0 = 0.1
+    if not (np.isfinite(x00) and x00 < x_limit):
+        x00 = x_limit - max(1.0, 0.01 * (x.max() - x_limit))
+    (A, x0), _ = curve_fit(
+        dean,
+        x,
+        h,
+        p0=(A0, x00),
+        bounds=([0.0, -np.inf], [np.inf, x_limit]),
+    )
+    ss_res = np.sum((h - dean(x, A, x0)) ** 2)
+    ss_tot = np.sum((h - np.mean(h)) ** 2)
+    R2 = 1 - ss_res / ss_tot if ss_tot > 0 else 0.0
+    return float(A), float(x0), float(R2)
+
+
+def compute_least_squares_batch(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    xon,
+    xoff,
+    mode: str = "linear",
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Fit the Dean equilibrium equation to many profiles at once.
+
+    Works on a columnar profile set (e.g. ``ProfileCollection.x``, ``.z``
+    and ``.offsets``). Points between each profile's Xon and Xoff are
+    selected with one mask and the regression sums of all profiles are
+    segmented reductions over the selected points.
+
+    Parameters
+    ----------
+    x, z : np.ndarray
+        Concatenated cross-shore distances and elevations (ft NAVD,
+        positive upward) of all profiles.
+    offsets : np.ndarray
+        Profile start offsets plus the total point count.
+    xon, xoff : float or np.ndarray
+        Fitting range (ft); a scalar or one value per profile.
+    mode : str, optional
+        "linear" (default) fits h = A * x^(2/3) as
+        ``compute_least_squares`` does. "shoreline_offset" also fits a
+        shoreline offset, h = A * (x - x0)^(2/3), by nonlinear least
+        squares started from the linear fit; profiles are fitted in a
+        thread pool.
+    max_workers : int, optional
+        Thread pool size for "shoreline_offset" (default: the
+        ``ThreadPoolExecutor`` default).
+
+    Returns
+    -------
+    table : pd.DataFrame
+        One row per profile with columns 'profile' (position in the set),
+        'xon', 'xoff', 'n_points' (submerged points used), 'A_ft13',
+        'R2', 'd50_mm' and 'x0_ft' (the shoreline offset; NaN in linear
+        mode). Profiles with fewer than three submerged points in range,
+        or whose fit fails, have NaN results and are logged as warnings.
+        In linear mode R² is that of the linearized fit, as in
+        ``compute_least_squares``; in shoreline_offset mode it is
+        computed on depths.
+    """
+    if mode not in FIT_MODES:
+        raise ValueError(
+            f"Unknown fit mode {mode!r}; expected one of "
+            f"{', '.join(FIT_MODES)}"
+        )
+    x = np.asarray(x, dtype=float)
+    z = np.asarray(z, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    n_profiles = len(offsets) - 1
+    xon = per_profile_values(xon, n_profiles, "xon")
+    xoff = per_profile_values(xoff, n_profiles, "xoff")
+    if np.any(xoff <= xon):
+        raise ValueError("xoff must be greater than xon.")
+
+    # --- Submerged points within each profile's range ---
+    owner = segment_index(offsets)
+    h = np.maximum(0.0, -z)
+    use = (x >= xon[owner]) & (x <= xoff[owner]) & (h > 0)
+    owner, X, h_fit = owner[use], x[use], h[use]
+    Y = h_fit**1.5
+
+    # --- Segmented regression sums of h^(3/2) = (A^(3/2)) * x ---
+    def total(values: np.ndarray) -> np.ndarray:
+        return np.bincount(owner, weights=values, minlength=n_profiles)
+
+    n = np.bincount(owner, minlength=n_profiles)
+    fit = n >= 3
+    sum_x = total(X)
+    sum_y = total(Y)
+    sum_xx = total(X * X)
+    sum_xy = total(X * Y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x**2)
+        intercept = (sum_y - slope * sum_x) / n
+        A = slope ** (2.0 / 3.0)
+        ss_res = total((Y - (slope[owner] * X + intercept[owner])) ** 2)
+        ss_tot = total((Y - (sum_y / n)[owner]) ** 2)
+        R2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, 0.0)
+    A = np.where(fit, A, np.nan)
+    R2 = np.where(fit, R2, np.nan)
+    x0 = np.full(n_profiles, np.nan)
+
+    logger = get_logger(LogComponent.DATA_PROCESSING)
+    if mode == "shoreline_offset":
+        # Linear fit gives Y = A^(3/2) * (x - x0), so x0 = -intercept / slope
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x0_start = -intercept / slope
+        bounds = np.r_[0, np.cumsum(n)]
+        fitted = np.flatnonzero(fit)
+
+        def fit_one(i: int) -> Tuple[float, float, float]:
+            part = slice(bounds[i], bounds[i + 1])
+            return _fit_shoreline_offset(
+                X[part], h_fit[part], A[i], x0_start[i]
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(fit_one, i) for i in fitted]
+        for i, future in zip(fitted, futures):
+            try:
+                A[i], x0[i], R2[i] = future.result()
+            except (RuntimeError, ValueError) as e:
+                logger.warning(f"Shoreline offset fit failed for {i}: {e}")
+                A[i] = R2[i] = np.nan
+
+    if not fit.all():
+        logger.warning(
+            f"{int((~fit).sum())} profile(s) have fewer than 3 submerged "
+            "points within Xon/Xoff; left unfitted"
+        )
+    return pd.DataFrame(
+        {
+            "profile": np.arange(n_profiles),
+            "xon": xon,
+            "xoff": xoff,
+            "n_points": n,
+            "A_ft13": A,
+            "R2": R2,
+            "d50_mm": _grain_size(A),
+            "x0_ft": x0,
+        }
+    )
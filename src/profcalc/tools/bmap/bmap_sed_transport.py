@@ -8,10 +8,20 @@ following Larson and Kraus (1989) as implemented in BMAP.
 Equation:
     q(x) = -(1/Δt) * ∫_{xon}^{x} [η₂(ξ) - η₁(ξ)] dξ
 
+The integral is evaluated on a uniform dX grid (BMAP behavior), or with
+``method="exact"`` analytically from the profile points at the same grid
+positions.
+
 Units:
     Input  X, Z in feet; Δt in hours
     Output q(x) in cubic yards per foot per hour (cu yd/ft/hr)
 
+``compute_transport_rate_series`` runs every consecutive survey pair of
+every line (e.g. a storm sequence) in one call. Survey dates come from
+the profile headers, so Δt is not entered by hand. All lines share one
+grid, and each survey's running integral is built once, so each pair's
+rate is a difference of two running integrals.
+
 Example:
     profile_rate_df, report = compute_transport_rate(
         profile1=baseline_df,
@@ -19,14 +29,53 @@ Example:
         dx=10.0,
         dtime_hr=48786.8
     )
+
+    series = compute_transport_rate_series(
+        read_bmap_freeformat(path), dx=10.0
+    )
+    series["rate"]  # lines x pairs x X cube (cu yd/ft/hr)
 """
 
+from typing import Dict, List, Sequence, Tuple
+
 import numpy as np
 import pandas as pd
 
+from profcalc.common.bmap_io import Profile
+from profcalc.common.date_math import hours_between
+from profcalc.common.profile_integration import (
+    check_integration_method,
+    common_breakpoints,
+    cumulative_integral,
+)
+from profcalc.tools.monitoring.survey_change import (
+    group_surveys_by_line,
+    survey_date,
+)
+
+_SUMMARY_COLUMNS = [
+    "line",
+    "pair",
+    "from_date",
+    "to_date",
+    "dtime_hr",
+    "x_on",
+    "x_off",
+    "max_rate",
+    "x_max",
+    "min_rate",
+    "x_min",
+    "seaward_rate",
+    "x_seaward",
+]
+
 
 def compute_transport_rate(
-    profile1: pd.DataFrame, profile2: pd.DataFrame, dx: float, dtime_hr: float
+    profile1: pd.DataFrame,
+    profile2: pd.DataFrame,
+    dx: float,
+    dtime_hr: float,
+    method: str = "grid",
 ) -> tuple[pd.DataFrame, str]:
     """
     Compute the cross-shore transport rate profile.
@@ -41,6 +90,9 @@ def compute_transport_rate(
         Horizontal increment (ft) for integration.
     dtime_hr : float
         Time difference between surveys (hours).
+    method : str
+        Integration: "grid" (trapezoid rule on the dX grid) or "exact"
+        (piecewise-linear profiles, reported at the grid positions).
 
     Returns
     -------
@@ -57,6 +109,7 @@ def compute_transport_rate(
 
     if dtime_hr <= 0:
         raise ValueError("Time difference (dtime_hr) must be positive.")
+    check_integration_method(method)
 
     # --- Common grid (uniform) ---
     x_min = max(profile1["X"].min(), profile2["X"].min())
@@ -70,14 +123,25 @@ def compute_transport_rate(
     # --- Compute elevation change ---
     dz = z2 - z1  # positive = accretion (upward)
 
-    # --- Cumulative integral (trapezoidal rule) ---
-    # Integral of elevation change from landward boundary to each x
-    cumulative_integral = np.cumsum(
-        np.concatenate(([0], (dz[1:] + dz[:-1]) / 2 * dx))
-    )
+    # --- Cumulative integral of elevation change from landward boundary ---
+    if method == "exact":
+        x_nodes, z1_nodes, z2_nodes = common_breakpoints(
+            profile1["X"],
+            profile1["Z"],
+            profile2["X"],
+            profile2["Z"],
+            x_grid[0],
+            x_grid[-1],
+        )
+        cumulative = cumulative_integral(x_nodes, z2_nodes - z1_nodes, x_grid)
+    else:
+        # Trapezoidal rule on the uniform grid
+        cumulative = np.cumsum(
+            np.concatenate(([0], (dz[1:] + dz[:-1]) / 2 * dx))
+        )
 
     # --- Transport rate per unit width (ft²/hr) ---
-    q_ft2_hr = -cumulative_integral / dtime_hr  # minus sign from continuity
+    q_ft2_hr = -cumulative / dtime_hr  # minus sign from continuity
 
     # Convert to cubic yards per foot per hour
     q_cuyd_ft_hr = q_ft2_hr / 27.0
@@ -112,7 +176,177 @@ def compute_transport_rate(
     profile_rate_df.attrs["parameters"] = {
         "dx_ft": dx,
         "dtime_hr": dtime_hr,
+        "method": method,
         "integration_range_ft": [float(x_min), float(x_max)],
     }
 
     return profile_rate_df, report
+
+
+def _running_integrals(
+    surveys: Sequence[Tuple[np.ndarray, np.ndarray]],
+    grid: np.ndarray,
+    method: str,
+) -> np.ndarray:
+    """Integral of each survey from ``grid[0]`` to every grid node."""
+    rows = []
+    for x, z in surveys:
+        if method == "exact":
+            rows.append(cumulative_integral(x, z, grid))
+        else:
+            zg = np.interp(grid, x, z)
+            rows.append(
+                np.concatenate(
+                    ([0.0], np.cumsum((zg[1:] + zg[:-1]) / 2 * np.diff(grid)))
+                )
+            )
+    return np.array(rows)
+
+
+def compute_transport_rate_series(
+    profiles: Sequence[Profile],
+    dx: float,
+    method: str = "grid",
+) -> Dict[str, object]:
+    """
+    Compute transport-rate profiles for consecutive surveys of every line.
+
+    Surveys are grouped by line and ordered by the dates in their headers;
+    Δt of each pair is the time between those dates. The project shares
+    one dX grid; each line's grid adds its surveys' end points as nodes so
+    that every pair integrates from its own Xon.
+
+    Parameters
+    ----------
+    profiles : sequence of Profile
+        Dated surveys of any number of lines.
+    dx : float
+        Horizontal increment (ft) of the shared grid.
+    method : str
+        Integration: "grid" (trapezoid rule on the resampled surveys) or
+        "exact" (piecewise-linear profiles), as in
+        ``compute_transport_rate``.
+
+    Returns
+    -------
+    series : dict
+        {
+            "x": shared grid (ft),
+            "lines": line names,
+            "rate": array of shape (lines, pairs, x) with the transport
+                rate in cu yd/ft/hr (NaN outside each pair's Xon/Xoff and
+                for lines with fewer pairs),
+            "summary": DataFrame with one row per line and pair: line,
+                pair, from_date, to_date, dtime_hr, x_on, x_off, max_rate,
+                x_max, min_rate, x_min, seaward_rate and x_seaward (as in
+                the Transport Rate Report; NaN for non-overlapping
+                surveys)
+        }
+    """
+    if not dx > 0:
+        raise ValueError("dx must be positive")
+    check_integration_method(method)
+
+    lines = {
+        name: surveys
+        for name, surveys in group_surveys_by_line(
+            [p for p in profiles if len(p.x) > 0]
+        ).items()
+        if len(surveys) > 1
+    }
+    if not lines:
+        return {
+            "x": np.empty(0),
+            "lines": [],
+            "rate": np.empty((0, 0, 0)),
+            "summary": pd.DataFrame(columns=_SUMMARY_COLUMNS),
+        }
+
+    sorted_lines: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
+    for name, surveys in lines.items():
+        sorted_lines[name] = []
+        for p in surveys:
+            x = np.asarray(p.x, dtype=float)
+            order = np.argsort(x, kind="stable")
+            z = np.asarray(p.z, dtype=float)[order]
+            sorted_lines[name].append((x[order], z))
+    x_lo = min(x[0] for s in sorted_lines.values() for x, _ in s)
+    x_hi = max(x[-1] for s in sorted_lines.values() for x, _ in s)
+    x_grid = np.arange(x_lo, x_hi + dx, dx)
+    x_grid = x_grid[x_grid <= x_hi]
+
+    n_pairs = max(len(s) for s in lines.values()) - 1
+    rate = np.full((len(lines), n_pairs, len(x_grid)), np.nan)
+    rows = []
+    for k, (name, line_xz) in enumerate(sorted_lines.items()):
+        x_start = np.array([x[0] for x, _ in line_xz])
+        x_end = np.array([x[-1] for x, _ in line_xz])
+        grid = np.unique(np.concatenate([x_grid, x_start, x_end]))
+        grid = grid[(grid >= x_start.min()) & (grid <= x_end.max())]
+        running = _running_integrals(line_xz, grid, method)
+        on_shared = np.isin(grid, x_grid)
+        shared_index = np.searchsorted(x_grid, grid[on_shared])
+
+        # Grouped surveys all have a date; the filter only narrows the type
+        dates = [d for p in lines[name] if (d := survey_date(p)) is not None]
+        dtime = np.array(
+            [
+                hours_between(a, b, abs_value=False)
+                for a, b in zip(dates[:-1], dates[1:])
+            ]
+        )
+        x_on = np.maximum(x_start[:-1], x_start[1:])
+        x_off = np.minimum(x_end[:-1], x_end[1:])
+        i_on = np.searchsorted(grid, x_on)
+        i_off = np.searchsorted(grid, x_off)
+
+        # Integral of the elevation change from each pair's Xon
+        earlier, later = running[:-1], running[1:]
+        pair = np.arange(len(i_on))
+        change = (later - later[pair, i_on, None]) - (
+            earlier - earlier[pair, i_on, None]
+        )
+        nodes = np.arange(len(grid))
+        inside = (nodes >= i_on[:, None]) & (nodes <= i_off[:, None])
+        inside &= (x_on < x_off)[:, None]
+        q = np.where(inside, -change / dtime[:, None] / 27.0, np.nan)
+        rate[k, : len(q)][:, shared_index] = q[:, on_shared]
+
+        overlap = x_on < x_off
+        i_max = np.argmax(np.where(inside, q, -np.inf), axis=1)
+        i_min = np.argmin(np.where(inside, q, np.inf), axis=1)
+        extremes = {
+            "max_rate": q[pair, i_max],
+            "x_max": grid[i_max],
+            "min_rate": q[pair, i_min],
+            "x_min": grid[i_min],
+            "seaward_rate": q[pair, np.minimum(i_off, len(grid) - 1)],
+            "x_seaward": x_off,
+        }
+
+        iso = [d.strftime("%Y-%m-%d") for d in dates]
+        rows.append(
+            pd.DataFrame(
+                {
+                    "line": name,
+                    "pair": pair,
+                    "from_date": iso[:-1],
+                    "to_date": iso[1:],
+                    "dtime_hr": dtime,
+                    "x_on": x_on,
+                    "x_off": x_off,
+                    **{
+                        column: np.where(overlap, values, np.nan)
+                        for column, values in extremes.items()
+                    },
+                },
+                columns=_SUMMARY_COLUMNS,
+            )
+        )
+
+    return {
+        "x": x_grid,
+        "lines": list(lines),
+        "rate": rate,
+        "summary": pd.concat(rows, ignore_index=True),
+    }
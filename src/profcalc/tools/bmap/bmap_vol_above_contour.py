@@ -14,6 +14,8 @@ Inputs:
 Behavior:
 - Uses global dX (from config.json) for uniform spacing.
 - Integrates elevation above contour only (z > contour).
+- ``--method exact`` integrates the piecewise-linear profile exactly
+  instead of resampling at dX.
 - Outputs cu. yd/ft.
 
 Example:
@@ -27,49 +29,212 @@ Example:
 from __future__ import annotations
 
 import argparse
+import itertools
 from pathlib import Path
+from typing import Sequence
 
 import numpy as np
 
-from profcalc.common.bmap_io import read_bmap_freeformat
+from profcalc.common.bmap_io import iter_bmap_profiles
 from profcalc.common.config_utils import get_dx
+from profcalc.common.contour_crossings import (
+    crossing_x,
+    find_contour_crossings,
+)
 from profcalc.common.error_handler import LogComponent, get_logger
 from profcalc.common.io_reports import write_volume_report
+from profcalc.common.profile_batch import (
+    segment_arange,
+    segment_argsort,
+    segment_index,
+    segment_interp,
+    segment_reduce,
+    segment_trapz,
+)
+from profcalc.common.profile_collection import ProfileCollection
+from profcalc.common.profile_integration import (
+    INTEGRATION_METHODS,
+    area_above,
+    check_integration_method,
+    positive_part_areas,
+)
 
+# Profiles read from the input file per batch computation in main()
+STREAM_CHUNK_PROFILES = 1000
 
-def compute_volume_above_contour(profile, contour: float, dx: float = 10.0):
-    """Compute volume above a contour elevation for one profile."""
+# Grid values evaluated per block of contours in multi-contour sweeps
+_SWEEP_BLOCK_VALUES = 4_000_000
+
+
+def compute_volume_above_contour(
+    profile, contour: float, dx: float = 10.0, method: str = "grid"
+):
+    """Compute volume above a contour elevation for one profile.
+
+    ``method="exact"`` integrates the profile segments analytically over
+    its own extent instead of resampling at ``dx``.
+    """
+    check_integration_method(method)
     x, z = np.array(profile.x), np.array(profile.z)
     idx = np.argsort(x)
     x, z = x[idx], z[idx]
 
     x_min, x_max = float(np.min(x)), float(np.max(x))
-    xg = np.arange(x_min, x_max + dx, dx)
-    zg = np.interp(xg, x, z)
+    if method == "exact":
+        area_ft3_per_ft = area_above(x, z, contour)
+    else:
+        xg = np.arange(x_min, x_max + dx, dx)
+        zg = np.interp(xg, x, z)
 
-    # Elevations above contour only
-    h = np.maximum(0.0, zg - contour)
-    area_ft3_per_ft = np.trapz(h, xg)
+        # Elevations above contour only
+        h = np.maximum(0.0, zg - contour)
+        area_ft3_per_ft = float(np.trapz(h, xg))
     area_cuyd_per_ft = float(area_ft3_per_ft) / 27.0
 
-    # Find contour crossing (seaward-most) using original (x, z) data
-    crossings = []
-    for i in range(1, len(x)):
-        if (z[i - 1] - contour) * (z[i] - contour) < 0:
-            # Linear interpolation for crossing
-            frac = (contour - z[i - 1]) / (z[i] - z[i - 1])
-            x_cross = x[i - 1] + frac * (x[i] - x[i - 1])
-            crossings.append(x_cross)
-        elif (z[i - 1] - contour) == 0:
-            crossings.append(x[i - 1])
-        elif (z[i] - contour) == 0:
-            crossings.append(x[i])
-    x_cross = max(crossings) if crossings else np.nan
+    # Seaward-most contour crossing of the sorted (x, z) data
+    x_cross = crossing_x(x, z, contour)
     return {
-        "x_on": float(xg[0]),
+        "x_on": x_min,
         "x_off": float(profile.x[-1]),
         "volume_cuyd_per_ft": float(area_cuyd_per_ft),
-        "contour_x": float(x_cross) if x_cross == x_cross else None,
+        "contour_x": x_cross,
+    }
+
+
+def compute_volumes_above_contours(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    contours: Sequence[float] | np.ndarray,
+    dx: float = 10.0,
+    method: str = "grid",
+) -> dict[str, np.ndarray]:
+    """
+    Compute volumes above several contour elevations for many profiles.
+
+    Each profile is sorted, gridded and interpolated once; every contour
+    is then clipped against the shared grid and point pairs in a single
+    broadcast step, and its crossings come from
+    ``contour_crossings.find_contour_crossings``. Column ``j`` of the results equals what
+    ``compute_volume_above_contour`` returns for ``contours[j]``. With
+    ``method="exact"`` no grid is built and the point segments are
+    integrated analytically.
+
+    Args:
+        x: Concatenated cross-shore distances of all profiles
+        z: Concatenated elevations of all profiles
+        offsets: Profile start offsets plus the total point count
+        contours: Contour elevations
+        dx: Integration grid spacing
+        method: "grid" (resample at ``dx``) or "exact"
+
+    Returns:
+        Dict with ``contours`` (as given), per-profile ``x_on`` and
+        ``x_off`` arrays, and profiles x contours ``volume_cuyd_per_ft``
+        and ``contour_x`` matrices (seaward-most contour crossing, NaN
+        where the profile never reaches the contour)
+    """
+    check_integration_method(method)
+    x = np.asarray(x, dtype=float)
+    z = np.asarray(z, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    levels = np.atleast_1d(np.asarray(contours, dtype=float))
+    if levels.ndim != 1:
+        raise ValueError("contours must be a 1-D sequence of elevations")
+    if np.any(np.diff(offsets) < 1):
+        raise ValueError("Every profile needs at least one point")
+
+    order = segment_argsort(x, offsets)
+    xs, zs = x[order], z[order]
+
+    # Uniform grid over each profile's extent, interpolated once
+    x_min = segment_reduce(np.minimum, xs, offsets)
+    grid_size = 0
+    if method == "grid":
+        x_max = segment_reduce(np.maximum, xs, offsets)
+        xg, grid_offsets = segment_arange(x_min, x_max + dx, dx)
+        zg = segment_interp(xg, grid_offsets, xs, zs, offsets)
+        grid_size = len(xg)
+
+    # Consecutive sorted point pairs of every profile (exact integration)
+    left = np.flatnonzero(np.diff(segment_index(offsets)) == 0)
+    right = left + 1
+    pair_offsets = offsets - np.arange(len(offsets))
+    x0, x1 = xs[left], xs[right]
+    z0, z1 = zs[left], zs[right]
+
+    n_profiles = len(offsets) - 1
+    volume = np.empty((n_profiles, len(levels)))
+    contour_x = np.empty((n_profiles, len(levels)))
+
+    # Evaluate contours in blocks to bound the (contours x grid) arrays
+    block = max(1, _SWEEP_BLOCK_VALUES // max(grid_size, len(left), 1))
+    for first in range(0, len(levels), block):
+        c = levels[first : first + block, None]
+        cols = slice(first, first + len(c))
+
+        if method == "exact":
+            areas = segment_reduce(
+                np.add,
+                positive_part_areas(x0, x1, z0 - c, z1 - c),
+                pair_offsets,
+            )
+            # Single-point profiles have no segments and no area
+            areas[np.isnan(areas) & (np.diff(pair_offsets) == 0)] = 0.0
+        else:
+            h = np.maximum(0.0, zg - c)
+            areas = segment_trapz(h, xg, grid_offsets)
+        volume[:, cols] = (areas / 27.0).T
+
+        contour_x[:, cols] = find_contour_crossings(
+            xs, zs, offsets, c[:, 0]
+        )["seaward"]
+
+    return {
+        "contours": levels,
+        "x_on": x_min,
+        "x_off": x[offsets[1:] - 1],
+        "volume_cuyd_per_ft": volume,
+        "contour_x": contour_x,
+    }
+
+
+def compute_volume_above_contour_batch(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    contour: float,
+    dx: float = 10.0,
+    method: str = "grid",
+) -> dict[str, np.ndarray]:
+    """
+    Compute volume above a contour elevation for many profiles at once.
+
+    Works on a columnar profile set (e.g. ``ProfileCollection.x``, ``.z``
+    and ``.offsets``) and gives, per profile, exactly the numbers
+    ``compute_volume_above_contour`` returns.
+
+    Args:
+        x: Concatenated cross-shore distances of all profiles
+        z: Concatenated elevations of all profiles
+        offsets: Profile start offsets plus the total point count
+        contour: Contour elevation
+        dx: Integration grid spacing
+        method: "grid" (resample at ``dx``) or "exact"
+
+    Returns:
+        Dict of per-profile arrays: ``x_on``, ``x_off``,
+        ``volume_cuyd_per_ft`` and ``contour_x`` (seaward-most contour
+        crossing, NaN where the profile never reaches the contour)
+    """
+    sweep = compute_volumes_above_contours(
+        x, z, offsets, [contour], dx, method
+    )
+    return {
+        "x_on": sweep["x_on"],
+        "x_off": sweep["x_off"],
+        "volume_cuyd_per_ft": sweep["volume_cuyd_per_ft"][:, 0],
+        "contour_x": sweep["contour_x"][:, 0],
     }
 
 
@@ -87,24 +252,48 @@ def main():
         default=None,
         help="Analysis step size in feet (default from config.json)",
     )
+    ap.add_argument(
+        "--method",
+        choices=INTEGRATION_METHODS,
+        default="grid",
+        help="Integration method: 'grid' (resample at dX, BMAP behavior) "
+        "or 'exact' (integrate profile segments analytically)",
+    )
     args = ap.parse_args()
 
     dx = args.dx if args.dx is not None else get_dx()
 
-    profiles = read_bmap_freeformat(args.input)
+    # Stream profiles so large multi-survey archives are never held in
+    # memory at once; each chunk is computed by the batch engine
     results = []
-
-    for p in profiles:
-        res = compute_volume_above_contour(p, args.contour, dx)
-        results.append(
-            {
-                "label": f"{p.name} {p.date or ''} {p.description or ''}".strip(),
-                "x_on": res["x_on"],
-                "x_off": res["x_off"],
-                "volume_cuyd_per_ft": res["volume_cuyd_per_ft"],
-                "contour_location": res["contour_x"],
-            }
+    stream = iter_bmap_profiles(args.input)
+    for chunk in iter(
+        lambda: list(itertools.islice(stream, STREAM_CHUNK_PROFILES)), []
+    ):
+        profiles = ProfileCollection.from_profiles(chunk)
+        res = compute_volume_above_contour_batch(
+            profiles.x,
+            profiles.z,
+            profiles.offsets,
+            args.contour,
+            dx,
+            args.method,
         )
+        for i, (name, date, description) in enumerate(
+            zip(profiles.names, profiles.dates, profiles.descriptions)
+        ):
+            contour_x = float(res["contour_x"][i])
+            results.append(
+                {
+                    "label": f"{name} {date or ''} {description or ''}".strip(),
+                    "x_on": float(res["x_on"][i]),
+                    "x_off": float(res["x_off"][i]),
+                    "volume_cuyd_per_ft": float(res["volume_cuyd_per_ft"][i]),
+                    "contour_location": (
+                        contour_x if contour_x == contour_x else None
+                    ),
+                }
+            )
 
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
     write_volume_report(args.output, results, args.contour, args.title)
@@ -13,6 +13,8 @@ Behavior:
 - Flat extension at Xon/Xoff if outside the profile range
 - Volume integrated above Zref, clipped below
 - Outputs BMAP-style ASCII report
+- Optional per-line Xon/Xoff/Zref from a limits CSV such as
+  beach_profile_network.csv (``--limits`` with ``--*-column``)
 
 Example:
     python tool_volume_xon_xoff.py \
@@ -20,6 +22,13 @@ Example:
       --xon -25 --xoff 3000 --zref 0.0 \
       --output ../../data/output_examples/OCNJ_VolumeXonXoff.txt \
       --title "Untitled"
+
+    python tool_volume_xon_xoff.py \
+      --input ../../data/input_examples/OCNJ_FreeFormat_Test.txt \
+      --xon -25 --xoff 3000 \
+      --limits ../../data/required/beach_profile_network.csv \
+      --zref-column ClosureDep \
+      --output ../../data/output_examples/OCNJ_VolumeXonXoff.txt
 """
 
 from __future__ import annotations
@@ -29,22 +38,191 @@ from pathlib import Path
 
 import numpy as np
 
-from profcalc.common.bmap_io import read_bmap_freeformat
-from profcalc.common.config_utils import get_dx
+from profcalc.common.csv_io import load_network_columns
 from profcalc.common.error_handler import LogComponent, get_logger
 from profcalc.common.io_reports import write_volume_report
+from profcalc.common.profile_batch import (
+    per_profile_values,
+    segment_argsort,
+    segment_index,
+    segment_interp,
+    segment_reduce,
+    segment_sequential_sum,
+)
+from profcalc.common.profile_collection import ProfileCollection
+
+OUT_OF_BOUNDS_POLICIES = ("extend", "clip", "skip")
+
+
+def compute_volume_xon_xoff_batch(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    xon,
+    xoff,
+    zref,
+    outofbounds_policy: str = "extend",
+) -> dict[str, np.ndarray]:
+    """
+    Compute Xon/Xoff volumes above Zref for many profiles at once.
+
+    Works on a columnar profile set (e.g. ``ProfileCollection.x``, ``.z``
+    and ``.offsets``). Limits may be scalars or one value per profile, so
+    every line can use its own Xon, Xoff and Zref. Per profile the results
+    equal ``compute_volume_xon_xoff``.
+
+    Args:
+        x: Concatenated cross-shore distances of all profiles
+        z: Concatenated elevations of all profiles
+        offsets: Profile start offsets plus the total point count
+        xon: Landward limit(s)
+        xoff: Seaward limit(s)
+        zref: Reference contour elevation(s)
+        outofbounds_policy: 'extend' (flat), 'clip' (adjust) or 'skip'
+            (drop profiles whose limits fall outside their data)
+
+    Returns:
+        Dict of per-profile arrays: ``valid`` (False for skipped
+        profiles), ``x_on`` and ``x_off`` (after clipping),
+        ``volume_cuyd_per_ft`` and ``contour_x`` (first Zref crossing, NaN
+        where there is none or the profile was skipped)
+    """
+    if outofbounds_policy not in OUT_OF_BOUNDS_POLICIES:
+        raise ValueError(
+            f"Unknown out-of-bounds policy {outofbounds_policy!r}; expected "
+            f"one of {', '.join(OUT_OF_BOUNDS_POLICIES)}"
+        )
+    x = np.asarray(x, dtype=float)
+    z = np.asarray(z, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    counts = np.diff(offsets)
+    if np.any(counts < 1):
+        raise ValueError("Every profile needs at least one point")
+    n_profiles = len(counts)
+    xon = per_profile_values(xon, n_profiles, "xon")
+    xoff = per_profile_values(xoff, n_profiles, "xoff")
+    zref = per_profile_values(zref, n_profiles, "zref")
+
+    order = segment_argsort(x, offsets)
+    xs, zs = x[order], z[order]
+    owner = segment_index(offsets)
+    x_first, x_last = xs[offsets[:-1]], xs[offsets[1:] - 1]
+    z_first, z_last = zs[offsets[:-1]], zs[offsets[1:] - 1]
+    every_profile = np.arange(n_profiles + 1)
+
+    def interp_or_flat(xq: np.ndarray) -> np.ndarray:
+        inner = segment_interp(xq, every_profile, xs, zs, offsets)
+        return np.where(
+            xq <= x_first, z_first, np.where(xq >= x_last, z_last, inner)
+        )
+
+    # Working nodes per profile: optional Xon node, the sorted points that
+    # are kept, optional Xoff node
+    valid = np.ones(n_profiles, dtype=bool)
+    keep_points = np.ones(len(xs), dtype=bool)
+    if outofbounds_policy == "extend":
+        # Flat extension beyond the data, interpolation inside it
+        has_on = (xon < x_first) | (xon > x_first)
+        has_off = (xoff > x_last) | (xoff < x_last)
+        z_on = np.where(xon < x_first, z_first, interp_or_flat(xon))
+        z_off = np.where(xoff > x_last, z_last, interp_or_flat(xoff))
+    elif outofbounds_policy == "clip":
+        # Limits moved inside the data; profiles left without a window get
+        # no nodes and therefore zero volume
+        xon = np.where(x_first > xon, x_first, xon)
+        xoff = np.where(x_last < xoff, x_last, xoff)
+        has_on = has_off = xon < xoff
+        z_on = interp_or_flat(xon)
+        z_off = interp_or_flat(xoff)
+        keep_points = has_on[owner] & (xs > xon[owner]) & (xs < xoff[owner])
+    else:
+        valid = ~((xon < x_first) | (xoff > x_last))
+        has_on = has_off = np.zeros(n_profiles, dtype=bool)
+        z_on = z_off = np.full(n_profiles, np.nan)
+        keep_points = valid[owner]
+
+    n_on = has_on.astype(np.int64)
+    node_offsets = np.zeros(n_profiles + 1, dtype=np.int64)
+    np.cumsum(n_on + counts + has_off, out=node_offsets[1:])
+    node_x = np.empty(node_offsets[-1])
+    node_z = np.empty(node_offsets[-1])
+    node_keep = np.ones(node_offsets[-1], dtype=bool)
+
+    point_slot = (
+        node_offsets[:-1][owner]
+        + n_on[owner]
+        + np.arange(len(xs))
+        - offsets[:-1][owner]
+    )
+    node_x[point_slot] = xs
+    node_z[point_slot] = zs
+    node_keep[point_slot] = keep_points
+    on_slot = node_offsets[:-1][has_on]
+    node_x[on_slot] = xon[has_on]
+    node_z[on_slot] = z_on[has_on]
+    off_slot = node_offsets[1:][has_off] - 1
+    node_x[off_slot] = xoff[has_off]
+    node_z[off_slot] = z_off[has_off]
+
+    # Restrict to [XOn, XOff], then drop exact consecutive duplicate x
+    node_owner = segment_index(node_offsets)
+    node_keep &= (node_x >= xon[node_owner]) & (node_x <= xoff[node_owner])
+    wx, wz = node_x[node_keep], node_z[node_keep]
+    w_owner = node_owner[node_keep]
+    repeat = (wx[1:] == wx[:-1]) & (w_owner[1:] == w_owner[:-1])
+    unique = np.concatenate([[True], ~repeat])[: len(wx)]
+    wx, wz, w_owner = wx[unique], wz[unique], w_owner[unique]
+    w_counts = np.bincount(w_owner, minlength=n_profiles)
+
+    # Segments between consecutive working nodes
+    left = np.flatnonzero(w_owner[1:] == w_owner[:-1])
+    right = left + 1
+    seg_owner = w_owner[left]
+    seg_offsets = np.zeros(n_profiles + 1, dtype=np.int64)
+    np.cumsum(np.maximum(w_counts - 1, 0), out=seg_offsets[1:])
+
+    # Area above Zref with heights clipped at zero
+    h0 = wz[left] - zref[seg_owner]
+    h1 = wz[right] - zref[seg_owner]
+    h0_clip = np.where(0 > h0, 0.0, h0)
+    h1_clip = np.where(0 > h1, 0.0, h1)
+    seg_area = 0.5 * (h0_clip + h1_clip) * (wx[right] - wx[left])
+
+    # For 'extend', a last segment running from the last profile point to
+    # an extended Xoff is excluded (BMAP behavior)
+    if outofbounds_policy == "extend":
+        ends = np.flatnonzero(w_counts >= 2)
+        last = np.cumsum(w_counts)[ends] - 1
+        max_x = segment_reduce(np.maximum, x, offsets)
+        drop = np.isclose(wx[last], xoff[ends]) & np.isclose(
+            wx[last - 1], max_x[ends]
+        )
+        seg_area[seg_offsets[1:][ends[drop]] - 1] = 0.0
+    area = segment_sequential_sum(seg_area, seg_offsets)
 
+    # First crossing of Zref (for reporting)
+    crosses = h0 * h1 < 0
+    first = segment_reduce(
+        np.minimum,
+        np.where(crosses, np.arange(len(left)), len(left)),
+        seg_offsets,
+    )
+    found = first < len(left)
+    pick = first[found].astype(np.int64)
+    i0, i1 = left[pick], right[pick]
+    frac = (zref[found] - wz[i0]) / (wz[i1] - wz[i0])
+    contour_x = np.full(n_profiles, np.nan)
+    contour_x[found] = wx[i0] + frac * (wx[i1] - wx[i0])
 
-def _extend_or_interp(x, z, xq):
-    """Interpolate within bounds or flat-extend beyond."""
-    x, z = np.array(x), np.array(z)
-    idx = np.argsort(x)
-    x, z = x[idx], z[idx]
-    if xq <= x[0]:
-        return z[0]
-    if xq >= x[-1]:
-        return z[-1]
-    return float(np.interp(xq, x, z))
+    volume = area / 27.0
+    volume[~valid] = np.nan
+    return {
+        "valid": valid,
+        "x_on": xon,
+        "x_off": xoff,
+        "volume_cuyd_per_ft": volume,
+        "contour_x": contour_x,
+    }
 
 
 def compute_volume_xon_xoff(
@@ -57,130 +235,75 @@ def compute_volume_xon_xoff(
 ):
     """Compute volume between user-specified Xon/Xoff and above Zref.
     outofbounds_policy: 'extend' (flat), 'clip' (adjust), 'skip' (remove)"""
-    x, z = np.array(profile.x), np.array(profile.z)
-    idx = np.argsort(x)
-    x, z = x[idx], z[idx]
-
+    x = np.asarray(profile.x, dtype=float)
+    res = compute_volume_xon_xoff_batch(
+        x,
+        profile.z,
+        np.array([0, len(x)]),
+        xon,
+        xoff,
+        zref,
+        outofbounds_policy,
+    )
     # Policy 3: skip profile if Xon/Xoff are out of bounds
-    if outofbounds_policy == "skip":
-        if xon < x[0] or xoff > x[-1]:
-            return None
-
-    # Policy 2: clip Xon/Xoff to bounds
-    if outofbounds_policy == "clip":
-        xon = max(xon, x[0])
-        xoff = min(xoff, x[-1])
-        if xon >= xoff:
-            return {
-                "x_on": float(xon),
-                "x_off": float(xoff),
-                "volume_cuyd_per_ft": 0.0,
-                "contour_x": None,
-            }
+    if not res["valid"][0]:
+        return None
+    contour_x = float(res["contour_x"][0])
+    return {
+        "x_on": float(res["x_on"][0]),
+        "x_off": float(res["x_off"][0]),
+        "volume_cuyd_per_ft": float(res["volume_cuyd_per_ft"][0]),
+        "contour_x": contour_x if contour_x == contour_x else None,
+    }
 
-    # Policy 1: extend (default, flat extension)
-    def interp_or_flat(x, z, xq):
-        if xq <= x[0]:
-            return z[0]
-        if xq >= x[-1]:
-            return z[-1]
-        return float(np.interp(xq, x, z))
 
-    x_list, z_list = list(x), list(z)
-    if outofbounds_policy == "extend":
-        if xon < x[0]:
-            x_list = [xon] + x_list
-            z_list = [z[0]] + z_list
-        elif xon > x[0]:
-            x_list = [xon] + x_list
-            z_list = [interp_or_flat(x, z, xon)] + z_list
-        if xoff > x[-1]:
-            x_list = x_list + [xoff]
-            z_list = z_list + [z[-1]]
-        elif xoff < x[-1]:
-            x_list = x_list + [xoff]
-            z_list = z_list + [interp_or_flat(x, z, xoff)]
-        x = np.array(x_list)
-        z = np.array(z_list)
-    elif outofbounds_policy == "clip":
-        # Just restrict to [xon, xoff] (already clipped above)
-        x_list, z_list = [xon], [interp_or_flat(x, z, xon)]
-        for xi, zi in zip(x, z):
-            if xon < xi < xoff:
-                x_list.append(xi)
-                z_list.append(zi)
-        x_list.append(xoff)
-        z_list.append(interp_or_flat(x, z, xoff))
-        x = np.array(x_list)
-        z = np.array(z_list)
-    # For 'skip', we already returned None above
-    # Restrict to [XOn, XOff]
-    mask = (x >= xon) & (x <= xoff)
-    x = x[mask]
-    z = z[mask]
-    if len(x) < 2:
-        return {
-            "x_on": float(xon),
-            "x_off": float(xoff),
-            "volume_cuyd_per_ft": 0.0,
-            "contour_x": None,
-        }
-    # Remove exact consecutive duplicate x
-    xz = [(x[0], z[0])]
-    for i in range(1, len(x)):
-        if x[i] == x[i - 1]:
-            continue
-        xz.append((x[i], z[i]))
-    x, z = np.array([p[0] for p in xz]), np.array([p[1] for p in xz])
-    # Integrate area above Zref
-    area = 0.0
-    nseg = len(x) - 1
-    # For 'extend' policy, if Xoff > last profile x, exclude the last segment (BMAP behavior)
-    if outofbounds_policy == "extend" and len(x) >= 2:
-        # Find the last profile x (before extension)
-        last_profile_x = np.max(np.array(profile.x))
-        # If the last x in the working array is Xoff and the previous is last_profile_x, exclude this segment
-        if np.isclose(x[-1], xoff) and np.isclose(x[-2], last_profile_x):
-            nseg -= 1
-    for i in range(nseg):
-        x0, x1 = x[i], x[i + 1]
-        z0, z1 = z[i], z[i + 1]
-        h0 = z0 - zref
-        h1 = z1 - zref
-        h0_clip = max(h0, 0)
-        h1_clip = max(h1, 0)
-        seg_area = 0.5 * (h0_clip + h1_clip) * (x1 - x0)
-        area += float(seg_area)
-    area_cuyd_per_ft = area / 27.0
-    # Find first crossing of Zref (optional, for reporting)
-    x_cross = None
-    for i in range(1, len(x)):
-        if (z[i - 1] - zref) * (z[i] - zref) < 0:
-            frac = (zref - z[i - 1]) / (z[i] - z[i - 1])
-            x_cross = x[i - 1] + frac * (x[i] - x[i - 1])
-            break
+def load_line_limits(
+    csv_path: str | Path,
+    names: list[str],
+    columns: dict[str, str],
+    name_column: str = "profile_name",
+) -> dict[str, np.ndarray]:
+    """
+    Look up per-line limits (e.g. from ``beach_profile_network.csv``).
+
+    Args:
+        csv_path: CSV with one row per profile line
+        names: Profile line name of each profile
+        columns: Mapping of limit name (``xon``, ``xoff``, ``zref``) to the
+            CSV column holding it
+        name_column: Column with the profile line names
+
+    Returns:
+        Dict mapping each limit name to one float per profile (NaN where
+        the line is not listed or the value is blank)
+
+    Raises:
+        ValueError: If a requested column is missing from the file
+    """
+    values = load_network_columns(csv_path, columns, name_column)
     return {
-        "x_on": float(xon),
-        "x_off": float(xoff),
-        "volume_cuyd_per_ft": float(area_cuyd_per_ft),
-        "contour_x": float(x_cross) if x_cross is not None else None,
+        limit: series.reindex(names).to_numpy(dtype=float)
+        for limit, series in values.items()
     }
 
 
 def main():
     ap = argparse.ArgumentParser(description="BMAP-style Volume from Xon–Xoff")
     ap.add_argument("--input", required=True, help="BMAP Free Format file")
+    ap.add_argument("--xon", type=float, help="Landward limit (ft)")
+    ap.add_argument("--xoff", type=float, help="Seaward limit (ft)")
     ap.add_argument(
-        "--xon", type=float, required=True, help="Landward limit (ft)"
+        "--zref", type=float, help="Reference contour elevation (ft)"
     )
     ap.add_argument(
-        "--xoff", type=float, required=True, help="Seaward limit (ft)"
+        "--limits",
+        help="CSV of per-line limits, e.g. beach_profile_network.csv "
+        "(lines missing from it fall back to --xon/--xoff/--zref)",
     )
+    ap.add_argument("--xon-column", help="Limits column holding Xon")
+    ap.add_argument("--xoff-column", help="Limits column holding Xoff")
     ap.add_argument(
-        "--zref",
-        type=float,
-        required=True,
-        help="Reference contour elevation (ft)",
+        "--zref-column", help="Limits column holding Zref (e.g. ClosureDep)"
     )
     ap.add_argument("--output", required=True, help="Output ASCII report path")
     ap.add_argument("--title", default="Untitled", help="Report title")
@@ -188,7 +311,8 @@ def main():
         "--dx",
         type=float,
         default=None,
-        help="Analysis step size in feet (default from config.json)",
+        help="Ignored; kept for compatibility (volumes integrate the "
+        "profile points directly, without a step size)",
     )
     ap.add_argument(
         "--outofbounds-policy",
@@ -198,33 +322,90 @@ def main():
     )
     args = ap.parse_args()
 
-    if args.xon >= args.xoff:
+    columns = {
+        limit: col
+        for limit, col in (
+            ("xon", args.xon_column),
+            ("xoff", args.xoff_column),
+            ("zref", args.zref_column),
+        )
+        if col
+    }
+    if columns and not args.limits:
+        raise SystemExit("Error: limit columns require --limits.")
+    for limit in ("xon", "xoff", "zref"):
+        if getattr(args, limit) is None and limit not in columns:
+            raise SystemExit(
+                f"Error: --{limit} or --{limit}-column is required."
+            )
+    if not columns and args.xon >= args.xoff:
         raise SystemExit("Error: Xon must be less than Xoff.")
 
-    dx = args.dx if args.dx is not None else get_dx()
-
-    profiles = read_bmap_freeformat(args.input)
-    results = []
+    logger = get_logger(LogComponent.CLI)
 
-    for p in profiles:
-        res = compute_volume_xon_xoff(
-            p, args.xon, args.xoff, args.zref, dx, args.outofbounds_policy
+    # Load every profile into columnar arrays and compute all at once
+    profiles = ProfileCollection.from_bmap(args.input)
+    names = profiles.names
+    limits = {
+        limit: np.full(len(profiles), np.nan if value is None else value)
+        for limit, value in (
+            ("xon", args.xon),
+            ("xoff", args.xoff),
+            ("zref", args.zref),
         )
-        if res is None:
+    }
+    if columns:
+        looked_up = load_line_limits(args.limits, names, columns)
+        for limit, values in looked_up.items():
+            limits[limit] = np.where(np.isnan(values), limits[limit], values)
+
+    usable = (
+        np.isfinite(limits["xon"])
+        & np.isfinite(limits["xoff"])
+        & np.isfinite(limits["zref"])
+        & (limits["xon"] < limits["xoff"])
+    )
+    for i in np.flatnonzero(~usable).tolist():
+        logger.warning(f"No usable Xon/Xoff/Zref for {names[i]}; skipped")
+    selected = profiles.take(np.flatnonzero(usable))
+    res = compute_volume_xon_xoff_batch(
+        selected.x,
+        selected.z,
+        selected.offsets,
+        limits["xon"][usable],
+        limits["xoff"][usable],
+        limits["zref"][usable],
+        args.outofbounds_policy,
+    )
+
+    # With a Zref column each line may use its own Zref; report it per line
+    per_line_zref = "zref" in columns
+    zrefs = limits["zref"][usable]
+    results = []
+    for i, (name, date, description) in enumerate(
+        zip(selected.names, selected.dates, selected.descriptions)
+    ):
+        if not res["valid"][i]:
             continue  # skip profile if policy is 'skip' and out of bounds
+        contour_x = float(res["contour_x"][i])
         results.append(
             {
-                "label": f"{p.name} {p.date or ''} {p.description or ''}".strip(),
-                "x_on": res["x_on"],
-                "x_off": res["x_off"],
-                "volume_cuyd_per_ft": res["volume_cuyd_per_ft"],
-                "contour_x": res["contour_x"],
+                "label": f"{name} {date or ''} {description or ''}".strip(),
+                "x_on": float(res["x_on"][i]),
+                "x_off": float(res["x_off"][i]),
+                "volume_cuyd_per_ft": float(res["volume_cuyd_per_ft"][i]),
+                "contour_x": contour_x if contour_x == contour_x else None,
+                "zref": float(zrefs[i]),
             }
         )
 
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    write_volume_report(args.output, results, args.zref, args.title)
-    logger = get_logger(LogComponent.CLI)
+    write_volume_report(
+        args.output,
+        results,
+        None if per_line_zref else args.zref,
+        args.title,
+    )
     logger.info(f"Volume from Xon–Xoff report written to: {args.output}")
 
 
@@ -5,4 +5,4 @@ Modules that combine multiple analysis tools for annual
 beach monitoring and long-term trend evaluation.
 """
 
-__all__ = []
+__all__ = ["elevation_bands", "shoreline_analysis", "survey_change"]
@@ -0,0 +1,468 @@
+"""
+Elevation Bands
+---------------
+Cross-sectional areas and volume changes within user-defined elevation
+bands (e.g. dune crest to MHW, MHW to MLW, MLW to closure depth).
+
+Bands are given as named breakpoints ordered from the top down; each
+consecutive pair of breakpoints bounds one band, so
+``{"crest": inf, "MHW": 1.9, "MLW": -2.6, "closure": -15}`` defines the
+bands "crest to MHW", "MHW to MLW" and "MLW to closure". A breakpoint may
+be one elevation for every line or a per-line mapping, such as the
+``MHW_Elev`` / ``MLW_Elev`` / ``ClosureDep`` columns of the profile
+network file (see ``csv_io.load_network_columns``).
+
+All profiles are held as one columnar set. For every profile and
+breakpoint, the area above the breakpoint is accumulated once along the
+profile (exactly, splitting segments where they cross the breakpoint).
+Band areas and band volume changes for every profile and survey pair are
+then differences of those running areas, evaluated in a few vectorized
+passes.
+
+Example:
+    python -m profcalc.tools.monitoring.elevation_bands \
+      data/testing_files/bmap_calcs/OC_2021-2024_Monitoring.dat \
+      --network data/required/beach_profile_network.csv \
+      --breakpoints crest=inf MHW=MHW_Elev MLW=MLW_Elev closure=ClosureDep \
+      --areas-output band_areas.csv --changes-output band_changes.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from profcalc.common.bmap_io import Profile, read_bmap_freeformat
+from profcalc.common.csv_io import load_network_columns
+from profcalc.common.error_handler import LogComponent, get_logger
+from profcalc.common.profile_batch import (
+    segment_argsort,
+    segment_index,
+    segment_searchsorted,
+)
+from profcalc.common.profile_collection import ProfileCollection
+from profcalc.common.profile_integration import positive_part_areas
+from profcalc.tools.monitoring.survey_change import (
+    COMPARISONS,
+    check_comparisons,
+    comparison_pairs,
+    group_surveys_by_line,
+    survey_date,
+)
+
+Breakpoint = Union[float, Mapping]
+
+_AREA_COLUMNS = [
+    "line",
+    "date",
+    "band",
+    "upper_elev",
+    "lower_elev",
+    "x_start",
+    "x_end",
+    "area_ft2_per_ft",
+    "volume_cuyd_per_ft",
+]
+
+_CHANGE_COLUMNS = [
+    "line",
+    "comparison",
+    "from_date",
+    "to_date",
+    "band",
+    "upper_elev",
+    "lower_elev",
+    "x_on",
+    "x_off",
+    "volume_change_cuyd_per_ft",
+]
+
+
+def _running_areas_above(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    levels: np.ndarray,
+    xq: np.ndarray,
+    q_owner: np.ndarray,
+) -> np.ndarray:
+    """Area above each level from the start of the profile to ``xq``.
+
+    ``x``/``z`` must be sorted within each profile and ``levels`` finite,
+    with one row per profile. Queries must lie within their profile's X
+    range; the result has one row per query and one column per level.
+    """
+    owner = segment_index(offsets)
+    h = z[:, None] - levels[owner]
+
+    # Exact area above each level of every segment; segments joining two
+    # profiles contribute nothing
+    terms = positive_part_areas(x[:-1, None], x[1:, None], h[:-1], h[1:])
+    joins = offsets[1:-1] - 1
+    terms[joins[(joins >= 0) & (joins < len(terms))]] = 0.0
+    running = np.concatenate(
+        [np.zeros((1, levels.shape[1])), np.cumsum(terms, axis=0)]
+    )
+
+    # Node at or left of each query, and the partial segment beyond it
+    start = offsets[q_owner]
+    stop = offsets[q_owner + 1]
+    j = np.clip(
+        segment_searchsorted(x, offsets, xq, q_owner, "right") - 1,
+        start,
+        stop - 1,
+    )
+    k = np.minimum(j + 1, stop - 1)
+    width = x[k] - x[j]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(width > 0, (xq - x[j]) / width, 0.0)
+    hq = (z[j] + t * (z[k] - z[j]))[:, None] - levels[q_owner]
+    partial = positive_part_areas(x[j, None], xq[:, None], h[j], hq)
+    return running[j] - running[start] + partial
+
+
+def _band_integrals(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    levels: np.ndarray,
+    xq: np.ndarray,
+    q_owner: np.ndarray,
+) -> np.ndarray:
+    """Band areas from the start of each query's profile to the query.
+
+    ``levels`` may hold +inf (no upper limit); NaN, -inf or inverted
+    breakpoints give NaN bands. Returns one column per band.
+    """
+    usable = np.isfinite(levels)
+    above = _running_areas_above(
+        x, z, offsets, np.where(usable, levels, 0.0), xq, q_owner
+    )
+    q_levels = levels[q_owner]
+    above = np.where(np.isposinf(q_levels), 0.0, above)
+    above = np.where(np.isnan(q_levels) | np.isneginf(q_levels), np.nan, above)
+    bands = above[:, 1:] - above[:, :-1]
+    inverted = ~(q_levels[:, :-1] >= q_levels[:, 1:])
+    return np.where(inverted, np.nan, bands)
+
+
+def _sorted_columns(
+    collection: ProfileCollection,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Concatenated (x, z, offsets) with each profile sorted by x."""
+    order = segment_argsort(collection.x, collection.offsets)
+    return collection.x[order], collection.z[order], collection.offsets
+
+
+def compute_band_areas_batch(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    levels: np.ndarray,
+) -> np.ndarray:
+    """
+    Band areas of every profile over its own X range.
+
+    Args:
+        x: Concatenated cross-shore distances, sorted within each profile
+        z: Concatenated elevations
+        offsets: Profile start offsets plus the total point count (every
+            profile must have at least one point)
+        levels: Breakpoint elevations, one row per profile ordered from
+            the top down (+inf for an open top)
+
+    Returns:
+        Array of band areas in ft^2/ft, one row per profile and one column
+        per band (NaN where a breakpoint is missing or the band inverted)
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    levels = np.asarray(levels, dtype=float)
+    owner = np.arange(len(offsets) - 1)
+    return _band_integrals(x, z, offsets, levels, x[offsets[1:] - 1], owner)
+
+
+def compute_band_changes_batch(
+    x: np.ndarray,
+    z: np.ndarray,
+    offsets: np.ndarray,
+    levels: np.ndarray,
+    earlier: np.ndarray,
+    later: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Band volume changes between profile pairs over their common X range.
+
+    Args:
+        x: Concatenated cross-shore distances, sorted within each profile
+        z: Concatenated elevations
+        offsets: Profile start offsets plus the total point count
+        levels: Breakpoint elevations, one row per profile ordered from
+            the top down; both profiles of a pair should share them (as
+            surveys of one line do)
+        earlier: Index of the earlier profile of each pair
+        later: Index of the later profile of each pair
+
+    Returns:
+        Dict with ``x_on``/``x_off`` of each pair's common range and
+        ``volume_change_cuyd_per_ft`` (later minus earlier, one row per
+        pair and one column per band; NaN where the profiles do not
+        overlap)
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    levels = np.asarray(levels, dtype=float)
+    earlier = np.asarray(earlier, dtype=np.int64)
+    later = np.asarray(later, dtype=np.int64)
+    x_min = x[offsets[:-1]]
+    x_max = x[offsets[1:] - 1]
+    x_on = np.maximum(x_min[earlier], x_min[later])
+    x_off = np.minimum(x_max[earlier], x_max[later])
+    overlap = x_on < x_off
+    # Pairs that do not overlap get an empty window and are masked below
+    x_on = np.where(overlap, x_on, x_min[earlier])
+    x_off = np.where(overlap, x_off, x_min[earlier])
+
+    # The four window ends of every pair are evaluated in one pass
+    owners = np.concatenate([earlier, earlier, later, later])
+    xq = np.concatenate([x_on, x_off, x_on, x_off])
+    band = _band_integrals(x, z, offsets, levels, xq, owners)
+    n = len(earlier)
+    before = band[n : 2 * n] - band[:n]
+    after = band[3 * n :] - band[2 * n : 3 * n]
+    change = np.where(overlap[:, None], (after - before) / 27.0, np.nan)
+    return {
+        "x_on": np.where(overlap, x_on, np.nan),
+        "x_off": np.where(overlap, x_off, np.nan),
+        "volume_change_cuyd_per_ft": change,
+    }
+
+
+def _breakpoint_levels(
+    breakpoints: Mapping[str, Breakpoint], lines: Sequence[str]
+) -> np.ndarray:
+    """One row of breakpoint elevations per line (NaN where unknown)."""
+    columns = []
+    for value in breakpoints.values():
+        if isinstance(value, (Mapping, pd.Series)):
+            series = pd.Series(value, dtype=float)
+            columns.append(series.reindex(list(lines)).to_numpy(dtype=float))
+        else:
+            columns.append(np.full(len(lines), float(value)))
+    return np.column_stack(columns)
+
+
+def compute_band_tables(
+    profiles: Sequence[Profile],
+    breakpoints: Mapping[str, Breakpoint],
+    comparisons: Sequence[str] = COMPARISONS,
+    baseline_date: Optional[str] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Band areas of every survey and band volume changes of survey pairs.
+
+    Surveys are grouped by line and ordered by date as in
+    ``survey_change.compute_change_matrix``, and compared consecutively
+    and/or against a baseline survey.
+
+    Args:
+        profiles: Profiles of all lines and surveys
+        breakpoints: Named breakpoints ordered from the top down; each
+            value is an elevation for every line (``float("inf")`` for an
+            open top) or a per-line mapping such as a Series from
+            ``csv_io.load_network_columns``
+        comparisons: Any of ``survey_change.COMPARISONS``
+        baseline_date: Baseline survey date (default: each line's first
+            survey)
+
+    Returns:
+        Tuple of tidy (areas, changes) DataFrames with one row per survey
+        (or survey pair) and band. ``areas`` holds line, date, band,
+        upper_elev, lower_elev, x_start, x_end, area_ft2_per_ft and
+        volume_cuyd_per_ft; ``changes`` holds line, comparison, from_date,
+        to_date, band, upper_elev, lower_elev, x_on, x_off and
+        volume_change_cuyd_per_ft. Bands with a missing or inverted
+        breakpoint are NaN.
+
+    Raises:
+        ValueError: If fewer than two breakpoints are given, a comparison
+            is unknown or ``baseline_date`` cannot be parsed
+    """
+    if len(breakpoints) < 2:
+        raise ValueError("At least two breakpoints are needed for a band")
+    baseline = check_comparisons(comparisons, baseline_date)
+    names = list(breakpoints)
+    band_names = [f"{a} to {b}" for a, b in zip(names[:-1], names[1:])]
+    n_bands = len(band_names)
+
+    lines = group_surveys_by_line([p for p in profiles if len(p.x) > 0])
+    surveys = [p for line in lines.values() for p in line]
+    if not surveys:
+        return (
+            pd.DataFrame(columns=_AREA_COLUMNS),
+            pd.DataFrame(columns=_CHANGE_COLUMNS),
+        )
+    line_of = [p.name for p in surveys]
+    # Grouped surveys all have a date; the filter only narrows the type
+    dates = [
+        d.strftime("%Y-%m-%d")
+        for p in surveys
+        if (d := survey_date(p)) is not None
+    ]
+
+    # Survey pairs as global profile indices
+    earlier: List[int] = []
+    later: List[int] = []
+    labels: List[str] = []
+    first = 0
+    for line in lines.values():
+        line_dates = [d for p in line if (d := survey_date(p)) is not None]
+        pairs, pair_labels = comparison_pairs(
+            line_dates, comparisons, baseline
+        )
+        earlier += [first + a for a, _ in pairs]
+        later += [first + b for _, b in pairs]
+        labels += pair_labels
+        first += len(line)
+
+    x, z, offsets = _sorted_columns(ProfileCollection.from_profiles(surveys))
+    levels = _breakpoint_levels(breakpoints, line_of)
+    areas = compute_band_areas_batch(x, z, offsets, levels)
+    changes = compute_band_changes_batch(
+        x, z, offsets, levels, np.array(earlier), np.array(later)
+    )
+
+    # Tidy tables: one row per survey (or pair) and band
+    def repeat(values) -> np.ndarray:
+        return np.repeat(np.asarray(values), n_bands)
+
+    area_table = pd.DataFrame(
+        {
+            "line": repeat(line_of),
+            "date": repeat(dates),
+            "band": np.tile(band_names, len(surveys)),
+            "upper_elev": levels[:, :-1].ravel(),
+            "lower_elev": levels[:, 1:].ravel(),
+            "x_start": repeat(x[offsets[:-1]]),
+            "x_end": repeat(x[offsets[1:] - 1]),
+            "area_ft2_per_ft": areas.ravel(),
+            "volume_cuyd_per_ft": areas.ravel() / 27.0,
+        },
+        columns=_AREA_COLUMNS,
+    )
+    pair_earlier = np.array(earlier, dtype=np.int64)
+    change_table = pd.DataFrame(
+        {
+            "line": repeat([line_of[i] for i in earlier]),
+            "comparison": repeat(labels),
+            "from_date": repeat([dates[i] for i in earlier]),
+            "to_date": repeat([dates[i] for i in later]),
+            "band": np.tile(band_names, len(earlier)),
+            "upper_elev": levels[pair_earlier, :-1].ravel(),
+            "lower_elev": levels[pair_earlier, 1:].ravel(),
+            "x_on": repeat(changes["x_on"]),
+            "x_off": repeat(changes["x_off"]),
+            "volume_change_cuyd_per_ft": changes[
+                "volume_change_cuyd_per_ft"
+            ].ravel(),
+        },
+        columns=_CHANGE_COLUMNS,
+    )
+    return area_table, change_table
+
+
+# ---------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------
+
+
+def _parse_breakpoints(
+    specs: Sequence[str], network: Optional[str]
+) -> Dict[str, Breakpoint]:
+    """Parse ``NAME=VALUE`` specs; VALUE is an elevation or network column."""
+    # Keep the given order: it defines the bands from the top down
+    values: Dict[str, Union[float, str]] = {}
+    for spec in specs:
+        name, sep, value = spec.partition("=")
+        if not sep or not name or not value:
+            raise ValueError(f"Breakpoint must be NAME=VALUE, got {spec!r}")
+        try:
+            values[name] = float(value)
+        except ValueError:
+            values[name] = value
+    columns = {
+        name: value for name, value in values.items() if isinstance(value, str)
+    }
+    per_line: Dict[str, pd.Series] = {}
+    if columns:
+        if network is None:
+            raise ValueError(
+                f"Breakpoints {sorted(columns)} name network columns; "
+                "pass --network"
+            )
+        per_line = load_network_columns(network, columns)
+    return {
+        name: per_line[name] if isinstance(value, str) else value
+        for name, value in values.items()
+    }
+
+
+def execute_from_cli(args: list[str]) -> None:
+    """Compute band areas and band changes of a BMAP file as CSV tables."""
+    ap = argparse.ArgumentParser(
+        description="Areas and volume changes within elevation bands."
+    )
+    ap.add_argument("input", help="BMAP Free Format file with all surveys")
+    ap.add_argument(
+        "--breakpoints",
+        nargs="+",
+        required=True,
+        help=(
+            "Band breakpoints from the top down as NAME=VALUE, where VALUE "
+            "is an elevation (inf for an open top) or a network column "
+            "(e.g. crest=inf MHW=MHW_Elev MLW=MLW_Elev closure=ClosureDep)"
+        ),
+    )
+    ap.add_argument(
+        "--network",
+        default=None,
+        help="Profile network CSV holding per-line breakpoint columns",
+    )
+    ap.add_argument("--areas-output", required=True, help="Band areas CSV")
+    ap.add_argument("--changes-output", required=True, help="Band changes CSV")
+    ap.add_argument(
+        "--comparison",
+        choices=COMPARISONS + ("both",),
+        default="both",
+        help="Survey pairs to compare (default: both)",
+    )
+    ap.add_argument(
+        "--baseline-date",
+        default=None,
+        help="Baseline survey date (default: each line's first survey)",
+    )
+    parsed = ap.parse_args(args)
+
+    comparisons = (
+        COMPARISONS if parsed.comparison == "both" else (parsed.comparison,)
+    )
+    areas, changes = compute_band_tables(
+        read_bmap_freeformat(parsed.input),
+        _parse_breakpoints(parsed.breakpoints, parsed.network),
+        comparisons=comparisons,
+        baseline_date=parsed.baseline_date,
+    )
+    areas.to_csv(parsed.areas_output, index=False, float_format="%.3f")
+    changes.to_csv(parsed.changes_output, index=False, float_format="%.3f")
+    logger = get_logger(LogComponent.CLI)
+    logger.info(
+        f"Wrote {len(areas)} band areas to {parsed.areas_output} and "
+        f"{len(changes)} band changes to {parsed.changes_output}"
+    )
+
+
+if __name__ == "__main__":
+    execute_from_cli(sys.argv[1:])
@@ -0,0 +1,359 @@
+"""
+Shoreline Analysis
+------------------
+Shoreline (MHW) positions of every line and survey and the annual
+monitoring shoreline tables (see ``docs/SHORELINE_ANALYSIS_WORKFLOW.md``):
+
+- H-1: baseline-to-shoreline distance of every line and survey
+- H-2: shoreline distance from the design template (negative values are
+  landward of the template)
+- H-3: minimum, maximum and average distance from the design template of
+  every line, and the percent of surveys seaward of the template
+
+All surveys are held as one columnar set and the seaward-most MHW
+crossing of every profile is found in a single vectorized pass (MHW may
+differ per line, e.g. the ``MHW_Elev`` column of the profile network
+file). Positions are placed in map coordinates with the profile
+baselines, and the three tables are built from the same positions table,
+so a whole project is processed from one read of each input file.
+
+Example:
+    python -m profcalc.tools.monitoring.shoreline_analysis \
+      data/testing_files/bmap_calcs/OC_2021-2024_Monitoring.dat \
+      --network data/required/beach_profile_network.csv --mhw MHW_Elev \
+      --design design_shoreline.csv --design-column design_x \
+      --output-dir shoreline_tables
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from profcalc.common.bmap_io import Profile, read_bmap_freeformat
+from profcalc.common.contour_crossings import find_contour_crossings
+from profcalc.common.coordinate_transforms import batch_convert_2d_to_3d
+from profcalc.common.csv_io import (
+    load_network_columns,
+    load_profile_origin_azimuths,
+)
+from profcalc.common.error_handler import LogComponent, get_logger
+from profcalc.common.profile_batch import segment_argsort
+from profcalc.common.profile_collection import ProfileCollection
+from profcalc.tools.monitoring.survey_change import (
+    group_surveys_by_line,
+    survey_date,
+)
+
+PerLine = Union[float, Mapping]
+
+_POSITION_COLUMNS = [
+    "line",
+    "date",
+    "mhw_elev",
+    "shoreline_x",
+    "easting",
+    "northing",
+    "design_x",
+    "distance_from_design",
+]
+
+_SUMMARY_COLUMNS = [
+    "min_distance",
+    "max_distance",
+    "avg_distance",
+    "surveys",
+    "percent_seaward",
+]
+
+
+def _per_line(value: Optional[PerLine], lines: Sequence[str]) -> np.ndarray:
+    """One value per entry of ``lines`` (NaN where unknown)."""
+    if value is None:
+        return np.full(len(lines), np.nan)
+    if isinstance(value, (Mapping, pd.Series)):
+        series = pd.Series(value, dtype=float)
+        series = series[~series.index.duplicated()]
+        return series.reindex(list(lines)).to_numpy(dtype=float)
+    return np.full(len(lines), float(value))
+
+
+def extract_shorelines(
+    profiles: Sequence[Profile],
+    mhw: PerLine,
+    baselines: Optional[pd.DataFrame] = None,
+    design: Optional[PerLine] = None,
+) -> pd.DataFrame:
+    """
+    Shoreline position of every line and survey.
+
+    Args:
+        profiles: Profiles of all lines and surveys
+        mhw: MHW elevation for every line, or a per-line mapping such as a
+            Series from ``csv_io.load_network_columns``
+        baselines: Profile baselines with ``profile_id``, ``origin_x``,
+            ``origin_y`` and ``azimuth`` columns (as loaded from the
+            profile network or origin/azimuth file); without them the
+            map coordinates are NaN
+        design: Design template shoreline X (distance from the baseline)
+            for every line, or a per-line mapping
+
+    Returns:
+        DataFrame with one row per survey, grouped by line in date order:
+        line, date (ISO), mhw_elev, shoreline_x (seaward-most MHW crossing,
+        NaN if the survey never reaches MHW), easting and northing of the
+        shoreline, design_x and distance_from_design (shoreline_x minus
+        design_x; positive is seaward of the template)
+    """
+    lines = group_surveys_by_line([p for p in profiles if len(p.x) > 0])
+    surveys = [p for line in lines.values() for p in line]
+    if not surveys:
+        return pd.DataFrame(columns=_POSITION_COLUMNS)
+    line_of = [p.name for p in surveys]
+    # Grouped surveys all have a date; the filter only narrows the type
+    dates = [d for p in surveys if (d := survey_date(p)) is not None]
+
+    # Seaward-most MHW crossing of every survey in one pass
+    collection = ProfileCollection.from_profiles(surveys)
+    order = segment_argsort(collection.x, collection.offsets)
+    mhw_elev = _per_line(mhw, line_of)
+    shoreline_x = find_contour_crossings(
+        collection.x[order],
+        collection.z[order],
+        collection.offsets,
+        mhw_elev[:, None],
+    )["seaward"][:, 0]
+
+    easting = np.full(len(surveys), np.nan)
+    northing = np.full(len(surveys), np.nan)
+    if baselines is not None:
+        table = baselines.drop_duplicates("profile_id").set_index("profile_id")
+        known = np.isin(line_of, table.index)
+        missing = sorted(set(line_of) - set(table.index))
+        if missing:
+            logger = get_logger(LogComponent.SPATIAL)
+            logger.warning(f"No baseline found for lines: {missing}")
+        rows = table.loc[np.asarray(line_of)[known]]
+        easting[known], northing[known] = batch_convert_2d_to_3d(
+            shoreline_x[known],
+            rows["origin_x"].to_numpy(dtype=float),
+            rows["origin_y"].to_numpy(dtype=float),
+            rows["azimuth"].to_numpy(dtype=float),
+            profile_index=np.arange(int(known.sum())),
+        )
+
+    design_x = _per_line(design, line_of)
+    return pd.DataFrame(
+        {
+            "line": line_of,
+            "date": [d.strftime("%Y-%m-%d") for d in dates],
+            "mhw_elev": mhw_elev,
+            "shoreline_x": shoreline_x,
+            "easting": easting,
+            "northing": northing,
+            "design_x": design_x,
+            "distance_from_design": shoreline_x - design_x,
+        },
+        columns=_POSITION_COLUMNS,
+    )
+
+
+def summarize_shorelines(positions: pd.DataFrame) -> pd.DataFrame:
+    """
+    H-3 summary of ``extract_shorelines`` output.
+
+    Args:
+        positions: Output of ``extract_shorelines``
+
+    Returns:
+        DataFrame indexed by line with min_distance, max_distance and
+        avg_distance from the design template, the number of surveys with
+        a distance and percent_seaward (percent of those surveys seaward
+        of the template)
+    """
+    distance = positions["distance_from_design"]
+    seaward = np.where(distance.notna(), distance > 0, np.nan)
+    grouped = (
+        positions.assign(seaward=seaward)
+        .groupby("line", sort=False)
+        .agg(
+            min_distance=("distance_from_design", "min"),
+            max_distance=("distance_from_design", "max"),
+            avg_distance=("distance_from_design", "mean"),
+            surveys=("distance_from_design", "count"),
+            percent_seaward=("seaward", "mean"),
+        )
+    )
+    grouped["percent_seaward"] = grouped["percent_seaward"] * 100.0
+    return grouped[_SUMMARY_COLUMNS]
+
+
+def build_shoreline_tables(
+    profiles: Sequence[Profile],
+    mhw: PerLine,
+    baselines: Optional[pd.DataFrame] = None,
+    design: Optional[PerLine] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Shoreline positions and the H-1, H-2 and H-3 tables of a project.
+
+    Args:
+        profiles: Profiles of all lines and surveys
+        mhw: MHW elevation for every line, or a per-line mapping
+        baselines: Profile baselines (see ``extract_shorelines``)
+        design: Design template shoreline X for every line, or a per-line
+            mapping
+
+    Returns:
+        Dict with ``positions`` (``extract_shorelines`` output), ``H-1``
+        and ``H-2`` (lines x survey dates of shoreline_x and
+        distance_from_design) and ``H-3`` (``summarize_shorelines``)
+    """
+    positions = extract_shorelines(profiles, mhw, baselines, design)
+
+    def pivot(value: str) -> pd.DataFrame:
+        return positions.pivot_table(
+            index="line",
+            columns="date",
+            values=value,
+            aggfunc="last",
+            dropna=False,
+            sort=False,
+        ).sort_index(axis=1)
+
+    return {
+        "positions": positions,
+        "H-1": pivot("shoreline_x"),
+        "H-2": pivot("distance_from_design"),
+        "H-3": summarize_shorelines(positions),
+    }
+
+
+# ---------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------
+
+
+def _elevation_or_column(
+    value: str, network: Optional[str]
+) -> Union[float, pd.Series]:
+    """Parse an elevation, or read the named column of the network file."""
+    try:
+        return float(value)
+    except ValueError:
+        if network is None:
+            raise ValueError(
+                f"MHW {value!r} names a network column; pass --network"
+            ) from None
+        return load_network_columns(network, {"mhw": value})["mhw"]
+
+
+def execute_from_cli(args: list[str]) -> None:
+    """Write shoreline positions and the H-1/H-2/H-3 tables as CSV."""
+    ap = argparse.ArgumentParser(
+        description="Shoreline positions and H-1/H-2/H-3 tables."
+    )
+    ap.add_argument("input", help="BMAP Free Format file with all surveys")
+    ap.add_argument(
+        "--output-dir", required=True, help="Directory for the CSV tables"
+    )
+    ap.add_argument(
+        "--network",
+        default=None,
+        help="Profile network CSV (baselines and per-line MHW column)",
+    )
+    ap.add_argument(
+        "--mhw",
+        default="MHW_Elev",
+        help="MHW elevation in ft or network column (default: MHW_Elev)",
+    )
+    ap.add_argument(
+        "--baselines",
+        default=None,
+        help="Origin/azimuth CSV (default: the network file)",
+    )
+    ap.add_argument(
+        "--design", default=None, help="CSV of design template shorelines"
+    )
+    ap.add_argument(
+        "--design-column",
+        default="design_x",
+        help="Design shoreline X column of --design (default: design_x)",
+    )
+    parsed = ap.parse_args(args)
+
+    try:
+        mhw = _elevation_or_column(parsed.mhw, parsed.network)
+    except ValueError as e:
+        ap.error(str(e))
+    baseline_file = parsed.baselines or parsed.network
+    baselines = (
+        load_profile_origin_azimuths(baseline_file) if baseline_file else None
+    )
+    design = (
+        load_network_columns(parsed.design, {"design": parsed.design_column})[
+            "design"
+        ]
+        if parsed.design
+        else None
+    )
+    tables = build_shoreline_tables(
+        read_bmap_freeformat(parsed.input),
+        mhw,
+        baselines=baselines,
+        design=design,
+    )
+
+    output_dir = Path(parsed.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written: List[str] = []
+    for name, table in tables.items():
+        path = output_dir / f"shoreline_{name.replace('-', '')}.csv"
+        table.to_csv(path, index=name != "positions", float_format="%.3f")
+        written.append(str(path))
+    logger = get_logger(LogComponent.CLI)
+    logger.info(
+        f"Wrote shoreline tables for "
+        f"{tables['positions']['line'].nunique()} lines: {written}"
+    )
+
+
+def execute_from_menu() -> None:
+    """Interactive menu wrapper for the shoreline tables."""
+    print("\n" + "=" * 60)
+    print("SHORELINE ANALYSIS (H-1 / H-2 / H-3)")
+    print("=" * 60)
+
+    input_file = input("Enter BMAP file path (all surveys): ").strip()
+    network = input("Enter profile network CSV path: ").strip()
+    mhw = input("MHW elevation or network column [MHW_Elev]: ").strip()
+    design = input("Design template CSV (blank to skip): ").strip()
+    output_dir = input("Enter output directory: ").strip()
+
+    args = [input_file, "--output-dir", output_dir]
+    if network:
+        args.extend(["--network", network])
+    if mhw:
+        args.extend(["--mhw", mhw])
+    if design:
+        args.extend(["--design", design])
+        column = input("Design shoreline X column [design_x]: ").strip()
+        if column:
+            args.extend(["--design-column", column])
+    try:
+        execute_from_cli(args)
+        print(f"\n✅ Shoreline tables written to: {output_dir}")
+    except (Exception, SystemExit) as e:
+        print(f"\n❌ Error: {e}")
+
+    input("\nPress Enter to continue...")
+
+
+if __name__ == "__main__":
+    execute_from_cli(sys.argv[1:])
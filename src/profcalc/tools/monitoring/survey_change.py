@@ -0,0 +1,413 @@
+"""
+Survey Change Matrix
+--------------------
+Net volume, above/below-datum and shoreline change between surveys of
+every line in a monitoring program.
+
+Profiles are grouped by line name and ordered by survey date. Each line is
+resampled once onto a shared grid (``dx`` spacing plus every survey's end
+points), and running above/below-datum areas of each resampled survey are
+accumulated once. Any pair of surveys is then read off those running sums
+over the pair's common X range, so a line with ``S`` surveys costs ``S``
+resamples no matter how many pairs are compared.
+
+Comparisons:
+- ``consecutive``: each survey against the previous survey of the line
+- ``baseline``: each survey against the line's baseline survey (the first
+  survey, or the survey on ``baseline_date``)
+
+Sign conventions follow the Cut & Fill tool: changes are later minus
+earlier survey, so positive volumes are accretion and positive shoreline
+changes are seaward advances.
+
+Example:
+    python -m profcalc.tools.monitoring.survey_change \
+      data/testing_files/bmap_calcs/OC_2021-2024_Monitoring.dat \
+      --output survey_changes.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from profcalc.common.bmap_io import (
+    Profile,
+    format_date_for_bmap,
+    read_bmap_freeformat,
+)
+from profcalc.common.contour_crossings import find_contour_crossings
+from profcalc.common.error_handler import LogComponent, get_logger
+from profcalc.common.profile_integration import positive_part_areas
+
+COMPARISONS = ("consecutive", "baseline")
+
+_CHANGE_COLUMNS = [
+    "line",
+    "comparison",
+    "from_date",
+    "to_date",
+    "x_on",
+    "x_off",
+    "volume_change_cuyd_per_ft",
+    "above_datum_cuyd_per_ft",
+    "below_datum_cuyd_per_ft",
+    "shoreline_from_x",
+    "shoreline_to_x",
+    "shoreline_change_ft",
+]
+
+
+def survey_date(profile: Profile) -> Optional[datetime]:
+    """Parse a profile's survey date, or None if it has no usable date."""
+    bmap_date = format_date_for_bmap(profile.date) if profile.date else None
+    if bmap_date is None:
+        return None
+    if bmap_date.startswith("00"):
+        # Surveys known only to the month are dated "00MMMYYYY"
+        bmap_date = "01" + bmap_date[2:]
+    try:
+        return datetime.strptime(bmap_date, "%d%b%Y")
+    except ValueError:
+        return None
+
+
+def group_surveys_by_line(
+    profiles: Sequence[Profile],
+) -> Dict[str, List[Profile]]:
+    """
+    Group profiles by line name and order each line by survey date.
+
+    Profiles without a parseable date, and repeated surveys of a line on
+    the same date, are skipped with a warning.
+
+    Args:
+        profiles: Profiles of any number of lines and surveys
+
+    Returns:
+        Dict mapping line name to its surveys in date order (lines keep
+        their first-appearance order)
+    """
+    logger = get_logger(LogComponent.DATA_PROCESSING)
+    surveys: Dict[str, Dict[datetime, Profile]] = {}
+    for p in profiles:
+        date = survey_date(p)
+        if date is None:
+            logger.warning(
+                f"Skipping {p.name} {p.date or ''}: no usable survey date"
+            )
+            continue
+        line = surveys.setdefault(p.name, {})
+        if date in line:
+            logger.warning(
+                f"Skipping repeated {p.name} survey on {p.date}; "
+                "using the first one"
+            )
+            continue
+        line[date] = p
+    return {
+        name: [line[d] for d in sorted(line)] for name, line in surveys.items()
+    }
+
+
+def check_comparisons(
+    comparisons: Sequence[str], baseline_date: Optional[str] = None
+) -> Optional[datetime]:
+    """
+    Validate comparison names and parse the baseline date.
+
+    Args:
+        comparisons: Any of ``COMPARISONS``
+        baseline_date: Baseline survey date in any format accepted by
+            ``format_date_for_bmap``, or None for each line's first survey
+
+    Returns:
+        The baseline date, or None
+
+    Raises:
+        ValueError: If a comparison is unknown or the date cannot be parsed
+    """
+    unknown = set(comparisons) - set(COMPARISONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown comparison(s) {sorted(unknown)}; "
+            f"expected {', '.join(COMPARISONS)}"
+        )
+    if baseline_date is None:
+        return None
+    bmap_date = format_date_for_bmap(baseline_date)
+    if bmap_date is None:
+        raise ValueError(f"Unable to parse baseline date {baseline_date!r}")
+    return datetime.strptime(bmap_date, "%d%b%Y")
+
+
+def comparison_pairs(
+    dates: List[datetime],
+    comparisons: Sequence[str],
+    baseline: Optional[datetime] = None,
+) -> Tuple[List[Tuple[int, int]], List[str]]:
+    """
+    List the survey pairs of one line to compare.
+
+    Args:
+        dates: Survey dates of the line, in order
+        comparisons: Any of ``COMPARISONS``
+        baseline: Baseline survey date (default: the first survey)
+
+    Returns:
+        Tuple of (pairs, labels): ``(earlier, later)`` survey indices and
+        the comparison each pair belongs to
+    """
+    pairs: List[Tuple[int, int]] = []
+    labels: List[str] = []
+    if "consecutive" in comparisons:
+        pairs += [(i - 1, i) for i in range(1, len(dates))]
+        labels += ["consecutive"] * (len(dates) - 1)
+    if "baseline" in comparisons:
+        if baseline is None:
+            base = 0
+        elif baseline in dates:
+            base = dates.index(baseline)
+        else:
+            return pairs, labels
+        others = [i for i in range(len(dates)) if i != base]
+        pairs += [(base, i) for i in others]
+        labels += ["baseline"] * len(others)
+    return pairs, labels
+
+
+def _line_changes(
+    surveys: List[Profile],
+    pairs: np.ndarray,
+    dx: float,
+    shoreline_elevation: float,
+) -> Dict[str, np.ndarray]:
+    """Change values for pairs ``(earlier, later)`` of one line's surveys."""
+    sorted_surveys = []
+    for p in surveys:
+        x = np.asarray(p.x, dtype=float)
+        order = np.argsort(x, kind="stable")
+        sorted_surveys.append((x[order], np.asarray(p.z, dtype=float)[order]))
+    x_min = np.array([x[0] for x, _ in sorted_surveys])
+    x_max = np.array([x[-1] for x, _ in sorted_surveys])
+    # Seaward-most shoreline crossing of every survey in one pass
+    offsets = np.cumsum([0] + [len(x) for x, _ in sorted_surveys])
+    shoreline = find_contour_crossings(
+        np.concatenate([x for x, _ in sorted_surveys]),
+        np.concatenate([z for _, z in sorted_surveys]),
+        offsets,
+        shoreline_elevation,
+    )["last"][:, 0]
+
+    # One grid for the line; survey ends are grid nodes, so every pair's
+    # common range starts and ends on a node
+    grid = np.arange(x_min.min(), x_max.max() + dx, dx)
+    grid = np.unique(np.concatenate([grid[grid <= x_max.max()], x_min, x_max]))
+
+    # Resample each survey once, then accumulate its datum areas
+    zg = np.array([np.interp(grid, x, z) for x, z in sorted_surveys])
+    x0, x1 = grid[:-1], grid[1:]
+    z0, z1 = zg[:, :-1], zg[:, 1:]
+    above = positive_part_areas(x0, x1, z0, z1)
+    below = -positive_part_areas(x0, x1, -z0, -z1)
+    zero = np.zeros((len(surveys), 1))
+    cum_above = np.concatenate([zero, np.cumsum(above, axis=1)], axis=1)
+    cum_below = np.concatenate([zero, np.cumsum(below, axis=1)], axis=1)
+
+    earlier, later = pairs[:, 0], pairs[:, 1]
+    x_on = np.maximum(x_min[earlier], x_min[later])
+    x_off = np.minimum(x_max[earlier], x_max[later])
+    overlap = x_on < x_off
+    i_on = np.searchsorted(grid, x_on)
+    i_off = np.searchsorted(grid, x_off)
+
+    def window_change(cum: np.ndarray) -> np.ndarray:
+        later_area = cum[later, i_off] - cum[later, i_on]
+        earlier_area = cum[earlier, i_off] - cum[earlier, i_on]
+        return np.where(overlap, (later_area - earlier_area) / 27.0, np.nan)
+
+    above_change = window_change(cum_above)
+    below_change = window_change(cum_below)
+    return {
+        "x_on": np.where(overlap, x_on, np.nan),
+        "x_off": np.where(overlap, x_off, np.nan),
+        "volume_change_cuyd_per_ft": above_change + below_change,
+        "above_datum_cuyd_per_ft": above_change,
+        "below_datum_cuyd_per_ft": below_change,
+        "shoreline_from_x": shoreline[earlier],
+        "shoreline_to_x": shoreline[later],
+        "shoreline_change_ft": shoreline[later] - shoreline[earlier],
+    }
+
+
+def compute_change_matrix(
+    profiles: Sequence[Profile],
+    dx: float = 10.0,
+    comparisons: Sequence[str] = COMPARISONS,
+    baseline_date: Optional[str] = None,
+    shoreline_elevation: float = 0.0,
+) -> pd.DataFrame:
+    """
+    Compute survey-to-survey changes for every line.
+
+    Args:
+        profiles: Profiles of all lines and surveys
+        dx: Resampling grid spacing in ft
+        comparisons: Any of ``COMPARISONS``
+        baseline_date: Survey date of the baseline (any format accepted by
+            ``format_date_for_bmap``); defaults to each line's first
+            survey. Lines without a survey on that date get no baseline
+            rows.
+        shoreline_elevation: Elevation of the shoreline contour in ft
+
+    Returns:
+        Long-format DataFrame with one row per line, comparison and survey
+        pair: line, comparison, from_date and to_date (ISO dates), x_on and
+        x_off of the common range, volume_change_cuyd_per_ft and its
+        above_datum/below_datum split, shoreline_from_x, shoreline_to_x
+        and shoreline_change_ft. Pairs that do not overlap have NaN
+        volumes. Use ``pivot_change_matrix`` for a lines x pairs table.
+
+    Raises:
+        ValueError: If ``dx`` is not positive, a comparison is unknown or
+            ``baseline_date`` cannot be parsed
+    """
+    if not dx > 0:
+        raise ValueError("dx must be positive")
+    baseline = check_comparisons(comparisons, baseline_date)
+
+    blocks = []
+    for line, surveys in group_surveys_by_line(profiles).items():
+        # Grouped surveys all have a date; the filter only narrows the type
+        dates = [d for p in surveys if (d := survey_date(p)) is not None]
+        pairs, labels = comparison_pairs(dates, comparisons, baseline)
+        if not pairs:
+            continue
+
+        pair_index = np.array(pairs, dtype=np.int64)
+        block: Dict[str, Any] = _line_changes(
+            surveys, pair_index, dx, shoreline_elevation
+        )
+        iso = [d.strftime("%Y-%m-%d") for d in dates]
+        block["line"] = [line] * len(pairs)
+        block["comparison"] = labels
+        block["from_date"] = [iso[i] for i in pair_index[:, 0]]
+        block["to_date"] = [iso[i] for i in pair_index[:, 1]]
+        blocks.append(pd.DataFrame(block, columns=_CHANGE_COLUMNS))
+
+    if not blocks:
+        return pd.DataFrame(columns=_CHANGE_COLUMNS)
+    return pd.concat(blocks, ignore_index=True)
+
+
+def pivot_change_matrix(
+    changes: pd.DataFrame,
+    value: str = "volume_change_cuyd_per_ft",
+    comparison: str = "consecutive",
+) -> pd.DataFrame:
+    """
+    Reshape ``compute_change_matrix`` output into a lines x pairs table.
+
+    Args:
+        changes: Output of ``compute_change_matrix``
+        value: Column to tabulate
+        comparison: Which comparison's rows to use
+
+    Returns:
+        DataFrame indexed by line with (from_date, to_date) columns in
+        date order
+    """
+    rows = changes[changes["comparison"] == comparison]
+    return rows.pivot(
+        index="line", columns=["from_date", "to_date"], values=value
+    ).sort_index(axis=1)
+
+
+# ---------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------
+
+
+def execute_from_cli(args: list[str]) -> None:
+    """Compute the change matrix of a BMAP file and write it as CSV."""
+    ap = argparse.ArgumentParser(
+        description="Survey-to-survey change matrix for every line."
+    )
+    ap.add_argument("input", help="BMAP Free Format file with all surveys")
+    ap.add_argument("--output", required=True, help="Output CSV path")
+    ap.add_argument(
+        "--dx", type=float, default=10.0, help="Grid spacing in ft"
+    )
+    ap.add_argument(
+        "--comparison",
+        choices=COMPARISONS + ("both",),
+        default="both",
+        help="Survey pairs to compare (default: both)",
+    )
+    ap.add_argument(
+        "--baseline-date",
+        default=None,
+        help="Baseline survey date (default: each line's first survey)",
+    )
+    ap.add_argument(
+        "--shoreline-elevation",
+        type=float,
+        default=0.0,
+        help="Shoreline contour elevation in ft (default: 0.0)",
+    )
+    parsed = ap.parse_args(args)
+
+    comparisons = (
+        COMPARISONS if parsed.comparison == "both" else (parsed.comparison,)
+    )
+    changes = compute_change_matrix(
+        read_bmap_freeformat(parsed.input),
+        dx=parsed.dx,
+        comparisons=comparisons,
+        baseline_date=parsed.baseline_date,
+        shoreline_elevation=parsed.shoreline_elevation,
+    )
+    changes.to_csv(parsed.output, index=False, float_format="%.3f")
+    logger = get_logger(LogComponent.CLI)
+    logger.info(
+        f"Wrote {len(changes)} survey changes for "
+        f"{changes['line'].nunique()} lines to: {parsed.output}"
+    )
+
+
+def execute_from_menu() -> None:
+    """Interactive menu wrapper for the survey change matrix."""
+    print("\n" + "=" * 60)
+    print("SURVEY VS. SURVEY CHANGE MATRIX")
+    print("=" * 60)
+
+    input_file = input("Enter BMAP file path (all surveys): ").strip()
+    output_file = input("Enter output CSV path: ").strip()
+    mode = (
+        input("Comparison (consecutive/baseline/both) [both]: ")
+        .strip()
+        .lower()
+    )
+    dx_input = input("Grid spacing dx (feet) [10.0]: ").strip()
+
+    args = [input_file, "--output", output_file]
+    if mode:
+        args.extend(["--comparison", mode])
+    if dx_input:
+        args.extend(["--dx", dx_input])
+    try:
+        execute_from_cli(args)
+        print(f"\n✅ Change matrix written to: {output_file}")
+    except (Exception, SystemExit) as e:
+        print(f"\n❌ Error: {e}")
+
+    input("\nPress Enter to continue...")
+
+
+if __name__ == "__main__":
+    execute_from_cli(sys.argv[1:])
@@ -0,0 +1,130 @@
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+
+from profcalc.common.bmap_index import BMAPProfileIndex, load_bmap_index
+from profcalc.common.bmap_io import (
+    iter_bmap_profiles,
+    read_bmap_freeformat,
+    write_bmap_block,
+    write_bmap_profiles,
+)
+from profcalc.common.file_parser import parse_bmap_columns, parse_file
+
+BMAP_TEXT = """OC100 2021_09_28 Annual
+3
+0.0 5.0
+10.0 3.0
+20.0 -1.0
+OC101 2021_09_28 Annual
+4
+0.0 6.0
+15.0 2.0
+OC102 2021_09_28 Annual
+2
+0.0 4.0
+30.0 -2.0
+"""
+
+
+def _write(tmp_path: Path) -> Path:
+    p = tmp_path / "survey.txt"
+    p.write_text(BMAP_TEXT)
+    return p
+
+
+def test_columns_offsets_and_counts():
+    columns = parse_bmap_columns(BMAP_TEXT.splitlines())
+
+    # OC101 declares 4 points; its window swallows the OC102 header and
+    # count lines, so OC102 is not recognised (legacy behavior)
+    assert len(columns) == 2
+    assert columns.declared_counts.tolist() == [3, 4]
+    assert columns.actual_counts.tolist() == [3, 2]
+    x, y = columns.profile_arrays(0)
+    assert x.tolist() == [0.0, 10.0, 20.0]
+    assert y.tolist() == [5.0, 3.0, -1.0]
+
+
+def test_read_bmap_freeformat_matches_dict_parser(tmp_path: Path):
+    path = _write(tmp_path)
+    profiles = read_bmap_freeformat(str(path))
+    legacy = parse_file(path, skip_confirmation=True)
+
+    with_coords = [p for p in legacy.profiles if p["coordinates"]]
+    assert [p.name for p in profiles] == [p["profile_id"] for p in with_coords]
+    for prof, ref in zip(profiles, with_coords):
+        np.testing.assert_array_equal(
+            prof.x, [c["x"] for c in ref["coordinates"]]
+        )
+        np.testing.assert_array_equal(
+            prof.z, [c["y"] for c in ref["coordinates"]]
+        )
+
+
+def test_iter_bmap_profiles_streams_same_profiles(tmp_path: Path):
+    path = _write(tmp_path)
+    expected = read_bmap_freeformat(str(path))
+
+    streamed = iter_bmap_profiles(StringIO(BMAP_TEXT))
+    first = next(streamed)
+    assert first.name == expected[0].name
+
+    rest = list(streamed)
+    assert len(rest) == len(expected) - 1
+    for prof, ref in zip([first] + rest, expected):
+        assert (prof.name, prof.date, prof.description) == (
+            ref.name,
+            ref.date,
+            ref.description,
+        )
+        np.testing.assert_array_equal(prof.x, ref.x)
+        np.testing.assert_array_equal(prof.z, ref.z)
+
+
+def test_profile_index_reads_single_profiles(tmp_path):
+    path = _write(tmp_path)
+    index = load_bmap_index(path)
+    assert index.sidecar_path.exists()
+
+    expected = read_bmap_freeformat(str(path))
+    assert [e.name for e in index] == [p.name for p in expected]
+    p = index.read_profile(index.entries[1])
+    assert p.description == expected[1].description
+    assert np.array_equal(p.x, expected[1].x)
+    assert np.array_equal(p.z, expected[1].z)
+
+    # Sidecar is reused while the file is unchanged, rebuilt after an edit
+    assert BMAPProfileIndex.from_sidecar(path) is not None
+    path.write_text(BMAP_TEXT.replace("OC100", "OC1000", 1))
+    assert BMAPProfileIndex.from_sidecar(path) is None
+    assert load_bmap_index(path).entries[0].name == "OC1000"
+
+
+def test_write_bmap_block_matches_per_point_formatting():
+    x = np.array([0.0, -0.0001, 1234.5675, np.nan, 2.5e20])
+    z = np.array([1.0005, -0.0, np.inf, 3.0, -7.25])
+    expected = "P1 2021_09_28\n5\n" + "".join(
+        f"{a:.3f} {b:.3f}\n" for a, b in zip(x, z)
+    )
+
+    out = StringIO()
+    write_bmap_block(out, "P1 2021_09_28", x, z)
+    assert out.getvalue() == expected
+
+    out = StringIO()
+    write_bmap_block(out, "P1", [1, 2.5], [-0.0, 3], pair_format="%s %s\n")
+    assert out.getvalue() == "P1\n2\n1 -0.0\n2.5 3\n"
+
+
+def test_write_bmap_profiles_round_trip(tmp_path: Path):
+    profiles = read_bmap_freeformat(str(_write(tmp_path)))
+    out = tmp_path / "out.dat"
+    write_bmap_profiles(profiles, out)
+
+    again = read_bmap_freeformat(str(out))
+    assert [p.name for p in again] == [p.name for p in profiles]
+    for a, b in zip(profiles, again):
+        np.testing.assert_array_equal(a.x, b.x)
+        np.testing.assert_array_equal(a.z, b.z)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from profcalc.common.contour_crossings import (
+    crossing_x,
+    find_contour_crossings,
+)
+
+
+def _profile_set():
+    # Profile 0 crosses z=0 three times; profile 1 touches z=0 at a point
+    x = np.array([0.0, 10.0, 20.0, 30.0, 40.0, 0.0, 10.0, 20.0])
+    z = np.array([2.0, -2.0, 2.0, 1.0, -1.0, 1.0, 0.0, 1.0])
+    return x, z, np.array([0, 5, 8])
+
+
+def test_first_last_and_seaward_crossings():
+    x, z, offsets = _profile_set()
+    found = find_contour_crossings(x, z, offsets, [0.0, 5.0])
+    assert list(found["x"][found["profile"] == 0]) == [5.0, 15.0, 35.0]
+    np.testing.assert_array_equal(found["first"][:, 0], [5.0, 10.0])
+    np.testing.assert_array_equal(found["last"][:, 0], [35.0, 10.0])
+    np.testing.assert_array_equal(found["seaward"][:, 0], [35.0, 10.0])
+    # Nothing reaches z=5
+    assert np.isnan(found["first"][:, 1]).all()
+
+
+def test_per_profile_contours():
+    x, z, offsets = _profile_set()
+    found = find_contour_crossings(x, z, offsets, np.array([[1.0], [np.nan]]))
+    assert found["first"][0, 0] == pytest.approx(2.5)
+    assert found["last"][0, 0] == 30.0
+    assert np.isnan(found["first"][1, 0])
+    with pytest.raises(ValueError):
+        find_contour_crossings(x, z, offsets, np.zeros((3, 1)))
+
+
+def test_crossing_x_follows_stored_order():
+    x = np.array([40.0, 30.0, 20.0, 10.0, 0.0])
+    z = np.array([-1.0, 1.0, 2.0, -2.0, 2.0])
+    assert crossing_x(x, z, 0.0, "first") == 35.0
+    assert crossing_x(x, z, 0.0, "last") == 5.0
+    assert crossing_x(x, z, 0.0, "seaward") == 35.0
+    assert crossing_x(x, z, 9.0) is None
+    with pytest.raises(ValueError):
+        crossing_x(x, z, 0.0, "landward")
@@ -0,0 +1,41 @@
+import numpy as np
+
+from profcalc.common.coordinate_transforms import (
+    batch_convert_2d_to_3d,
+    batch_convert_3d_to_2d,
+    calculate_point_profile_offset,
+)
+
+
+def test_batch_transforms_round_trip_against_many_baselines():
+    rng = np.random.default_rng(5)
+    origin_x = rng.uniform(6.0e5, 6.2e5, 20)
+    origin_y = rng.uniform(4.6e5, 4.8e5, 20)
+    azimuth = rng.uniform(0.0, 360.0, 20)
+    index = rng.integers(0, 20, 1000)
+    x = origin_x[index] + rng.normal(0.0, 500.0, 1000)
+    y = origin_y[index] + rng.normal(0.0, 500.0, 1000)
+
+    cross, along = batch_convert_3d_to_2d(
+        x, y, origin_x, origin_y, azimuth, profile_index=index
+    )
+
+    # Cross-shore values match the scalar function exactly
+    expected = [
+        calculate_point_profile_offset(
+            origin_x[i], origin_y[i], azimuth[i], px, py
+        )
+        for i, px, py in zip(index, x, y)
+    ]
+    np.testing.assert_array_equal(cross, expected)
+
+    x_back, y_back = batch_convert_2d_to_3d(
+        cross,
+        origin_x,
+        origin_y,
+        azimuth,
+        profile_index=index,
+        along_shore_distances=along,
+    )
+    np.testing.assert_allclose(x_back, x, rtol=0, atol=1e-6)
+    np.testing.assert_allclose(y_back, y, rtol=0, atol=1e-6)
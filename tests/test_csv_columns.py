@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from profcalc.common.file_parser import parse_csv
+from profcalc.common.format_detection import FormatDetectionResult
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "input_files"
+
+
+def _parse_both(lines, delimiter=","):
+    detection = FormatDetectionResult("csv", 1.0, {"delimiter": delimiter}, [])
+    legacy = parse_csv(lines, Path("survey.csv"), detection)
+    columnar = parse_csv(lines, Path("survey.csv"), detection, columnar=True)
+    return legacy, columnar
+
+
+def _assert_same_profiles(legacy, columnar):
+    columns = columnar.columns
+    assert columns is not None
+    assert [p["profile_id"] for p in legacy.profiles] == columns.profile_ids
+    for i, profile in enumerate(legacy.profiles):
+        assert profile["date"] == columns.dates[i]
+        coords = profile["coordinates"]
+        expected = np.array(
+            [[c["x"], c["y"], c.get("z", c["y"])] for c in coords], float
+        ).reshape(-1, 3)
+        actual = np.column_stack(columns.profile_arrays(i))
+        # Bit-identical, including signed zeros
+        assert expected.tobytes() == actual.tobytes()
+
+
+@pytest.mark.parametrize(
+    "name", ["4Col_WithHeader.csv", "3Col_NoHeader__NoID.csv"]
+)
+def test_columnar_matches_row_parser_on_sample_files(name):
+    lines = (DATA_DIR / name).read_text().splitlines()
+    _assert_same_profiles(*_parse_both(lines))
+
+
+def test_columnar_matches_row_parser_on_edge_cases():
+    lines = [
+        "PROFILE,DATE,X,Y,Z",
+        "A,,1.5,2,3",
+        " A ,2020-01-02,-0,bad,1e2",  # Y invalid: row has no point
+        "B,2020-02-01,0x10,1,2",  # nothing parses: B has no points
+        "A,2020-01-03,7,8,-0",
+        "C,2021-01-01,nan,1,2",
+    ]
+    legacy, columnar = _parse_both(lines)
+    _assert_same_profiles(legacy, columnar)
+    assert columnar.columns.profile_ids == ["A", "B", "C"]
+    assert columnar.columns.dates == ["2020-01-03", None, "2021-01-01"]
+
+
+def test_ragged_rows_fall_back_to_row_parser():
+    lines = ["1,2,3", "4,5,6,7", "8,9,10"]
+    legacy, columnar = _parse_both(lines)
+    assert columnar.columns is None
+    assert columnar.profiles == legacy.profiles
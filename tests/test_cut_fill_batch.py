@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from profcalc.common.bmap_io import Profile
+from profcalc.tools.bmap.bmap_cut_fill import (
+    compute_cut_fill,
+    compute_cut_fill_batch,
+    pair_profiles_by_name,
+    split_trap_area,
+    split_trap_areas,
+)
+
+
+def _profile(name, date, x, z):
+    return Profile(
+        name=name,
+        date=date,
+        description=None,
+        x=np.asarray(x, dtype=float),
+        z=np.asarray(z, dtype=float),
+    )
+
+
+def test_split_trap_areas_matches_scalar():
+    za = np.array([1.0, -1.0, 2.0, -2.0, 0.0, 0.0, 3.0])
+    zb = np.array([3.0, -3.0, -2.0, 2.0, 0.0, -1.0, 0.0])
+    above, below = split_trap_areas(0.0, 10.0, za, zb)
+    for i in range(len(za)):
+        assert (above[i], below[i]) == split_trap_area(0.0, 10.0, za[i], zb[i])
+
+
+def test_uniform_fill_volume_and_shoreline():
+    before = _profile("L1", "2021", [0.0, 100.0], [2.0, -2.0])
+    after = _profile("L1", "2022", [0.0, 100.0], [3.0, -1.0])
+    for ported in (False, True):
+        result = compute_cut_fill(
+            before, after, smoothing=0.0, use_ported_logic=ported
+        )
+        assert result["total_volume_cuyd_per_ft"] == pytest.approx(100 / 27)
+        assert result["shoreline_change"] == pytest.approx(25.0)
+        cells = result["cells"]
+        assert cells["cum_vol_cuyd_per_ft"][-1] == pytest.approx(100 / 27)
+        assert cells["end_x"][-1] == 100.0
+
+
+def test_batch_pairs_by_name_and_reports_non_overlap():
+    before = [
+        _profile("L1", "2021", [0.0, 50.0, 100.0], [2.0, 0.5, -2.0]),
+        _profile("L2", "2021", [0.0, 100.0], [1.0, -1.0]),
+        _profile("L3", "2021", [0.0, 100.0], [1.0, -1.0]),
+    ]
+    after = [
+        _profile("L2", "2022", [200.0, 300.0], [1.0, -1.0]),
+        _profile("L1", "2022", [0.0, 40.0, 100.0], [1.0, 1.5, -3.0]),
+    ]
+    pairs = pair_profiles_by_name(before, after)
+    assert [(a.name, b.name) for a, b in pairs] == [("L1", "L1"), ("L2", "L2")]
+
+    summary, cells = compute_cut_fill_batch(pairs, dx=5.0, include_cells=True)
+    expected = compute_cut_fill(*pairs[0], dx=5.0, smoothing=0.0)
+    row = summary.iloc[0]
+    assert row["profile1"] == "L1 2021"
+    for key in ("above_datum_cuyd_per_ft", "total_volume_cuyd_per_ft"):
+        assert row[key] == expected[key]
+    # L2 surveys do not overlap, so the pair is reported without results
+    assert np.isnan(summary.iloc[1]["total_volume_cuyd_per_ft"])
+
+    first = cells[cells["pair"] == 0]
+    assert list(first["cell"]) == list(range(1, len(first) + 1))
+    assert np.array_equal(
+        first["cell_vol_cuyd_per_ft"],
+        expected["cells"]["cell_vol_cuyd_per_ft"],
+    )
+    assert (cells["pair"] == 1).sum() == 0
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profcalc.common.bmap_io import Profile
+from profcalc.common.profile_integration import area_above, band_area
+from profcalc.tools.monitoring.elevation_bands import compute_band_tables
+
+
+def _random_surveys(seed=3):
+    rng = np.random.default_rng(seed)
+    profiles = []
+    for line in ("L1", "L2", "L3"):
+        for year in (2021, 2022, 2023):
+            n = int(rng.integers(2, 30))
+            x = rng.uniform(-20.0, 400.0, n)
+            z = rng.normal(0.0, 4.0, n)
+            profiles.append(
+                Profile(
+                    name=line,
+                    date=f"{year}-09-01",
+                    description=None,
+                    x=x,
+                    z=z,
+                )
+            )
+    return profiles
+
+
+def test_band_areas_and_changes_match_per_profile_integrals():
+    profiles = _random_surveys()
+    breakpoints = {
+        "crest": float("inf"),
+        "MHW": pd.Series({"L1": 1.9, "L2": 1.5, "L3": 2.5}),
+        "MLW": pd.Series({"L1": -2.6, "L2": -2.8}),
+        "closure": -8.0,
+    }
+    areas, changes = compute_band_tables(
+        profiles, breakpoints, comparisons=("consecutive",)
+    )
+    assert list(areas["band"][:3]) == [
+        "crest to MHW",
+        "MHW to MLW",
+        "MLW to closure",
+    ]
+
+    for i, p in enumerate(profiles):
+        rows = areas.iloc[3 * i : 3 * i + 3]
+        mhw = breakpoints["MHW"][p.name]
+        assert rows["area_ft2_per_ft"].iloc[0] == pytest.approx(
+            area_above(p.x, p.z, mhw)
+        )
+        if p.name == "L3":
+            # No MLW for L3: the bands touching it are undefined
+            assert rows["area_ft2_per_ft"].iloc[1:].isna().all()
+            continue
+        mlw = breakpoints["MLW"][p.name]
+        assert rows["area_ft2_per_ft"].iloc[1] == pytest.approx(
+            band_area(p.x, p.z, mlw, mhw)
+        )
+
+    # 2021 -> 2022 change of L1 within MHW to MLW
+    before, after = profiles[0], profiles[1]
+    row = changes[
+        (changes["line"] == "L1")
+        & (changes["to_date"] == "2022-09-01")
+        & (changes["band"] == "MHW to MLW")
+    ].iloc[0]
+    x_on = max(before.x.min(), after.x.min())
+    x_off = min(before.x.max(), after.x.max())
+    expected = band_area(after.x, after.z, -2.6, 1.9, x_on, x_off) - band_area(
+        before.x, before.z, -2.6, 1.9, x_on, x_off
+    )
+    assert (row["x_on"], row["x_off"]) == (x_on, x_off)
+    assert row["volume_change_cuyd_per_ft"] == pytest.approx(expected / 27)
+
+
+def test_needs_two_breakpoints():
+    with pytest.raises(ValueError):
+        compute_band_tables(_random_surveys(), {"MHW": 1.9})
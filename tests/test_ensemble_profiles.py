@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profcalc.common.bmap_io import Profile, write_bmap_profiles
+from profcalc.tools.bmap.bmap_average import (
+    MAX_HISTOGRAM_BINS,
+    EnsembleAccumulator,
+    compute_average_profiles,
+    compute_ensemble_batch,
+    compute_ensemble_profiles,
+)
+
+
+def _surveys(seed=5, count=25):
+    rng = np.random.default_rng(seed)
+    return [
+        pd.DataFrame(
+            {
+                "X": np.sort(rng.uniform(0.0, 500.0, 40)),
+                "Z": rng.normal(0.0, 3.0, 40),
+            }
+        )
+        for _ in range(count)
+    ]
+
+
+def test_ensemble_matches_stacked_statistics():
+    surveys = _surveys()
+    result = compute_ensemble_profiles(surveys, dx=5.0)
+    grid = result["average"]["X"].to_numpy()
+    stack = np.array([np.interp(grid, s["X"], s["Z"]) for s in surveys])
+
+    np.testing.assert_allclose(result["average"]["Z"], stack.mean(axis=0))
+    np.testing.assert_allclose(result["std_dev"]["Z"], stack.std(axis=0))
+    np.testing.assert_array_equal(
+        result["min_envelope"]["Z"], stack.min(axis=0)
+    )
+    np.testing.assert_array_equal(
+        result["max_envelope"]["Z"], stack.max(axis=0)
+    )
+    assert (result["count"]["Z"] == len(surveys)).all()
+    for q in (10, 50, 90):
+        expected = np.percentile(stack, q, axis=0, method="inverted_cdf")
+        assert np.abs(result[f"p{q}"]["Z"] - expected).max() <= 0.1
+
+
+def test_two_surveys_reproduce_average_tool():
+    first, second = _surveys(count=2)
+    pair = compute_average_profiles(first, second)
+    ensemble = compute_ensemble_profiles([first, second])
+    # The ensemble grid ends on the overlap instead of one dx past it
+    for name in ("average", "min_envelope", "max_envelope", "std_dev"):
+        np.testing.assert_allclose(
+            ensemble[name]["Z"][:-1], pair[name]["Z"][:-1], atol=1e-12
+        )
+
+
+def test_accumulator_skips_missing_nodes():
+    acc = EnsembleAccumulator(2, z_min=-1.0, z_max=3.0)
+    for z in ([0.0, np.nan], [2.0, 1.0]):
+        acc.update(np.array(z))
+    np.testing.assert_array_equal(acc.count, [2, 1])
+    np.testing.assert_array_equal(acc.average(), [1.0, 1.0])
+    np.testing.assert_array_equal(acc.std(), [1.0, 0.0])
+    assert np.isnan(acc.std(ddof=1)[1])
+    assert acc.percentile(100)[0] == 2.0
+
+
+def test_batch_over_lines_with_union_extent():
+    surveys = _surveys(count=4)
+    profiles = [
+        Profile(
+            name=f"L{i % 2}",
+            date=None,
+            description=None,
+            x=s["X"].to_numpy() + 100.0 * i,
+            z=s["Z"].to_numpy(),
+        )
+        for i, s in enumerate(surveys)
+    ]
+    table = compute_ensemble_batch(profiles, dx=10.0, extent="union")
+    assert list(table["line"].unique()) == ["L0", "L1"]
+    line = table[table["line"] == "L0"]
+    assert line["X"].iloc[0] == pytest.approx(profiles[0].x.min())
+    assert line["X"].iloc[-1] == pytest.approx(profiles[2].x.max())
+    assert set(line["count"]) == {1, 2}
+
+
+def test_accumulator_caps_histogram_bins():
+    # A -999 fill value would need ~10k bins of 0.1 ft
+    acc = EnsembleAccumulator(3, z_min=-999.0, z_max=10.0)
+    assert acc.histogram.shape == (3, MAX_HISTOGRAM_BINS)
+    assert acc.bin_width == pytest.approx(1009.0 / MAX_HISTOGRAM_BINS)
+    for z in (-999.0, 2.0, 4.0, 10.0):
+        acc.update(np.full(3, z))
+    median = acc.percentile(50)
+    assert (np.abs(median - 3.0) <= acc.bin_width).all()
+    assert (acc.percentile(100) == 10.0).all()
+
+
+def test_batch_reads_lines_from_bmap_file(tmp_path):
+    surveys = _surveys(count=6)
+    profiles = [
+        Profile(
+            name=f"L{i % 3}",
+            date=f"2020010{i + 1}",
+            description=None,
+            x=np.round(s["X"].to_numpy(), 2),
+            z=np.round(s["Z"].to_numpy(), 2),
+        )
+        for i, s in enumerate(surveys)
+    ]
+    path = tmp_path / "project.txt"
+    write_bmap_profiles(profiles, path)
+
+    from_file = compute_ensemble_batch(path, dx=5.0, lines=["L2", "L0"])
+    in_memory = compute_ensemble_batch(profiles, dx=5.0, lines=["L2", "L0"])
+    assert list(from_file["line"].unique()) == ["L0", "L2"]
+    pd.testing.assert_frame_equal(from_file, in_memory)
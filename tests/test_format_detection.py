@@ -1 +1,44 @@
 # Placeholder for format detection test script. Original file moved from dev_scripts/.
+from profcalc.common import format_detection
+from profcalc.common.file_parser import parse_file
+from profcalc.common.format_detection import DetectedFile
+
+
+def _bmap_bytes(n_profiles: int) -> bytes:
+    blocks = [
+        f"OC{100 + i} 2021_09_28\n2\n0.0 1.0\n10.0 -1.0\n"
+        for i in range(n_profiles)
+    ]
+    return "".join(blocks).encode("ascii")
+
+
+def test_detection_reads_bounded_prefix(tmp_path, monkeypatch):
+    monkeypatch.setattr(format_detection, "DETECTION_SAMPLE_LINES", 8)
+    path = tmp_path / "survey.txt"
+    path.write_bytes(_bmap_bytes(10))
+
+    with DetectedFile(path) as detected:
+        assert detected.result.format_type == "bmap"
+        assert detected.result.details["sampled_lines"] == 8
+        assert detected.result.details["profiles_in_sample"] == 2
+        assert "profiles_detected" not in detected.result.details
+        assert len(detected.read_lines()) == 40
+
+    assert len(parse_file(path, skip_confirmation=True).profiles) == 10
+
+
+def test_encoding_fallback_after_sample(tmp_path, monkeypatch):
+    monkeypatch.setattr(format_detection, "DETECTION_SAMPLE_LINES", 4)
+    path = tmp_path / "survey.txt"
+    # Latin-1 byte well past the sampled prefix is not valid UTF-8
+    path.write_bytes(
+        _bmap_bytes(1000) + "OC999 caf\xe9\n1\n0.0 1.0\n".encode("latin-1")
+    )
+
+    with DetectedFile(path) as detected:
+        assert detected.encoding == "utf-8"
+        lines = detected.read_lines()
+        assert detected.encoding == "latin-1"
+
+    assert len(lines) == 4003
+    assert lines[-3] == "OC999 caf\xe9"
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from profcalc.cli.quick_tools.assign import assign_profiles_by_clustering
+from profcalc.common.coordinate_transforms import estimate_profile_baseline
+from profcalc.common.grid_clustering import grid_cluster_labels
+
+
+def _transects():
+    # Two east-west transects 500 ft apart plus one isolated point
+    t = np.arange(0.0, 400.0, 20.0)
+    x = np.concatenate([t, t, [5000.0]])
+    y = np.concatenate([np.full(20, 1000.0), np.full(20, 500.0), [0.0]])
+    z = np.concatenate([-t / 100.0, -t / 100.0, [0.0]])
+    return x, y, z
+
+
+def test_grid_clusters_follow_point_order_and_drop_noise():
+    x, y, _ = _transects()
+
+    labels = grid_cluster_labels(x, y, 50.0, min_samples=2)
+
+    assert labels.tolist() == [0] * 20 + [1] * 20 + [-1]
+
+
+def test_assign_grid_method_estimates_transect_direction():
+    x, y, z = _transects()
+    points = pd.DataFrame({"x": x, "y": y, "z": z})
+
+    profiles = assign_profiles_by_clustering(
+        points, method="grid", eps=50.0, min_samples=2
+    )
+
+    assert [p.name for p in profiles] == ["Profile_001", "Profile_002"]
+    for profile in profiles:
+        assert profile.x.tolist() == sorted(profile.x.tolist())
+        origin_x, origin_y, azimuth = estimate_profile_baseline(
+            profile.x, profile.metadata["y"]
+        )
+        assert profile.metadata["profile_origin"] == {
+            "x": origin_x,
+            "y": origin_y,
+        }
+        assert np.isclose(profile.metadata["profile_azimuth"], azimuth)
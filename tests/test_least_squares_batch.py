@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profcalc.tools.bmap.bmap_least_squares import (
+    compute_least_squares,
+    compute_least_squares_batch,
+)
+
+
+def _dean_profiles():
+    # Dean profiles with A = 0.1, 0.15 and 0.2 and shorelines at x0 = 0,
+    # 50 and 100 ft, plus a dry profile that cannot be fitted
+    rng = np.random.default_rng(7)
+    xs, zs = [], []
+    for A, x0 in ((0.1, 0.0), (0.15, 50.0), (0.2, 100.0)):
+        x = np.sort(rng.uniform(-50.0, 1200.0, 60))
+        xs.append(x)
+        zs.append(-A * np.maximum(x - x0, 0.0) ** (2.0 / 3.0) + 1.0 * (x < x0))
+    xs.append(np.array([0.0, 10.0, 20.0]))
+    zs.append(np.array([3.0, 2.0, 1.0]))
+    offsets = np.r_[0, np.cumsum([len(x) for x in xs])]
+    return np.concatenate(xs), np.concatenate(zs), offsets
+
+
+def test_linear_mode_matches_single_profile_fit():
+    x, z, offsets = _dean_profiles()
+    xon = np.array([0.0, 100.0, 200.0, 0.0])
+    table = compute_least_squares_batch(x, z, offsets, xon, 1000.0)
+    assert list(table["n_points"][:3] > 3) == [True] * 3
+    for i in range(3):
+        part = slice(offsets[i], offsets[i + 1])
+        fitted, _ = compute_least_squares(
+            pd.DataFrame({"X": x[part], "Z": z[part]}), xon[i], 1000.0
+        )
+        for key in ("A_ft13", "R2", "d50_mm"):
+            assert table[key][i] == pytest.approx(
+                fitted.attrs["parameters"][key], rel=1e-12
+            )
+    assert table.iloc[3][["A_ft13", "R2", "d50_mm"]].isna().all()
+
+
+def test_shoreline_offset_mode_recovers_offset():
+    x, z, offsets = _dean_profiles()
+    table = compute_least_squares_batch(
+        x, z, offsets, 0.0, 1200.0, mode="shoreline_offset", max_workers=2
+    )
+    np.testing.assert_allclose(table["A_ft13"][:3], [0.1, 0.15, 0.2])
+    np.testing.assert_allclose(
+        table["x0_ft"][:3], [0.0, 50.0, 100.0], atol=1e-3
+    )
+    assert np.isnan(table["x0_ft"][3])
+
+
+def test_rejects_bad_ranges_and_modes():
+    x, z, offsets = _dean_profiles()
+    with pytest.raises(ValueError):
+        compute_least_squares_batch(x, z, offsets, 500.0, 100.0)
+    with pytest.raises(ValueError):
+        compute_least_squares_batch(x, z, offsets, 0.0, 100.0, mode="cubic")
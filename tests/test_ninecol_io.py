@@ -0,0 +1,61 @@
+import numpy as np
+
+from profcalc.common.bmap_io import Profile
+from profcalc.common.ninecol_io import read_9col_profiles, write_9col_profiles
+
+NINECOL_TEXT = """Project: Monitoring
+PROFILE ID,DATE,TIME (EST),POINT #,EASTING (X),NORTHING (Y),ELEVATION (Z),TYPE,DESCRIPTION
+10,20210928,10:00,2,101.5,200.5,-1.25,SH,wet
+9,20210928,10:00,1,50.0,60.0,3.5,,
+10,20210928,10:00,1,100.0,200.0,2.0,SH,
+"""
+
+
+def test_read_9col_seeks_header_and_orders_profiles(tmp_path):
+    path = tmp_path / "survey.csv"
+    path.write_text(NINECOL_TEXT)
+
+    profiles = read_9col_profiles(path)
+
+    # Numeric IDs keep numeric order; points are sorted by point number
+    assert [p.name for p in profiles] == ["9", "10"]
+    assert profiles[1].date == "2021-09-28"
+    np.testing.assert_array_equal(profiles[1].x, [100.0, 101.5])
+    np.testing.assert_array_equal(profiles[1].z, [2.0, -1.25])
+    assert profiles[1].metadata["point_types"] == ["SH", "SH"]
+    assert profiles[1].metadata["point_descriptions"] == ["", "wet"]
+
+
+def test_write_9col_matches_per_point_formatting(tmp_path):
+    profiles = [
+        Profile(
+            "P%1",
+            None,
+            None,
+            np.array([1.0, 2.00049, -0.0001]),
+            np.array([3, 4, 5]),
+            {"point_types": ["A"], "y_coordinates": np.array([7.0, 8.0])},
+        ),
+        Profile("P2", "20200101", None, np.array([0.5]), np.array([0.25])),
+    ]
+    path = tmp_path / "out.txt"
+
+    write_9col_profiles(profiles, path)
+
+    lines = path.read_text().splitlines()
+    assert lines[1:] == [
+        "P%1\t19000101\t1\t1.000\t0.000\t3.000\tA\t",
+        "P%1\t19000101\t2\t2.000\t0.000\t4.000\t\t",
+        "P%1\t19000101\t3\t-0.000\t0.000\t5.000\t\t",
+        "P2\t20200101\t4\t0.500\t0.000\t0.250\t\t",
+    ]
+
+
+def test_read_9col_strips_zero_padding_from_integer_ids(tmp_path):
+    path = tmp_path / "survey.csv"
+    path.write_text(
+        NINECOL_TEXT.replace("\n10,", "\n0118,").replace("\n9,", "\n09,")
+    )
+
+    # Same names as reading the ID column as numbers
+    assert [p.name for p in read_9col_profiles(path)] == ["9", "118"]
@@ -0,0 +1,65 @@
+import numpy as np
+
+from profcalc.common import bmap_io, parse_cache
+from profcalc.common.bmap_io import read_bmap_freeformat
+
+BMAP_TEXT = """OC100 2021_09_28 Annual
+3
+0.0 5.0
+10.0 3.0
+20.0 -1.0
+OC101 2021_09_28 Annual
+2
+0.0 6.0
+15.0 2.0
+"""
+
+
+def _sample_profiles(tmp_path):
+    path = tmp_path / "survey.txt"
+    path.write_text(BMAP_TEXT)
+    return read_bmap_freeformat(str(path))
+
+
+def test_cache_hit_and_invalidation(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("PROFCALC_PARSE_CACHE", "1")
+    monkeypatch.setenv("PROFCALC_CACHE_DIR", str(cache_dir))
+
+    calls = []
+    uncached = bmap_io._read_bmap_freeformat_uncached
+    monkeypatch.setattr(
+        bmap_io,
+        "_read_bmap_freeformat_uncached",
+        lambda path: calls.append(path) or uncached(path),
+    )
+
+    path = tmp_path / "survey.txt"
+    path.write_text(BMAP_TEXT)
+    first = read_bmap_freeformat(str(path))
+    second = read_bmap_freeformat(str(path))
+    assert len(calls) == 1
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+    assert [(p.name, p.date, p.description) for p in second] == [
+        (p.name, p.date, p.description) for p in first
+    ]
+    assert all(np.array_equal(p.z, q.z) for p, q in zip(first, second))
+
+    # Changing the file changes the key, so it is parsed again
+    path.write_text(BMAP_TEXT.replace("6.0", "7.5"))
+    assert read_bmap_freeformat(str(path))[1].z[0] == 7.5
+    assert len(calls) == 2
+
+
+def test_lru_eviction(tmp_path):
+    profiles = _sample_profiles(tmp_path)
+    cache = parse_cache.ParseCache(tmp_path / "cache", max_bytes=10**6)
+    cache.store("a", profiles)
+    cache.store("b", profiles)
+    size = (cache.directory / "a.npz").stat().st_size
+
+    # Refresh "a" so "b" becomes least recently used
+    assert cache.load("a") is not None
+    cache.max_bytes = size
+    cache.evict()
+    assert [p.name for p in cache.directory.glob("*.npz")] == ["a.npz"]
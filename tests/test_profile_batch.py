@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from profcalc.common.bmap_io import Profile
+from profcalc.common.profile_batch import (
+    per_profile_values,
+    segment_arange,
+    segment_argsort,
+    segment_interp,
+    segment_trapz,
+)
+from profcalc.tools.bmap.bmap_vol_above_contour import (
+    compute_volume_above_contour,
+    compute_volume_above_contour_batch,
+    compute_volumes_above_contours,
+)
+
+
+def _random_profiles(seed=0, n_profiles=40):
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(1, 30, n_profiles)
+    offsets = np.zeros(n_profiles + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    # Rounded x values so profiles contain ties and exact grid hits
+    x = np.round(rng.uniform(-50.0, 600.0, offsets[-1]))
+    z = np.round(rng.normal(0.0, 4.0, offsets[-1]), 1)
+    return x, z, offsets
+
+
+def test_segment_kernels_match_numpy():
+    x, z, offsets = _random_profiles()
+    order = segment_argsort(x, offsets)
+    xs, zs = x[order], z[order]
+    starts = [xs[a:b].min() for a, b in zip(offsets[:-1], offsets[1:])]
+    stops = [xs[a:b].max() + 2.5 for a, b in zip(offsets[:-1], offsets[1:])]
+
+    grid, grid_offsets = segment_arange(np.array(starts), np.array(stops), 2.5)
+    zg = segment_interp(grid, grid_offsets, xs, zs, offsets)
+    areas = segment_trapz(zg, grid, grid_offsets)
+
+    for i, (a, b) in enumerate(zip(offsets[:-1], offsets[1:])):
+        assert np.array_equal(order[a:b] - a, np.argsort(x[a:b]))
+        expected_grid = np.arange(starts[i], stops[i], 2.5)
+        expected_z = np.interp(expected_grid, xs[a:b], zs[a:b])
+        g0, g1 = grid_offsets[i], grid_offsets[i + 1]
+        assert grid[g0:g1].tobytes() == expected_grid.tobytes()
+        assert zg[g0:g1].tobytes() == expected_z.tobytes()
+        assert areas[i] == np.trapezoid(expected_z, expected_grid)
+
+
+def test_volume_above_contour_batch_matches_scalar():
+    x, z, offsets = _random_profiles(seed=1)
+    batch = compute_volume_above_contour_batch(x, z, offsets, 1.5, dx=5.0)
+
+    for i, (a, b) in enumerate(zip(offsets[:-1], offsets[1:])):
+        profile = Profile(
+            name=f"P{i}", date=None, description=None, x=x[a:b], z=z[a:b]
+        )
+        expected = compute_volume_above_contour(profile, 1.5, dx=5.0)
+        for key in ("x_on", "x_off", "volume_cuyd_per_ft"):
+            assert batch[key][i] == expected[key]
+        if expected["contour_x"] is None:
+            assert np.isnan(batch["contour_x"][i])
+        else:
+            assert batch["contour_x"][i] == expected["contour_x"]
+
+
+def test_contour_sweep_matches_single_contour_runs():
+    x, z, offsets = _random_profiles(seed=2)
+    contours = [6.0, 1.9, 0.0, -3.5]
+    sweep = compute_volumes_above_contours(x, z, offsets, contours, dx=2.0)
+
+    assert sweep["volume_cuyd_per_ft"].shape == (len(offsets) - 1, 4)
+    for i, (a, b) in enumerate(zip(offsets[:-1], offsets[1:])):
+        profile = Profile(
+            name=f"P{i}", date=None, description=None, x=x[a:b], z=z[a:b]
+        )
+        for j, contour in enumerate(contours):
+            expected = compute_volume_above_contour(profile, contour, dx=2.0)
+            volume = sweep["volume_cuyd_per_ft"][i, j]
+            assert volume == expected["volume_cuyd_per_ft"]
+            assert sweep["contour_x"][i, j] == (
+                expected["contour_x"]
+                if expected["contour_x"] is not None
+                else pytest.approx(np.nan, nan_ok=True)
+            )
+
+
+
+def test_contour_x_counts_last_point_on_contour():
+    # A flat run on the contour reaches it up to the last point
+    x = np.array([0.0, 10.0, 20.0, 30.0])
+    z = np.array([3.0, 1.0, 1.0, 1.0])
+    profile = Profile(name="P", date=None, description=None, x=x, z=z)
+    batch = compute_volume_above_contour_batch(x, z, [0, 4], 1.0)
+
+    assert compute_volume_above_contour(profile, 1.0)["contour_x"] == 30.0
+    assert batch["contour_x"][0] == 30.0
+
+def test_exact_volumes_keep_vertical_steps_at_profile_ends():
+    # Repeated x at either end is a vertical step, not a sloped segment
+    x = np.array([0.0, 100.0, 100.0, 0.0, 0.0, 100.0])
+    z = np.array([0.0, 0.0, 9.0, 9.0, 0.0, 0.0])
+    offsets = np.array([0, 3, 6])
+    sweep = compute_volumes_above_contours(
+        x, z, offsets, [-1.0], method="exact"
+    )
+
+    for i, (a, b) in enumerate(zip(offsets[:-1], offsets[1:])):
+        profile = Profile(
+            name=f"P{i}", date=None, description=None, x=x[a:b], z=z[a:b]
+        )
+        single = compute_volume_above_contour(profile, -1.0, method="exact")
+        assert single["volume_cuyd_per_ft"] == pytest.approx(100.0 / 27.0)
+        assert sweep["volume_cuyd_per_ft"][i, 0] == pytest.approx(
+            single["volume_cuyd_per_ft"]
+        )
+
+
+def test_per_profile_values_broadcasts_scalars_only():
+    np.testing.assert_array_equal(per_profile_values(2, 3, "xon"), [2, 2, 2])
+    np.testing.assert_array_equal(
+        per_profile_values([1, 2, 3], 3, "xon"), [1.0, 2.0, 3.0]
+    )
+    with pytest.raises(ValueError, match="xoff"):
+        per_profile_values([1, 2], 3, "xoff")
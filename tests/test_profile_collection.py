@@ -0,0 +1,65 @@
+import numpy as np
+
+from profcalc.common.bmap_io import Profile, read_bmap_freeformat
+from profcalc.common.profile_collection import ProfileCollection
+
+BMAP_TEXT = """OC100 2021_09_28 Annual
+3
+0.0 5.0
+10.0 3.0
+20.0 -1.0
+OC101 2021_09_28 Annual
+2
+0.0 6.0
+15.0 2.0
+OC100 2022_09_30 Annual
+2
+0.0 4.0
+30.0 -2.0
+"""
+
+
+def test_round_trip_and_views(tmp_path):
+    path = tmp_path / "survey.txt"
+    path.write_text(BMAP_TEXT)
+    expected = read_bmap_freeformat(str(path))
+
+    collection = ProfileCollection.from_bmap(path)
+    assert len(collection) == 3
+    assert collection.n_points == 7
+    assert collection.counts.tolist() == [3, 2, 2]
+    assert collection.purposes == ["Annual"] * 3
+    assert collection.purpose_categories == ["Annual"]
+
+    for got, exp in zip(collection.to_profiles(), expected):
+        assert (got.name, got.date, got.description) == (
+            exp.name,
+            exp.date,
+            exp.description,
+        )
+        assert np.array_equal(got.x, exp.x)
+        assert np.array_equal(got.z, exp.z)
+
+    # Per-profile arrays are views into the shared columns
+    x, _ = collection.profile_arrays(1)
+    assert np.shares_memory(x, collection.x)
+
+    rebuilt = ProfileCollection.from_profiles(expected)
+    assert rebuilt.to_points_dict() == collection.to_points_dict()
+
+
+def test_group_by_name_and_reduce():
+    profiles = [
+        Profile("A", "d1", None, np.array([0.0, 1.0]), np.array([1.0, 3.0])),
+        Profile("B", "d1", None, np.array([0.0]), np.array([5.0])),
+        Profile("A", "d2", None, np.array([0.0, 2.0]), np.array([2.0, 0.0])),
+    ]
+    collection = ProfileCollection.from_profiles(profiles)
+
+    groups = {name: idx.tolist() for name, idx in collection.group_by_name()}
+    assert groups == {"A": [0, 2], "B": [1]}
+    assert collection.reduce(np.maximum, collection.z).tolist() == [3.0, 5.0, 2.0]
+
+    subset = collection.take([2, 0])
+    assert subset.dates == ["d2", "d1"]
+    assert subset.z.tolist() == [2.0, 0.0, 1.0, 3.0]
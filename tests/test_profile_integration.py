@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from profcalc.common.profile_integration import (
+    area_above,
+    band_area,
+    check_integration_method,
+    cumulative_integral,
+    difference_areas,
+    moment_above,
+)
+
+# Triangle dune: 0 ft at x=0, 4 ft at x=10, 0 ft at x=20
+X = np.array([20.0, 0.0, 10.0])
+Z = np.array([0.0, 0.0, 4.0])
+
+
+def test_area_and_moment_above_contour():
+    assert area_above(X, Z, 0.0) == pytest.approx(40.0)
+    # Above 2 ft the dune is a triangle 10 ft wide and 2 ft high
+    assert area_above(X, Z, 2.0) == pytest.approx(10.0)
+    assert band_area(X, Z, 0.0, 2.0) == pytest.approx(30.0)
+    assert moment_above(X, Z, 2.0) / area_above(X, Z, 2.0) == pytest.approx(
+        10.0
+    )
+    # Windows are interpolated, and flat-extended beyond the profile
+    assert area_above(X, Z, 2.0, 0.0, 10.0) == pytest.approx(5.0)
+    assert area_above(X, Z, -1.0, -5.0, 25.0) == pytest.approx(70.0)
+
+
+def test_difference_areas_split_at_intersections():
+    # Profiles crossing at x=5: first is 2 ft higher landward, 2 ft lower
+    # seaward
+    net, gain, loss = difference_areas(
+        [0.0, 10.0], [2.0, -2.0], [0.0, 10.0], [0.0, 0.0], 0.0, 10.0
+    )
+    assert gain == pytest.approx(5.0)
+    assert loss == pytest.approx(5.0)
+    assert net == pytest.approx(0.0)
+
+
+def test_exact_integrals_match_fine_grid():
+    rng = np.random.default_rng(7)
+    x = np.sort(rng.uniform(0.0, 100.0, 25))
+    z = rng.normal(0.0, 3.0, 25)
+    xf = np.linspace(x[0], x[-1], 400_001)
+    zf = np.interp(xf, x, z)
+
+    expected = np.trapezoid(np.maximum(zf - 0.5, 0.0), xf)
+    assert area_above(x, z, 0.5) == pytest.approx(expected, rel=1e-6)
+
+    running = cumulative_integral(x, z, xf[::1000])
+    steps = np.concatenate(
+        [[0.0], np.cumsum(np.diff(xf) * (zf[1:] + zf[:-1]) / 2)]
+    )
+    np.testing.assert_allclose(running, steps[::1000], atol=1e-6)
+
+
+def test_unknown_method_rejected():
+    assert check_integration_method("exact") == "exact"
+    with pytest.raises(ValueError):
+        check_integration_method("simpson")
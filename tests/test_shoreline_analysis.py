@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profcalc.common.bmap_io import Profile
+from profcalc.tools.monitoring.shoreline_analysis import (
+    build_shoreline_tables,
+    execute_from_cli,
+)
+
+
+def _survey(name, date, shoreline):
+    # Planar beach crossing z=2 at x = shoreline, stored seaward first
+    x = np.linspace(300.0, 0.0, 13)
+    return Profile(
+        name=name,
+        date=date,
+        description=None,
+        x=x,
+        z=2.0 + (shoreline - x) / 25.0,
+    )
+
+
+def test_shoreline_tables():
+    profiles = [
+        _survey("L1", "2022-09-01", 120.0),
+        _survey("L1", "2021-09-01", 80.0),
+        _survey("L2", "2021-09-01", 150.0),
+    ]
+    baselines = pd.DataFrame(
+        {
+            "profile_id": ["L1", "L2"],
+            "origin_x": [1000.0, 2000.0],
+            "origin_y": [5000.0, 5000.0],
+            "azimuth": [0.0, 90.0],
+        }
+    )
+    tables = build_shoreline_tables(
+        profiles,
+        mhw=2.0,
+        baselines=baselines,
+        design={"L1": 100.0, "L2": 100.0},
+    )
+
+    positions = tables["positions"]
+    assert list(positions["date"]) == [
+        "2021-09-01",
+        "2022-09-01",
+        "2021-09-01",
+    ]
+    np.testing.assert_allclose(positions["shoreline_x"], [80.0, 120.0, 150.0])
+    # Azimuth 0 puts the cross-shore axis along +Y; 90 along -X
+    np.testing.assert_allclose(positions["easting"], [1000.0, 1000.0, 1850.0])
+    np.testing.assert_allclose(positions["northing"], [5080.0, 5120.0, 5000.0])
+
+    assert tables["H-1"].loc["L1", "2022-09-01"] == pytest.approx(120.0)
+    assert np.isnan(tables["H-1"].loc["L2", "2022-09-01"])
+    assert tables["H-2"].loc["L1", "2021-09-01"] == pytest.approx(-20.0)
+
+    summary = tables["H-3"].loc["L1"]
+    assert (summary["min_distance"], summary["max_distance"]) == (
+        pytest.approx(-20.0),
+        pytest.approx(20.0),
+    )
+    assert summary["percent_seaward"] == 50.0
+
+
+def test_per_line_mhw_and_missing_crossing():
+    profiles = [
+        _survey("L1", "2021-09-01", 80.0),
+        _survey("L2", "2021-09-01", 0.0),
+    ]
+    tables = build_shoreline_tables(profiles, mhw=pd.Series({"L1": 3.0}))
+    positions = tables["positions"]
+    assert positions["shoreline_x"].iloc[0] == pytest.approx(55.0)
+    # No MHW for L2, no baselines and no design template
+    assert positions.iloc[1][["shoreline_x", "easting"]].isna().all()
+    assert tables["H-3"]["surveys"].tolist() == [0, 0]
+
+
+def test_cli_mhw_column_needs_network(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exc:
+        execute_from_cli(["survey.txt", "--output-dir", str(tmp_path)])
+    assert exc.value.code == 2
+    assert "pass --network" in capsys.readouterr().err
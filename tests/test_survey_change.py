@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from profcalc.common.bmap_io import Profile
+from profcalc.tools.monitoring.survey_change import (
+    compute_change_matrix,
+    group_surveys_by_line,
+    pivot_change_matrix,
+)
+
+
+def _survey(name, date, z_offset, x_end=100.0):
+    # Planar beach crossing z=0 at x = 50 + 25 * z_offset
+    x = np.linspace(0.0, x_end, 11)
+    return Profile(
+        name=name,
+        date=date,
+        description=None,
+        x=x,
+        z=2.0 - x / 25.0 + z_offset,
+    )
+
+
+def test_groups_by_line_in_date_order():
+    profiles = [
+        _survey("L1", "16SEP2022", 0.0),
+        _survey("L1", "21SEP2021", 0.0),
+        _survey("L2", "00SEP2022", 0.0),
+        _survey("L2", None, 0.0),
+    ]
+    lines = group_surveys_by_line(profiles)
+    assert [p.date for p in lines["L1"]] == ["21SEP2021", "16SEP2022"]
+    assert [p.date for p in lines["L2"]] == ["00SEP2022"]
+
+
+def test_consecutive_and_baseline_changes():
+    profiles = [
+        _survey("L1", "2023-09-01", 1.5),
+        _survey("L1", "2021-09-01", 0.0),
+        _survey("L1", "2022-09-01", 1.0, x_end=80.0),
+    ]
+    changes = compute_change_matrix(profiles, dx=5.0)
+    assert list(changes["comparison"]) == [
+        "consecutive",
+        "consecutive",
+        "baseline",
+        "baseline",
+    ]
+
+    first = changes.iloc[0]
+    assert (first["from_date"], first["to_date"]) == (
+        "2021-09-01",
+        "2022-09-01",
+    )
+    # A 1 ft raise over the common 80 ft
+    assert first["x_off"] == 80.0
+    assert first["volume_change_cuyd_per_ft"] == pytest.approx(80.0 / 27)
+    assert first["shoreline_change_ft"] == pytest.approx(25.0)
+    assert first["volume_change_cuyd_per_ft"] == pytest.approx(
+        first["above_datum_cuyd_per_ft"] + first["below_datum_cuyd_per_ft"]
+    )
+
+    # Baseline 2021 -> 2023: a 1.5 ft raise over the full 100 ft
+    last = changes.iloc[-1]
+    assert last["volume_change_cuyd_per_ft"] == pytest.approx(150.0 / 27)
+
+    matrix = pivot_change_matrix(changes, comparison="baseline")
+    assert matrix.loc["L1", ("2021-09-01", "2023-09-01")] == pytest.approx(
+        150.0 / 27
+    )
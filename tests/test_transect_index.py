@@ -0,0 +1,44 @@
+import numpy as np
+
+from profcalc.common.transect_index import TransectIndex
+
+
+def test_nearest_matches_exhaustive_search():
+    rng = np.random.default_rng(7)
+    n = 40
+    index = TransectIndex(
+        [f"T{i}" for i in range(n)],
+        np.arange(n) * 30.0,
+        rng.normal(0.0, 5.0, n),
+        rng.uniform(80.0, 100.0, n),
+        length=600.0,
+        spacing=25.0,
+    )
+    x = rng.uniform(-100.0, 1300.0, 5000)
+    y = rng.uniform(-300.0, 300.0, 5000)
+
+    nearest, offsets = index.nearest(x, y, 12.0)
+
+    expected, distance = index._closest_exhaustive(x, y)
+    expected[distance > 12.0] = -1
+    np.testing.assert_array_equal(nearest, expected)
+    assert (nearest >= 0).any() and (nearest < 0).any()
+
+    # Offsets are signed perpendicular distances from the assigned line
+    hit = nearest >= 0
+    rad = np.radians(index.azimuth[nearest[hit]])
+    dx = x[hit] - index.origin_x[nearest[hit]]
+    dy = y[hit] - index.origin_y[nearest[hit]]
+    np.testing.assert_allclose(
+        offsets[hit], dx * np.cos(rad) - dy * np.sin(rad)
+    )
+    assert np.isnan(offsets[~hit]).all()
+
+
+def test_nearest_prefers_first_transect_on_ties():
+    index = TransectIndex(["A", "B"], [-10.0, 10.0], [0.0, 0.0], [0.0, 0.0])
+
+    nearest, offsets = index.nearest([0.0, 9.0], [50.0, 50.0], 10.0)
+
+    assert nearest.tolist() == [0, 1]
+    np.testing.assert_array_equal(offsets, [10.0, -1.0])
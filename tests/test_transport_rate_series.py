@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profcalc.common.bmap_io import Profile
+from profcalc.tools.bmap.bmap_sed_transport import (
+    compute_transport_rate,
+    compute_transport_rate_series,
+)
+
+
+def _storm_sequence():
+    x = np.linspace(0.0, 300.0, 31)
+    beach = 3.0 - x / 30.0
+    surveys = [
+        ("2021-09-01", x, beach),
+        ("2021-09-04", x, beach + np.sin(x / 40.0)),
+        ("2021-09-03", x[:25], beach[:25]),
+    ]
+    profiles = [
+        Profile(name="L1", date=d, description=None, x=xs, z=zs)
+        for d, xs, zs in surveys
+    ]
+    # A second line starting 50 ft further landward
+    profiles.append(
+        Profile(
+            name="L2", date="01SEP2021", description=None, x=x - 50, z=beach
+        )
+    )
+    profiles.append(
+        Profile(name="L2", date="02SEP2021", description=None, x=x, z=beach)
+    )
+    return profiles
+
+
+@pytest.mark.parametrize("method", ["grid", "exact"])
+def test_series_matches_single_pair_tool(method):
+    profiles = _storm_sequence()
+    series = compute_transport_rate_series(profiles, dx=10.0, method=method)
+    assert series["lines"] == ["L1", "L2"]
+    assert series["rate"].shape == (2, 2, len(series["x"]))
+    assert series["x"][0] == -50.0
+
+    # L1 pairs in date order: 1 Sep -> 3 Sep (48 hr), 3 Sep -> 4 Sep
+    summary = series["summary"]
+    assert list(summary["dtime_hr"]) == [48.0, 24.0, 24.0]
+    earlier, later = profiles[0], profiles[2]
+    expected, _ = compute_transport_rate(
+        pd.DataFrame({"X": earlier.x, "Z": earlier.z}),
+        pd.DataFrame({"X": later.x, "Z": later.z}),
+        dx=10.0,
+        dtime_hr=48.0,
+        method=method,
+    )
+    on_pair = np.isin(series["x"], expected["X"])
+    np.testing.assert_allclose(
+        series["rate"][0, 0, on_pair],
+        expected["TransportRate_cuyd_per_ft_per_hr"],
+        atol=1e-12,
+    )
+    assert np.isnan(series["rate"][0, 0, ~on_pair]).all()
+
+    row = summary.iloc[1]
+    assert (row["x_on"], row["x_off"], row["x_seaward"]) == (0.0, 240.0, 240.0)
+    rates = series["rate"][0, 1]
+    assert row["max_rate"] == np.nanmax(rates)
+    assert row["x_max"] == series["x"][np.nanargmax(rates)]
+
+    # L2 has a single pair; the cube is padded for the missing one
+    assert np.isnan(series["rate"][1, 1]).all()
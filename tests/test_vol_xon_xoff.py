@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from profcalc.common.bmap_io import Profile
+from profcalc.common.io_reports import write_volume_report
+from profcalc.tools.bmap.bmap_vol_xon_xoff import (
+    compute_volume_xon_xoff,
+    compute_volume_xon_xoff_batch,
+    load_line_limits,
+)
+
+X = [0.0, 20.0, 10.0, 30.0, 40.0]
+Z = [5.0, 1.0, 3.0, -1.0, -3.0]
+
+
+def test_batch_uses_per_profile_limits():
+    x = np.concatenate([X, X[:3]])
+    z = np.concatenate([Z, Z[:3]])
+    offsets = [0, 5, 8]
+    xon = [-10.0, 5.0]
+    xoff = [35.0, 50.0]
+
+    # Hand-computed trapezoids of max(z - 0, 0) between the window nodes
+    # (BMAP clips node heights; segments are not split at the contour).
+    # Profile 1 nodes: 0..40 ft, z 5 to -3; profile 2 nodes: 0..20 ft.
+    # Extend: profile 1 gains a flat 5 ft strip from -10 to 0 ft (50) and
+    # ends at interpolated z=-2 at 35 ft; profile 2 starts at z=4 at 5 ft
+    # and its flat extension beyond 20 ft is excluded.
+    # Clip: profile 1 starts at 0 ft; profile 2 ends at 20 ft.
+    expected = {
+        "extend": [(-10.0, 35.0, 50 + 40 + 20 + 5), (5.0, 50.0, 17.5 + 20)],
+        "clip": [(0.0, 35.0, 40 + 20 + 5), (5.0, 20.0, 17.5 + 20)],
+    }
+    for policy, rows in expected.items():
+        batch = compute_volume_xon_xoff_batch(
+            x, z, offsets, xon, xoff, 0.0, policy
+        )
+        assert batch["valid"].all()
+        np.testing.assert_allclose(batch["x_on"], [r[0] for r in rows])
+        np.testing.assert_allclose(batch["x_off"], [r[1] for r in rows])
+        np.testing.assert_allclose(
+            batch["volume_cuyd_per_ft"], [r[2] / 27.0 for r in rows]
+        )
+
+    # Skip drops the profiles whose limits fall outside their data
+    skipped = compute_volume_xon_xoff_batch(
+        x, z, offsets, xon, xoff, 0.0, "skip"
+    )
+    assert skipped["valid"].tolist() == [False, False]
+
+
+def test_extend_excludes_segment_beyond_last_point():
+    profile = Profile("P", None, None, np.array(X), np.array(Z))
+    # Above -4 ft: trapezoids up to x=40; the flat extension to 60 is
+    # excluded (BMAP behavior)
+    res = compute_volume_xon_xoff(profile, 0.0, 60.0, -4.0)
+    area = sum(
+        0.5 * (a + b + 8.0) * 10.0
+        for a, b in zip([5.0, 3.0, 1.0, -1.0], [3.0, 1.0, -1.0, -3.0])
+    )
+    assert res["volume_cuyd_per_ft"] == area / 27.0
+
+
+def test_load_line_limits(tmp_path):
+    path = tmp_path / "network.csv"
+    path.write_text(
+        "﻿profile_name,Origin_X,ClosureDep,\n"
+        'MA002,"622,294.690",-15.00,\n'
+        'MA003,"622,195.360",,\n',
+        encoding="utf-8",
+    )
+    limits = load_line_limits(
+        path, ["MA003", "MA002", "XX"], {"zref": "ClosureDep"}
+    )
+    assert np.isnan(limits["zref"][0])
+    assert limits["zref"][1] == -15.0
+    assert np.isnan(limits["zref"][2])
+
+
+
+def test_load_line_limits_rejects_missing_column(tmp_path):
+    path = tmp_path / "network.csv"
+    path.write_text("profile_name,MHW_Elev\nMA002,1.9\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="ClosureDep"):
+        load_line_limits(path, ["MA002"], {"zref": "ClosureDep"})
+
+def test_report_names_per_profile_zref(tmp_path):
+    out = tmp_path / "report.txt"
+    row = {
+        "name": "P1",
+        "x_on": 0.0,
+        "x_off": 35.0,
+        "volume_cuyd_per_ft": 2.5,
+        "contour_location": 25.0,
+        "zref": -1.5,
+    }
+    write_volume_report(str(out), [row], None, "T")
+    text = out.read_text()
+    assert "nan" not in text
+    assert "Contour Level:\tper profile (see Zref column)" in text
+    assert text.splitlines()[-1].endswith("\t-1.50")
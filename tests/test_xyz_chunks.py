@@ -0,0 +1,68 @@
+import numpy as np
+
+from profcalc.cli.quick_tools.convert import _read_xyz_format
+from profcalc.common import csv_io
+
+ORIGINS = """profile_id,azimuth,origin_x,origin_y
+P1,90.0,0.0,0.0
+P2,90.0,0.0,20.0
+"""
+
+
+def _profile_arrays(profiles):
+    return [
+        (p.name, p.x.tolist(), p.z.tolist(), p.metadata["y_coordinates"])
+        for p in profiles
+    ]
+
+
+def test_xyz_assignment_independent_of_chunk_size(tmp_path):
+    origins = tmp_path / "origins.csv"
+    origins.write_text(ORIGINS)
+    points = tmp_path / "points.xyz"
+    # Alternate points beside P1 and P2; the last one is beyond tolerance
+    rows = [f"{30.0 - i} {18.0 * (i % 2) + 1.0} {i * 0.5}" for i in range(9)]
+    rows.append("5.0 10.0 0.0")
+    points.write_text("\n".join(rows) + "\n")
+
+    whole = csv_io._read_xyz_profiles_uncached(points, origins, 25.0)
+    chunked = csv_io._read_xyz_profiles_uncached(
+        points, origins, 25.0, chunksize=2
+    )
+
+    assert [len(p.x) for p in whole] == [5, 4]
+    for a, b in zip(_profile_arrays(whole), _profile_arrays(chunked)):
+        assert a[:3] == b[:3]
+        np.testing.assert_array_equal(a[3], b[3])
+        assert a[1] == sorted(a[1])
+
+
+def test_segmented_xyz_blocks_match_line_parsing(tmp_path):
+    path = tmp_path / "survey.xyz"
+    path.write_text(
+        "> Profile: A\n"
+        "0.0 1.0 2.0 sand\n"
+        "1.0, 1.5, -0\n"
+        "bad line here\n"
+        "2.0 2.5 3.5 gravel\n"
+        "# B\n"
+        "5 6 7\n"
+        "8 9 10\n"
+    )
+
+    # Results do not depend on how lines fall into blocks
+    expected = _read_xyz_format(str(path), chunk_lines=1)
+    profiles = _read_xyz_format(str(path))
+
+    assert [p.name for p in profiles] == ["A", "B"]
+    for a, b in zip(expected, profiles):
+        assert a.x.tobytes() == b.x.tobytes()
+        assert a.z.tobytes() == b.z.tobytes()
+        assert a.metadata.get("extra_columns") == b.metadata.get(
+            "extra_columns"
+        )
+    assert profiles[0].metadata["extra_columns"]["data"] == [
+        ["sand"],
+        [],
+        ["gravel"],
+    ]